@@ -0,0 +1,52 @@
+"""
+Compares decoding API responses in two passes, first into an envelope with
+a raw result and then into the result type, against decoding them in one
+pass with a cached decoder. Run it with `python -m benchmarks.response_decoding`.
+"""
+
+from timeit import repeat
+
+from msgspec import Raw, json
+
+from wonda.types.helper import Model, get_response_decoder
+from wonda.types.objects import Message, Update
+
+MESSAGE = (
+    b'{"message_id":1,"date":1700000000,"text":"/start hello there",'
+    b'"from":{"id":1,"is_bot":false,"first_name":"Jane","language_code":"en"},'
+    b'"chat":{"id":1,"type":"private","first_name":"Jane"},'
+    b'"entities":[{"type":"bot_command","offset":0,"length":6}]}'
+)
+SEND_MESSAGE = b'{"ok":true,"result":' + MESSAGE + b"}"
+GET_UPDATES = (
+    b'{"ok":true,"result":['
+    + b",".join(b'{"update_id":%d,"message":%s}' % (i, MESSAGE) for i in range(100))
+    + b"]}"
+)
+
+
+class RawResponse(Model):
+    ok: bool
+    result: Raw = Raw()
+
+
+def decode_in_two_passes(response: bytes, type: type) -> object:
+    envelope = json.decode(response, type=RawResponse)
+    return json.decode(envelope.result, type=type)
+
+
+def decode_in_one_pass(response: bytes, type: type) -> object:
+    return get_response_decoder(type).decode(response).result
+
+
+def run(name: str, response: bytes, type: type, number: int) -> None:
+    for func in (decode_in_two_passes, decode_in_one_pass):
+        best = min(
+            repeat(lambda func=func: func(response, type), number=number, repeat=5)
+        )
+        print(f"{name:<14}{func.__name__:<24}{best / number * 1e6:>10.2f} us")
+
+
+if __name__ == "__main__":
+    run("sendMessage", SEND_MESSAGE, Message, 100_000)
+    run("getUpdates", GET_UPDATES, list[Update], 1_000)
@@ -0,0 +1,39 @@
+"""
+Compares decoding updates into `Update` and copying them into the models
+handlers receive, against decoding them straight into `TypedUpdate`.
+Run it with `python -m benchmarks.update_models`.
+"""
+
+from timeit import repeat
+
+from msgspec import json
+
+from wonda.bot.dispatch.view.utils import get_update_model
+from wonda.bot.updates import MessageUpdate, TypedUpdate
+from wonda.types.objects import Update
+
+UPDATE = (
+    b'{"update_id":1,"message":{"message_id":1,"date":1700000000,'
+    b'"text":"/start hello there",'
+    b'"from":{"id":1,"is_bot":false,"first_name":"Jane","language_code":"en"},'
+    b'"chat":{"id":1,"type":"private","first_name":"Jane"},'
+    b'"entities":[{"type":"bot_command","offset":0,"length":6}]}}'
+)
+
+
+def decode_and_copy() -> object:
+    update = json.decode(UPDATE, type=Update)
+    return get_update_model(update, MessageUpdate, "message")
+
+
+def decode_typed() -> object:
+    update = json.decode(UPDATE, type=TypedUpdate)
+    return get_update_model(update, MessageUpdate, "message")
+
+
+if __name__ == "__main__":
+    number = 100_000
+
+    for func in (decode_and_copy, decode_typed):
+        best = min(repeat(func, number=number, repeat=5))
+        print(f"{func.__name__:<18}{best / number * 1e6:>10.2f} us")
@@ -0,0 +1,27 @@
+from wonda import API, Bot, Message, Token
+from wonda.api import DefaultRateLimiter, Priority
+from wonda.api.limiter import priority
+from wonda.bot.rules import Command
+
+# Pass a rate limiter to the API to keep the bot within the limits of
+# the Bot API. Messages are held back instead of failing with 429 errors.
+api = API(Token.from_env(), rate_limiter=DefaultRateLimiter())
+bot = Bot(api=api)
+
+SUBSCRIBERS = [1, 2, 3]
+
+
+@bot.on.message(Command("broadcast"))
+async def broadcast_handler(m: Message) -> None:
+    await m.answer("Sending the news to everyone!")
+
+    # Requests made in the bulk lane give way to replies to
+    # other users, so the bot stays responsive while broadcasting.
+    with priority(Priority.BULK):
+        for chat_id in SUBSCRIBERS:
+            await m.ctx_api.send_message(chat_id=chat_id, text="Here's the news")
+
+
+# Run the bot. This function uses `.run_polling()` under the hood to start
+# receiving updates. It will also run any tasks you may've added in `loop_wrapper`.
+bot.run_forever()
@@ -0,0 +1,34 @@
+from wonda import API, Bot, DefaultNetworkClient, Message, Token
+from wonda.bot.rules import Command
+from wonda.net import ConnectionOptions
+
+# Broadcasting bots make lots of requests at once. Allow the network client
+# to keep more sockets to the Bot API open and to reuse them for longer.
+network_client = DefaultNetworkClient(
+    connection_options=ConnectionOptions(
+        limit=400, limit_per_host=400, keepalive_timeout=60, ttl_dns_cache=600
+    )
+)
+
+# Make a bot with a token from an environment variable
+# and the network client we configured.
+api = API(Token.from_env(), network_client=network_client)
+bot = Bot(api=api)
+
+
+@bot.on.message(Command("ping"))
+async def ping_handler(m: Message) -> None:
+    await m.answer("Pong!")
+
+
+async def warm_up_connections() -> None:
+    # Open several connections at startup so that the first
+    # requests don't have to wait for TLS handshakes.
+    await network_client.warm_up(api.REQUEST_URL, connections=16)
+
+
+bot.loop_wrapper.on_startup.append(warm_up_connections())
+
+# Run the bot. This function uses `.run_polling()` under the hood to start
+# receiving updates. It will also run any tasks you may've added in `loop_wrapper`.
+bot.run_forever()
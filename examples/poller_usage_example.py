@@ -6,13 +6,19 @@ api = API(Token.from_env())
 
 
 async def main():
-    # Pass an API object to grab updates from.
+    # Pass an API object to grab updates from. Swap it for `PrefetchingPoller`
+    # to keep the next request in flight while the current batch is handled.
     poller = DefaultPoller(api)
 
     # You can specify exactly which types of updates
     # you wish to receive via this poller.
     poller.options.allowed_updates = ["message", "callback_query", "inline_query"]
 
+    # The poller uses long polling: each request is held open by the server
+    # for up to `timeout` seconds until new updates arrive, and up to `limit`
+    # updates are returned at once. Idle bots make very few requests this way.
+    poller.options.timeout, poller.options.limit = 50, 100
+
     # Iterate through new updates as they come.
     async for update in poller.poll():
         await logger.ainfo("Handling", update=update)
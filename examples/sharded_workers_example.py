@@ -0,0 +1,25 @@
+from hashlib import sha256
+
+from wonda import Bot, Message, ShardedScheduler, Token
+from wonda.bot.rules import Command
+
+# Make a bot which handles updates in 4 worker processes. The main process
+# receives updates and sends each of them to a worker picked by the user
+# who sent it, so messages and state of one user stay in one worker.
+bot = Bot(Token.from_env(), scheduler=ShardedScheduler(workers=4))
+
+
+@bot.on.message(Command("hash"))
+async def hash_handler(m: Message) -> None:
+    # CPU-heavy work blocks only the worker it runs in,
+    # while the others keep handling their chats.
+    digest = (m.text or "").encode()
+    for _ in range(1_000_000):
+        digest = sha256(digest).digest()
+
+    await m.answer(digest.hex())
+
+
+# Run the bot. Workers are started before the bot starts polling,
+# so handlers must be set up before this line.
+bot.run_forever()
@@ -1,8 +1,10 @@
-from wonda import BaseStateGroup, Bot, Message, Token, rules
+from wonda import BaseStateGroup, Bot, KeyedScheduler, Message, Token, rules
 from wonda.tools.keyboard import Button, ReplyKeyboardBuilder
 
-# Make a bot with a token from an environment variable.
-bot = Bot(Token.from_env())
+# Make a bot with a token from an environment variable. The keyed scheduler
+# handles updates from one chat one after another, so two quick messages
+# from the same user can't race each other while reading and setting state.
+bot = Bot(Token.from_env(), scheduler=KeyedScheduler())
 
 
 # Create a new state group describing the flow of the conversation.
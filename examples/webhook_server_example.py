@@ -0,0 +1,38 @@
+from wonda import Bot, Message, Token, WebhookOptions
+from wonda.bot.rules import Command
+
+# Make a bot with a token from an environment variable.
+bot = Bot(Token.from_env())
+
+
+@bot.on.message(Command("start"))
+async def start_handler(m: Message) -> None:
+    # Send a message so that we know everything works correctly.
+    await m.answer("This message was handled by the built-in webhook server!")
+
+
+options = WebhookOptions(
+    # Specify a URL to send updates to. It must be secured by TLS,
+    # so put the server behind a reverse proxy which terminates it.
+    url="https://example.com/bot",
+    # Provide the secret token to ensure that requests are coming
+    # from Telegram and not a harmful third-party.
+    secret_token="secret_token_here",
+    # The address and the path the server listens on.
+    host="127.0.0.1",
+    port=8080,
+    path="/bot",
+    # Let the Bot API open more connections at once
+    # to deliver updates with less delay.
+    max_connections=100,
+    # Wait for up to 50 milliseconds for an update to be handled. If it's
+    # handled in time, the first call of the handler, like `m.answer()` above,
+    # is put into the webhook response, saving a separate request.
+    # Such calls return `None`, since their result is never received.
+    inline_deadline=0.05,
+)
+
+# Run the bot. The webhook is set up on startup and removed on shutdown.
+# Updates are handed over to the scheduler of the bot, so the number
+# of updates handled at the same time stays limited.
+bot.run_forever(webhook=options)
@@ -1,6 +1,7 @@
-from .api import ABCAPI, API, ABCPoller, DefaultPoller, File, Token
+from .api import ABCAPI, API, ABCPoller, DefaultPoller, File, PrefetchingPoller, Token
 from .bot import *
 from .errors import ABCErrorHandler, APIException, DefaultErrorHandler
+from .api.webhook import ABCWebhook, DefaultWebhook, WebhookOptions
 from .net import ABCNetworkClient, DefaultNetworkClient
-from .tools import DelayedTask, LoopWrapper, ActionSender
+from .tools import DelayedTask, LoopWrapper, ActionSender, FileDownloader
 from .types import enums, objects
@@ -1,6 +1,8 @@
 from .abc import ABCAPI
 from .api import DefaultAPI
-from .poller import ABCPoller, DefaultPoller
+from .limiter import ABCRateLimiter, DefaultRateLimiter, Priority
+from .poller import ABCPoller, DefaultPoller, PrefetchingPoller
+from .retry import ABCRetryPolicy, DefaultRetryPolicy
 from .utils import File, Token
 
 Poller = DefaultPoller
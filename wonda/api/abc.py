@@ -1,8 +1,11 @@
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
+
+from msgspec import Raw
 
 if TYPE_CHECKING:
     from wonda.api import Token
+    from wonda.api.limiter import ABCRateLimiter
     from wonda.net import ABCNetworkClient
 
 
@@ -11,6 +14,7 @@ class ABCAPI(ABC):
 
     network_client: "ABCNetworkClient"
     token: "Token"
+    rate_limiter: "ABCRateLimiter | None" = None
 
     @property
     def api_url(self) -> str:
@@ -27,7 +31,17 @@ class ABCAPI(ABC):
         return self.REQUEST_URL + f"file/bot{self.token}/"
 
     @abstractmethod
-    async def request(self, method: str, params: dict) -> bytes:
+    async def request(
+        self,
+        method: str,
+        params: dict,
+        *,
+        type: Any = Raw,
+        timeout: float | None = None,
+    ) -> Any:
         """
-        Makes a single request to the API.
+        Makes a single request to the API and decodes its result to the given
+        type. The raw result is returned if the type is not specified.
+        A timeout in seconds can be given to override the one set up
+        in the network client.
         """
@@ -1,35 +1,125 @@
+from asyncio import sleep
+from time import monotonic
+from typing import Any
+
+from msgspec import Raw
+
 from wonda.api.abc import ABCAPI
-from wonda.api.utils import Token
+from wonda.api.limiter import ABCRateLimiter
+from wonda.api.retry import ABCRetryPolicy, DefaultRetryPolicy
+from wonda.api.utils import Token, has_files, prepare_form
 from wonda.errors.external import APIException
 from wonda.modules import logger
 from wonda.net.abc import ABCNetworkClient
 from wonda.net.default import DefaultNetworkClient
-from wonda.types.helper import Response, from_json, translate
+from wonda.types.helper import from_json, get_response_decoder
 from wonda.types.methods import APIMethods
+from wonda.types.objects import ResponseParameters
+
+JSON_HEADERS = {"Content-Type": "application/json"}
 
 
 class DefaultAPI(ABCAPI, APIMethods):
     def __init__(
-        self, token: Token, *, network_client: ABCNetworkClient | None = None
+        self,
+        token: Token,
+        *,
+        network_client: ABCNetworkClient | None = None,
+        rate_limiter: ABCRateLimiter | None = None,
+        retry_policy: ABCRetryPolicy | None = None,
     ) -> None:
         super().__init__(self)
 
         self.token = token
         self.network_client = network_client or DefaultNetworkClient()
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy or DefaultRetryPolicy()
+
+    async def request(
+        self,
+        method: str,
+        params: dict,
+        *,
+        type: Any = Raw,
+        timeout: float | None = None,
+    ) -> Any:
+        attempt, started_at = 0, monotonic()
+
+        while True:
+            attempt += 1
+
+            if self.rate_limiter:
+                await self.rate_limiter.acquire(method, params)
+
+            try:
+                return await self.send(method, params, type=type, timeout=timeout)
+            except Exception as e:
+                delay = self.retry_policy.get_delay(
+                    method, e, attempt, monotonic() - started_at
+                )
+
+                if delay is None:
+                    raise
 
-    async def request(self, method: str, params: dict) -> bytes:
+                if isinstance(e, APIException) and e.parameters:
+                    if chat_id := e.parameters.migrate_to_chat_id:
+                        params = params | {"chat_id": chat_id}
+
+                    # The limiter holds this and similar requests back for
+                    # as long as the API asked, if it manages the method
+                    if (
+                        self.rate_limiter
+                        and e.retry_after is not None
+                        and self.rate_limiter.is_limited(method, params)
+                    ):
+                        self.rate_limiter.defer(e.retry_after, method, params)
+                        delay = 0.0
+
+                await logger.awarning(
+                    "Retrying", method=method, attempt=attempt, delay=delay, error=e
+                )
+                await sleep(delay)
+
+    async def send(
+        self,
+        method: str,
+        params: dict,
+        *,
+        type: Any = Raw,
+        timeout: float | None = None,
+    ) -> Any:
         await logger.adebug("Calling", method=method, params=params)
 
-        data = self.network_client.construct_form(
-            {k: translate(v) for k, v in params.items()}
-        )
+        kwargs: dict[str, Any] = {}
+
+        # Clients keep their own timeout unless the call needs another one,
+        # as long polling does
+        if timeout is not None:
+            kwargs["timeout"] = timeout
+
+        # Multipart forms are only needed to upload files,
+        # everything else is sent as a single JSON document
+        if has_files(params):
+            data = self.network_client.construct_form(prepare_form(params))
+        else:
+            data = self.network_client.construct_json(params)
+            # Clients may make bare bytes, which aren't sent as JSON otherwise
+            kwargs["headers"] = JSON_HEADERS
+
         response = await self.network_client.request_bytes(
-            self.api_url + method, data=data
+            self.api_url + method, "post", data=data, **kwargs
         )
-        result = from_json(response, type=Response)
+        result = get_response_decoder(type).decode(response)
 
         if not result.ok:
-            raise APIException[result.error_code](result.description, result.error_code)
+            parameters = (
+                from_json(result.parameters, type=ResponseParameters)
+                if result.parameters
+                else None
+            )
+            raise APIException[result.error_code](
+                result.description, result.error_code, parameters
+            )
 
         await logger.adebug("Received", result=result)
         return result.result
@@ -0,0 +1,3 @@
+from .abc import ABCRateLimiter
+from .default import DefaultRateLimiter
+from .utils import Priority, TokenBucket, priority
@@ -0,0 +1,27 @@
+from abc import ABC, abstractmethod
+
+
+class ABCRateLimiter(ABC):
+    """
+    An interface for holding requests back so that the bot
+    stays within the limits of the Bot API.
+    """
+
+    def is_limited(self, method: str, params: dict) -> bool:
+        """
+        Checks if requests like the given one are held back by the limiter.
+        """
+        return True
+
+    @abstractmethod
+    async def acquire(self, method: str, params: dict) -> None:
+        """
+        Waits until the request can be made without exceeding the limits.
+        """
+
+    @abstractmethod
+    def defer(self, retry_after: float, method: str, params: dict) -> None:
+        """
+        Holds requests similar to the given one back after the API asked
+        to retry in a number of seconds.
+        """
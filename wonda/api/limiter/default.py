@@ -0,0 +1,99 @@
+from asyncio import Future, Task, create_task, get_running_loop, sleep
+from heapq import heappop, heappush
+from itertools import count
+from time import monotonic
+
+from wonda.api.limiter.abc import ABCRateLimiter
+from wonda.api.limiter.utils import Priority, TokenBucket, current_priority
+
+
+class DefaultRateLimiter(ABCRateLimiter):
+    """
+    Keeps message sending within the limits of the Bot API using token buckets:
+    about 30 messages per second overall, one message per second in a private
+    chat and 20 messages per minute in a group. Requests waiting for the overall
+    limit are served in priority order, then in order of arrival.
+    """
+
+    LIMITED_METHODS = ("send", "copy", "forward")
+    UNLIMITED_METHODS = frozenset({"sendChatAction"})
+    MAX_IDLE_CHATS = 10_000
+
+    def __init__(
+        self,
+        global_rate: float = 30,
+        private_rate: float = 1,
+        group_rate: float = 20,
+        group_period: float = 60,
+    ) -> None:
+        self.private_rate = private_rate
+        self.group_rate, self.group_period = group_rate, group_period
+
+        self.bucket = TokenBucket(global_rate, now=monotonic())
+        self.chats: dict[int | str, TokenBucket] = {}
+
+        self.lanes: list[tuple[Priority, int, Future[None]]] = []
+        self.counter = count()
+        self.pump: Task | None = None
+
+    def is_limited(self, method: str, params: dict) -> bool:
+        return (
+            "chat_id" in params
+            and method.startswith(self.LIMITED_METHODS)
+            and method not in self.UNLIMITED_METHODS
+        )
+
+    async def acquire(self, method: str, params: dict) -> None:
+        if not self.is_limited(method, params):
+            return
+
+        if delay := self.get_chat_bucket(params["chat_id"]).reserve(monotonic()):
+            await sleep(delay)
+
+        future = get_running_loop().create_future()
+        heappush(self.lanes, (current_priority.get(), next(self.counter), future))
+
+        if self.pump is None or self.pump.done():
+            self.pump = create_task(self.run_pump())
+
+        await future
+
+    def defer(self, retry_after: float, method: str, params: dict) -> None:
+        bucket = (
+            self.get_chat_bucket(params["chat_id"])
+            if "chat_id" in params
+            else self.bucket
+        )
+        bucket.block(monotonic(), retry_after)
+
+    async def run_pump(self) -> None:
+        while self.lanes:
+            if wait := self.bucket.wait_time(monotonic()):
+                await sleep(wait)
+                continue
+
+            *_, future = heappop(self.lanes)
+
+            # Requests cancelled while waiting give their turn away
+            if not future.done():
+                self.bucket.consume()
+                future.set_result(None)
+
+    def get_chat_bucket(self, chat_id: int | str) -> TokenBucket:
+        if chat_id not in self.chats:
+            if len(self.chats) >= self.MAX_IDLE_CHATS:
+                self.prune()
+
+            # Negative identifiers and usernames belong to groups and channels
+            is_private = isinstance(chat_id, int) and chat_id > 0
+            self.chats[chat_id] = (
+                TokenBucket(self.private_rate, now=monotonic())
+                if is_private
+                else TokenBucket(self.group_rate, self.group_period, monotonic())
+            )
+
+        return self.chats[chat_id]
+
+    def prune(self) -> None:
+        now = monotonic()
+        self.chats = {k: v for k, v in self.chats.items() if not v.is_idle(now)}
@@ -0,0 +1,75 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import IntEnum
+from typing import Iterator
+
+
+class Priority(IntEnum):
+    """
+    Lanes requests are queued in. Requests from a lane with
+    a lower value overtake ones waiting in the other lanes.
+    """
+
+    INTERACTIVE = 0
+    BULK = 1
+
+
+current_priority: ContextVar[Priority] = ContextVar(
+    "current_priority", default=Priority.INTERACTIVE
+)
+
+
+@contextmanager
+def priority(lane: Priority) -> Iterator[None]:
+    """
+    Queues requests made in the wrapped code in the given lane.
+    Tasks created in it inherit the lane too.
+    """
+    token = current_priority.set(lane)
+
+    try:
+        yield
+    finally:
+        current_priority.reset(token)
+
+
+class TokenBucket:
+    """
+    Allows `rate` actions per `per` seconds with bursts of up to `rate` actions.
+    """
+
+    def __init__(self, rate: float, per: float = 1.0, now: float = 0.0) -> None:
+        self.capacity, self.interval = rate, per / rate
+        self.tokens, self.updated, self.blocked_until = rate, now, now
+
+    def refill(self, now: float) -> None:
+        elapsed = max(now - self.updated, 0.0)
+        self.tokens = min(self.capacity, self.tokens + elapsed / self.interval)
+        self.updated = now
+
+    def wait_time(self, now: float) -> float:
+        """
+        Seconds to wait before a token becomes available.
+        """
+        self.refill(now)
+        wait = 0.0 if self.tokens >= 1 else (1 - self.tokens) * self.interval
+        return max(wait, self.blocked_until - now)
+
+    def consume(self) -> None:
+        self.tokens -= 1
+
+    def reserve(self, now: float) -> float:
+        """
+        Takes a token, borrowing it from the future if there is none left.
+        Returns seconds to wait before the token can be used.
+        """
+        wait = self.wait_time(now)
+        self.consume()
+        return wait
+
+    def block(self, now: float, seconds: float) -> None:
+        self.blocked_until = max(self.blocked_until, now + seconds)
+
+    def is_idle(self, now: float) -> bool:
+        self.refill(now)
+        return self.tokens >= self.capacity and self.blocked_until <= now
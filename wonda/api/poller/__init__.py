@@ -1,3 +1,4 @@
 from .abc import ABCPoller
 from .default import DefaultPoller
 from .options import PollerOptions
+from .prefetching import PrefetchingPoller
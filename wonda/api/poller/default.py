@@ -6,7 +6,6 @@ from wonda.api.poller.options import PollerOptions
 from wonda.errors import ABCErrorHandler, APIException
 from wonda.errors.handler.default import DefaultErrorHandler
 from wonda.modules import logger
-from wonda.types.helper import from_json
 from wonda.types.objects import Update
 
 
@@ -23,20 +22,32 @@ class DefaultPoller(ABCPoller):
         self.options = poller_options or PollerOptions(0, [])
         self.error_handler = error_handler or DefaultErrorHandler()
 
+        # Updates are decoded into their model as responses are read
+        self.updates_type = list[self.options.update_model]  # type: ignore[name-defined]
+
     async def get_updates(
         self, offset: int | None = None, allowed_updates: list[str] | None = None
     ) -> list[Update]:
-        updates = b"[]"
+        updates: list[Update] = []
+        params = {
+            "offset": offset,
+            "allowed_updates": allowed_updates,
+            "timeout": self.options.timeout,
+            "limit": self.options.limit,
+        }
 
         try:
             updates = await self.api.request(
-                "getUpdates", {"offset": offset, "allowed_updates": allowed_updates}
+                "getUpdates",
+                {k: v for k, v in params.items() if v is not None},
+                type=self.updates_type,
+                timeout=self.options.request_timeout,
             )
         except APIException[401, 404] as e:
             await logger.acritical(e)
             self.stop = True
 
-        return from_json(updates, type=list[Update])
+        return updates
 
     async def poll(self) -> AsyncIterator[Update]:
         offset, allowed_updates = self.options.offset, self.options.allowed_updates
@@ -1,7 +1,37 @@
 from dataclasses import dataclass
 
+from wonda.types.objects import Update
+
 
 @dataclass
 class PollerOptions:
     offset: int | None = None
     allowed_updates: list[str] | None = None
+    timeout: int = 25
+    """
+    Timeout in seconds for long polling. The server holds each request
+    open until updates arrive or the timeout runs out. Set it to 0 to
+    fall back to short polling.
+    """
+    limit: int = 100
+    """
+    Limits the number of updates to be retrieved in one request.
+    Values between 1 and 100 are accepted.
+    """
+    timeout_margin: float = 10.0
+    """
+    Extra seconds the client waits on top of the server-side timeout
+    before giving up on a request.
+    """
+    update_model: type[Update] = Update
+    """
+    Model updates are decoded into. It can be a subclass of `Update`
+    with fields typed more specifically.
+    """
+
+    @property
+    def request_timeout(self) -> float:
+        """
+        Client-side timeout for a single `getUpdates` request.
+        """
+        return self.timeout + self.timeout_margin
@@ -0,0 +1,75 @@
+from asyncio import CancelledError, Queue, create_task, wait
+from typing import AsyncIterator
+
+from wonda.api.abc import ABCAPI
+from wonda.api.poller.default import DefaultPoller
+from wonda.api.poller.options import PollerOptions
+from wonda.errors import ABCErrorHandler
+from wonda.types.objects import Update
+
+
+class PrefetchingPoller(DefaultPoller):
+    """
+    A poller that keeps one `getUpdates` request in flight while the previous
+    batches are being consumed. Decoded batches are put into a bounded queue,
+    so the network round-trip is hidden behind dispatching under load.
+    """
+
+    def __init__(
+        self,
+        api: ABCAPI,
+        error_handler: ABCErrorHandler | None = None,
+        poller_options: PollerOptions | None = None,
+        max_batches: int = 4,
+    ) -> None:
+        super().__init__(api, error_handler, poller_options)
+        self.batches: Queue[list[Update] | BaseException | None] = Queue(max_batches)
+
+    @property
+    def pending(self) -> int:
+        """
+        Number of fetched batches waiting to be consumed.
+        """
+        return self.batches.qsize()
+
+    async def fetch(self) -> None:
+        offset, allowed_updates = self.options.offset, self.options.allowed_updates
+
+        try:
+            while not self.stop:
+                try:
+                    updates = await self.get_updates(offset, allowed_updates)
+
+                    if not updates:
+                        continue
+
+                    # Advance the offset right away so that the next request
+                    # can be sent while this batch is still being consumed
+                    offset = updates[-1].update_id + 1
+                    await self.batches.put(updates)
+                except CancelledError:
+                    raise
+                except BaseException as e:
+                    await self.error_handler.handle(e)
+        except CancelledError:
+            raise
+        except BaseException as e:
+            # The error handler raised the error, so it's raised by `poll`
+            await self.batches.put(e)
+            return
+
+        await self.batches.put(None)
+
+    async def poll(self) -> AsyncIterator[Update]:
+        fetcher = create_task(self.fetch())
+
+        try:
+            while (batch := await self.batches.get()) is not None:
+                if isinstance(batch, BaseException):
+                    raise batch
+
+                for update in batch:
+                    yield update
+        finally:
+            fetcher.cancel()
+            await wait([fetcher])
@@ -0,0 +1,2 @@
+from .abc import ABCRetryPolicy
+from .default import DefaultRetryPolicy
@@ -0,0 +1,17 @@
+from abc import ABC, abstractmethod
+
+
+class ABCRetryPolicy(ABC):
+    """
+    An interface for deciding whether a failed request should be made again.
+    """
+
+    @abstractmethod
+    def get_delay(
+        self, method: str, error: BaseException, attempt: int, elapsed: float
+    ) -> float | None:
+        """
+        Returns seconds to wait before the next attempt, or None if the
+        request should fail. `attempt` is the number of the failed attempt,
+        `elapsed` is the number of seconds since the first one was made.
+        """
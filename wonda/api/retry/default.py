@@ -0,0 +1,108 @@
+from asyncio import TimeoutError
+from collections import Counter
+from random import uniform
+from typing import Iterable
+
+from aiohttp import ClientError
+
+from wonda.api.retry.abc import ABCRetryPolicy
+from wonda.errors.external import APIException
+
+
+class DefaultRetryPolicy(ABCRetryPolicy):
+    """
+    Retries requests that failed because of flood control, chat migration,
+    a server error or a network error. Waits as long as the API asked to, or
+    backs off exponentially with full jitter otherwise. After server or
+    network errors, only methods starting with one of `idempotent` are
+    retried, since the API may have already processed the request. By
+    default, these are the methods which read or overwrite something,
+    so methods which create, send or transfer something aren't repeated.
+    """
+
+    NETWORK_ERRORS = (ClientError, TimeoutError, OSError)
+    IDEMPOTENT = (
+        "get",
+        "set",
+        "edit",
+        "delete",
+        "answer",
+        "ban",
+        "unban",
+        "restrict",
+        "promote",
+        "pin",
+        "unpin",
+        "approve",
+        "decline",
+        "stop",
+        "revoke",
+        "close",
+        "reopen",
+        "hide",
+        "unhide",
+        "leave",
+        "verify",
+        "remove",
+        "read",
+    )
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+        deadline: float | None = 60.0,
+        idempotent: Iterable[str] = IDEMPOTENT,
+        jitter: bool = True,
+    ) -> None:
+        self.max_attempts = max_attempts
+        self.base_delay, self.max_delay = base_delay, max_delay
+        self.deadline = deadline
+        self.idempotent = tuple(idempotent)
+        self.jitter = jitter
+
+        # Count retries made and requests given up on for each method
+        self.retries: Counter[str] = Counter()
+        self.failures: Counter[str] = Counter()
+
+    def get_delay(
+        self, method: str, error: BaseException, attempt: int, elapsed: float
+    ) -> float | None:
+        delay = self.get_error_delay(method, error, attempt)
+
+        if delay is None:
+            return None
+
+        if attempt >= self.max_attempts or (
+            self.deadline is not None and elapsed + delay > self.deadline
+        ):
+            self.failures[method] += 1
+            return None
+
+        self.retries[method] += 1
+        return delay
+
+    def get_error_delay(
+        self, method: str, error: BaseException, attempt: int
+    ) -> float | None:
+        if isinstance(error, APIException):
+            if error.retry_after is not None:
+                return float(error.retry_after)
+
+            if error.parameters and error.parameters.migrate_to_chat_id:
+                return 0.0
+
+            if error.code is None or error.code < 500:
+                return None
+        elif not isinstance(error, self.NETWORK_ERRORS):
+            return None
+
+        if not method.startswith(self.idempotent):
+            return None
+
+        return self.get_backoff(attempt)
+
+    def get_backoff(self, attempt: int) -> float:
+        delay = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return uniform(0, delay) if self.jitter else delay
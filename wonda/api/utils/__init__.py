@@ -1,2 +1,2 @@
-from .file_util import File
+from .file_util import File, FileStream, has_files, prepare_form
 from .token_util import Token
@@ -1,16 +1,127 @@
+import io
+import mmap
+import os
 from pathlib import Path
+from typing import AsyncIterable, BinaryIO
 
+from wonda.types.helper import translate
 from wonda.types.objects import InputFile
 
 
+class FileStream:
+    """
+    A file on disk which is only opened when it's being uploaded.
+    Its content is read chunk by chunk, so it never has to be held
+    in memory as a whole. Every upload opens the file anew, which
+    lets a failed request be retried with the same stream.
+    """
+
+    def __init__(self, path: str | Path, use_mmap: bool = False) -> None:
+        self.path = Path(path)
+        self.use_mmap = use_mmap
+
+    @property
+    def size(self) -> int:
+        return self.path.stat().st_size
+
+    def open(self) -> BinaryIO:
+        if self.use_mmap and self.size:
+            return MappedFile(self.path)  # type: ignore
+        return self.path.open("rb")
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} path={str(self.path)!r}>"
+
+
+class MappedFile(io.RawIOBase):
+    """
+    A read-only file object which copies chunks straight out
+    of a memory-mapped file instead of issuing a read call for each.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.fd = os.open(path, os.O_RDONLY)
+        self.map = mmap.mmap(self.fd, 0, access=mmap.ACCESS_READ)
+        self.position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def fileno(self) -> int:
+        return self.fd
+
+    def tell(self) -> int:
+        return self.position
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        base = (0, self.position, len(self.map))[whence]
+        self.position = max(base + offset, 0)
+        return self.position
+
+    def readinto(self, buffer) -> int:
+        chunk = self.map[self.position : self.position + len(buffer)]
+        buffer[: len(chunk)] = chunk
+        self.position += len(chunk)
+        return len(chunk)
+
+    def close(self) -> None:
+        if not self.closed:
+            self.map.close()
+            os.close(self.fd)
+        super().close()
+
+
 class File:
     @staticmethod
     def from_bytes(source: bytes, name: str | None = None) -> InputFile:
         return InputFile(name or "untitled.bin", source)
 
     @staticmethod
-    def from_path(source: str | Path, name: str | None = None) -> InputFile:
+    def from_path(
+        source: str | Path,
+        name: str | None = None,
+        *,
+        stream: bool = False,
+        use_mmap: bool = False,
+    ) -> InputFile:
         source = Path(source)
 
+        if stream or use_mmap:
+            return InputFile(name or source.name, FileStream(source, use_mmap))  # type: ignore
+
         with source.open("rb") as f:
             return InputFile(name or source.name, f.read())
+
+    @staticmethod
+    def from_stream(source: AsyncIterable[bytes], name: str | None = None) -> InputFile:
+        """
+        Uploads chunks produced by an async iterable, for example an async file object.
+        The iterable is consumed by the upload, so it can't be retried.
+        """
+        return InputFile(name or "untitled.bin", source)  # type: ignore
+
+
+def has_files(params: dict) -> bool:
+    """
+    Checks if any of the parameters is a file to be uploaded.
+    """
+    return any(isinstance(v, (InputFile, bytes)) for v in params.values())
+
+
+def prepare_form(params: dict) -> dict:
+    """
+    Converts parameters into values of a multipart form.
+    Streamed files are opened here, so each request reads them from the start.
+    """
+    form = {}
+    for k, v in params.items():
+        if isinstance(v, InputFile):
+            if isinstance(v.content, FileStream):
+                v = InputFile(v.name, v.content.open())  # type: ignore
+            form[k] = v
+        else:
+            form[k] = translate(v)
+    return form
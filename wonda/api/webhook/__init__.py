@@ -0,0 +1,4 @@
+from .abc import ABCWebhook
+from .default import DefaultWebhook
+from .inline import InlineAPI
+from .options import WebhookOptions
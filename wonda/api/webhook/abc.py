@@ -0,0 +1,31 @@
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any, Awaitable, Callable
+
+if TYPE_CHECKING:
+    from wonda.api.abc import ABCAPI
+    from wonda.api.webhook.options import WebhookOptions
+    from wonda.errors.handler.abc import ABCErrorHandler
+    from wonda.types.objects import Update
+
+Handler = Callable[["Update", "ABCAPI"], Awaitable[Any]]
+
+
+class ABCWebhook(ABC):
+    api: "ABCAPI"
+    options: "WebhookOptions"
+    error_handler: "ABCErrorHandler"
+
+    @abstractmethod
+    async def listen(self, handler: Handler) -> None:
+        """
+        Sets up the webhook and passes every incoming update to the handler
+        together with the API it should use, until the webhook is closed.
+        The handler may return an awaitable which completes once the
+        update is handled.
+        """
+
+    @abstractmethod
+    async def close(self) -> None:
+        """
+        Stops the server and removes the webhook.
+        """
@@ -0,0 +1,156 @@
+from asyncio import Event, Task, create_task, gather, wait
+
+from aiohttp import web
+from msgspec import DecodeError, json
+
+from wonda.api.abc import ABCAPI
+from wonda.api.webhook.abc import ABCWebhook, Handler
+from wonda.api.webhook.inline import InlineAPI
+from wonda.api.webhook.options import WebhookOptions
+from wonda.errors import ABCErrorHandler
+from wonda.errors.handler.default import DefaultErrorHandler
+from wonda.modules import logger
+from wonda.tools.web_apps import verify_webapp_request
+from wonda.types.helper import get_decoder
+from wonda.types.objects import Update
+
+
+class DefaultWebhook(ABCWebhook):
+    """
+    Receives updates with a built-in aiohttp server. Requests are answered
+    as soon as their update is handed over to the handler, so the API can
+    send the next one without waiting for the update to be processed.
+    """
+
+    def __init__(
+        self,
+        api: ABCAPI,
+        options: WebhookOptions,
+        error_handler: ABCErrorHandler | None = None,
+    ) -> None:
+        self.api = api
+        self.options = options
+        self.error_handler = error_handler or DefaultErrorHandler()
+
+        self.runner: web.AppRunner | None = None
+        self.closed = Event()
+        self.handler: Handler | None = None
+        self.pending: set[Task] = set()
+
+    async def handle(self, request: web.Request) -> web.Response:
+        if self.options.secret_token is not None and not verify_webapp_request(
+            self.options.secret_token,
+            request.headers,  # type: ignore
+        ):
+            return web.Response(status=401)
+
+        try:
+            decoder = get_decoder(self.options.update_model)
+            update = decoder.decode(await request.read())
+        except DecodeError:
+            return web.Response(status=400)
+
+        if self.options.inline_deadline is not None:
+            return await self.handle_inline(update)
+
+        try:
+            await self.handler(update, self.api)  # type: ignore
+        except Exception as e:
+            # The API delivers the update again if the request fails
+            await self.error_handler.handle(e)
+            return web.Response(status=500)
+
+        return web.Response()
+
+    async def handle_inline(self, update: Update) -> web.Response:
+        api = InlineAPI(self.api)
+
+        try:
+            handled = await self.handler(update, api)  # type: ignore
+        except Exception as e:
+            await self.error_handler.handle(e)
+            return web.Response(status=500)
+
+        await wait({handled}, timeout=self.options.inline_deadline)
+
+        if not handled.done() or (call := api.take()) is None:
+            # The update is still being handled, so the call it may have
+            # made is sent before any of the following ones
+            self.pending.add(task := create_task(api.flush()))
+            task.add_done_callback(self.pending.discard)
+            return web.Response()
+
+        method, params = call
+
+        # The call counts toward the limits as if the API made it. It isn't
+        # retried though, since its result isn't known to the bot
+        if self.api.rate_limiter is not None:
+            await self.api.rate_limiter.acquire(method, params)
+
+        return web.Response(
+            body=json.encode({"method": method, **params}),
+            content_type="application/json",
+        )
+
+    def get_application(self) -> web.Application:
+        app = web.Application(client_max_size=self.options.client_max_size)
+        app.router.add_post(self.options.path, self.handle)
+        return app
+
+    async def listen(self, handler: Handler) -> None:
+        self.handler = handler
+        self.closed.clear()
+
+        self.runner = web.AppRunner(
+            self.get_application(),
+            access_log=None,
+            keepalive_timeout=self.options.keepalive_timeout,
+        )
+        await self.runner.setup()
+
+        try:
+            site = web.TCPSite(self.runner, self.options.host, self.options.port)
+            await site.start()
+
+            params = {
+                "url": self.options.url,
+                "secret_token": self.options.secret_token,
+                "allowed_updates": self.options.allowed_updates,
+                "max_connections": self.options.max_connections,
+                "drop_pending_updates": self.options.drop_pending_updates,
+            }
+            await self.api.request(
+                "setWebhook", {k: v for k, v in params.items() if v is not None}
+            )
+            await logger.ainfo(
+                "Listening",
+                url=self.options.url,
+                host=self.options.host,
+                port=self.options.port,
+            )
+
+            await self.closed.wait()
+        finally:
+            await self.close()
+
+    async def close(self) -> None:
+        if self.runner is None:
+            return
+
+        runner, self.runner = self.runner, None
+        self.closed.set()
+
+        try:
+            await self.flush_pending()
+            await self.api.request("deleteWebhook", {})
+        finally:
+            await runner.cleanup()
+            # Updates handled while the server was stopping may leave calls too
+            await self.flush_pending()
+
+    async def flush_pending(self) -> None:
+        """
+        Waits until calls held back for updates being handled are sent.
+        """
+        while self.pending:
+            await gather(*self.pending, return_exceptions=True)
@@ -0,0 +1,75 @@
+from asyncio import Lock
+from typing import Any
+
+from msgspec import Raw
+
+from wonda.api.abc import ABCAPI
+from wonda.api.utils import has_files
+from wonda.types.methods import APIMethods
+
+
+class InlineAPI(ABCAPI, APIMethods):
+    """
+    Wraps the API for a single update received by the webhook. The first
+    call which can be made in the webhook response is held back instead of
+    being sent, and its result is `None`. If the update isn't handled in time
+    to answer the webhook request, the call is sent as usual. Calls are
+    always sent in the order they were made. A call made in the webhook
+    response counts toward the limits of the rate limiter, but isn't
+    retried, since the bot doesn't learn whether it succeeded.
+    """
+
+    # Methods with these prefixes return data which handlers rely on,
+    # so they are never answered in the webhook response
+    FETCHING_METHODS = ("get", "export", "create", "upload")
+
+    def __init__(self, api: ABCAPI) -> None:
+        super().__init__(self)
+
+        self.untyped_api = api
+        self.token = api.token
+        self.network_client = api.network_client
+
+        self.call: tuple[str, dict] | None = None
+        self.capturing = True
+        self.lock = Lock()
+
+    async def request(
+        self,
+        method: str,
+        params: dict,
+        *,
+        type: Any = Raw,
+        timeout: float | None = None,
+    ) -> Any:
+        if self.capturing and self.is_eligible(method, params):
+            self.capturing = False
+            self.call = (method, params)
+            return None
+
+        self.capturing = False
+        await self.flush()
+
+        return await self.untyped_api.request(
+            method, params, type=type, timeout=timeout
+        )
+
+    def is_eligible(self, method: str, params: dict) -> bool:
+        return not method.startswith(self.FETCHING_METHODS) and not has_files(params)
+
+    def take(self) -> tuple[str, dict] | None:
+        """
+        Stops holding calls back and returns the call to be made
+        in the webhook response, if there is one.
+        """
+        self.capturing = False
+        call, self.call = self.call, None
+        return call
+
+    async def flush(self) -> None:
+        """
+        Sends the call which is held back, if there is one.
+        """
+        async with self.lock:
+            if (call := self.take()) is not None:
+                await self.untyped_api.request(*call)
@@ -0,0 +1,48 @@
+from dataclasses import dataclass
+
+from wonda.types.objects import Update
+
+
+@dataclass
+class WebhookOptions:
+    url: str
+    """
+    HTTPS URL the API sends updates to. It should lead to the server
+    started by the webhook, usually through a reverse proxy.
+    """
+    secret_token: str | None = None
+    """
+    Token the API sends in a header of every request, so the server
+    can reject requests which don't come from Telegram.
+    """
+    host: str = "0.0.0.0"
+    port: int = 8080
+    path: str = "/"
+    allowed_updates: list[str] | None = None
+    max_connections: int = 40
+    """
+    Maximum number of connections the API opens to the server at the same
+    time. Values between 1 and 100 are accepted.
+    """
+    drop_pending_updates: bool = False
+    client_max_size: int = 2**20
+    """
+    Maximum size of a request body in bytes. Larger requests
+    are rejected before they're read.
+    """
+    keepalive_timeout: float = 75.0
+    """
+    Seconds an idle connection from the API is kept open, so
+    it can be reused for the following updates.
+    """
+    inline_deadline: float | None = None
+    """
+    Seconds to wait for an update to be handled, so the first API call made
+    by handlers can be put into the webhook response instead of being sent
+    separately. Calls are never answered inline if it's not set.
+    """
+    update_model: type[Update] = Update
+    """
+    Model updates are decoded into. It can be a subclass of `Update`
+    with fields typed more specifically.
+    """
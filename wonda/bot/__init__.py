@@ -7,9 +7,15 @@ from .dispatch import (
     ABCHandler,
     ABCMiddleware,
     ABCRouter,
+    ABCScheduler,
+    ABCSequencer,
     ABCView,
     DefaultDispatcher,
     DefaultRouter,
+    DefaultScheduler,
+    DefaultSequencer,
+    KeyedScheduler,
+    ShardedScheduler,
 )
 from .rules import *
 from .states import (
@@ -24,4 +30,6 @@ from .updates import *
 Dispatcher = DefaultDispatcher
 Blueprint = DefaultBlueprint
 Router = DefaultRouter
+Scheduler = DefaultScheduler
+Sequencer = DefaultSequencer
 StateManager = DefaultStateManager
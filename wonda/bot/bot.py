@@ -1,19 +1,28 @@
-from asyncio import AbstractEventLoop, get_event_loop
+from asyncio import AbstractEventLoop, Future, get_event_loop, get_running_loop
+from functools import partial
 
 from wonda.api import ABCAPI, DefaultAPI, Token
 from wonda.api.poller import ABCPoller, DefaultPoller, PollerOptions
+from wonda.api.webhook import ABCWebhook, DefaultWebhook, WebhookOptions
 from wonda.bot.abc import ABCFramework
 from wonda.bot.dispatch import (
     ABCDispatcher,
     ABCRouter,
+    ABCScheduler,
+    ABCSequencer,
     DefaultDispatcher,
     DefaultRouter,
+    DefaultScheduler,
+    DefaultSequencer,
+    ShardedScheduler,
     get_used_update_types,
 )
 from wonda.bot.states import ABCStateManager, DefaultStateManager
+from wonda.bot.updates import TypedUpdate
 from wonda.errors import ABCErrorHandler, DefaultErrorHandler
 from wonda.modules import logger
 from wonda.tools import LoopWrapper
+from wonda.types.objects import Update
 
 
 class Bot(ABCFramework):
@@ -25,6 +34,9 @@ class Bot(ABCFramework):
         router: ABCRouter | None = None,
         state_manager: ABCStateManager | None = None,
         poller: ABCPoller | None = None,
+        scheduler: ABCScheduler | None = None,
+        sequencer: ABCSequencer | None = None,
+        webhook: ABCWebhook | None = None,
         error_handler: ABCErrorHandler | None = None,
         loop_wrapper: LoopWrapper | None = None,
         loop: AbstractEventLoop | None = None,
@@ -40,6 +52,9 @@ class Bot(ABCFramework):
         self.router = router or DefaultRouter(
             self.state_manager, self.error_handler, self.dispatcher.views
         )
+        self.scheduler = scheduler or DefaultScheduler()
+        self.sequencer = sequencer or DefaultSequencer()
+        self.webhook = webhook
         self.loop = loop or get_event_loop()
 
     async def run_polling(self, drop_updates: bool = False) -> None:
@@ -48,6 +63,9 @@ class Bot(ABCFramework):
                 "deleteWebhook", {"drop_pending_updates": True}
             )
 
+        if self.poller.options.update_model is Update:
+            self.poller.options.update_model = TypedUpdate
+
         allowed_updates_empty = self.poller.options.allowed_updates is None
         if allowed_updates_empty:
             self.poller.options.allowed_updates = get_used_update_types(self.dispatcher)
@@ -57,9 +75,77 @@ class Bot(ABCFramework):
             offset=self.poller.options.offset,
             allowed_updates=self.poller.options.allowed_updates,
         )
+
+        # Scheduling an update waits while the scheduler is saturated,
+        # so the poller doesn't acknowledge updates it can't handle yet
         async for update in self.poller.poll():
-            self.loop.create_task(self.router.route(update, self.api))
+            await self.schedule(update, wait=False)
+
+    async def run_webhook(self, options: WebhookOptions | None = None) -> None:
+        if options is not None:
+            self.webhook = DefaultWebhook(self.untyped_api, options, self.error_handler)
+        if self.webhook is None:
+            raise RuntimeError("Webhook options should be given to run a webhook")
+
+        if self.webhook.options.update_model is Update:
+            self.webhook.options.update_model = TypedUpdate
+
+        if self.webhook.options.allowed_updates is None:
+            self.webhook.options.allowed_updates = get_used_update_types(
+                self.dispatcher
+            )
+
+        # Each request is answered once its update is scheduled, so the
+        # API is held back while the scheduler is saturated
+        await self.webhook.listen(self.schedule)
+
+    async def schedule(
+        self, update: Update, api: ABCAPI | None = None, wait: bool = True
+    ) -> Future:
+        try:
+            admitted = await self.sequencer.admit(update, wait)
+        except Exception as e:
+            # An update which can't be checked is handled rather than lost
+            await self.error_handler.handle(e)
+            admitted = True
 
-    def run_forever(self, *, drop_updates: bool = False) -> None:
-        self.loop_wrapper.add_task(self.run_polling(drop_updates=drop_updates))
+        if not admitted:
+            # Updates delivered again are acknowledged without being handled
+            future = get_running_loop().create_future()
+            future.set_result(None)
+            return future
+
+        handler = self.route if api is None else partial(self.route, api=api)
+
+        try:
+            return await self.scheduler.schedule(update, handler)
+        except Exception as e:
+            # The update is lost, but the bot goes on with the next ones
+            await self.error_handler.handle(e)
+
+        future = get_running_loop().create_future()
+        future.set_result(None)
+        return future
+
+    async def route(self, update: Update, api: ABCAPI | None = None) -> None:
+        await self.router.route(update, api or self.api)
+
+    def run_forever(
+        self, *, drop_updates: bool = False, webhook: WebhookOptions | None = None
+    ) -> None:
+        if isinstance(self.scheduler, ShardedScheduler):
+            # Workers are forked before the loop starts, so they
+            # don't inherit its state or any open connections
+            self.scheduler.fork(self.route, self.error_handler)
+            self.loop_wrapper.on_shutdown.append(self.scheduler.close())
+
+        if webhook is not None or self.webhook is not None:
+            self.loop_wrapper.add_task(self.run_webhook(webhook))
+            self.loop_wrapper.on_shutdown.append(self.close_webhook())
+        else:
+            self.loop_wrapper.add_task(self.run_polling(drop_updates=drop_updates))
         self.loop_wrapper.run_forever(self.loop)
+
+    async def close_webhook(self) -> None:
+        if self.webhook is not None:
+            await self.webhook.close()
@@ -2,4 +2,11 @@ from .dispatcher import ABCDispatcher, DefaultDispatcher, get_used_update_types
 from .handler import ABCHandler, FuncHandler
 from .middleware import ABCMiddleware
 from .router import ABCRouter, DefaultRouter
+from .sequencer import ABCSequencer, DefaultSequencer
+from .scheduler import (
+    ABCScheduler,
+    DefaultScheduler,
+    KeyedScheduler,
+    ShardedScheduler,
+)
 from .view import ABCView, DefaultView
@@ -16,6 +16,16 @@ class FuncHandler(ABCHandler[T]):
     def __init__(self, func: FuncType, *rules: ABCRule[T], blocking: bool = True):
         self.func, self.blocking, self.rules = func, blocking, list(rules)
 
+        # Names of context values the function accepts are found once,
+        # since inspecting its signature for each update is slow
+        params = list(inspect.signature(func).parameters.values())[1:]
+        self.accepts = frozenset(
+            p.name
+            for p in params
+            if p.kind in (p.POSITIONAL_OR_KEYWORD, p.KEYWORD_ONLY)
+        )
+        self.accepts_any = any(p.kind is p.VAR_KEYWORD for p in params)
+
     async def filter(self, update: T, ctx: dict) -> bool:
         for rule in self.rules:
             result = await rule.check(update, ctx)
@@ -27,11 +37,10 @@ class FuncHandler(ABCHandler[T]):
         return True
 
     async def handle(self, update: T, ctx: dict) -> _:
-        sig = inspect.signature(self.func)
-
-        args = [k for k in sig.parameters.keys()]
-        accepts = {k: v for k, v in ctx.items() if k in args[1:]}
+        if self.accepts_any:
+            return await self.func(update, **ctx)
 
+        accepts = {k: ctx[k] for k in self.accepts if k in ctx}
         return await self.func(update, **accepts)
 
     def __repr__(self):
@@ -1,6 +1,7 @@
 from wonda.api import ABCAPI
 from wonda.bot.dispatch.router import ABCRouter
 from wonda.bot.dispatch.view.abc import ABCView
+from wonda.bot.dispatch.view.utils import get_update_type
 from wonda.bot.states.manager.abc import ABCBaseStateManager
 from wonda.errors.handler.abc import ABCErrorHandler
 from wonda.modules import logger
@@ -18,10 +19,30 @@ class DefaultRouter(ABCRouter):
         self.error_handler = error_handler
         self.views = views
 
+        # Views which declare update types they match are looked up by
+        # the type of an update, the rest are asked to filter each of them
+        self.table: dict[str, list["ABCView"]] = {}
+        self.unindexed: list["ABCView"] = []
+
+        for view in views.values():
+            if (matches := getattr(view, "matches", None)) is None:
+                self.unindexed.append(view)
+                continue
+            for update_type in matches:
+                self.table.setdefault(update_type, []).append(view)
+
     async def route(self, update: "Update", api: "ABCAPI") -> None:
         await logger.ainfo("Routing", update=update)
 
-        for view in self.views.values():
+        for view in self.table.get(get_update_type(update), ()):
+            if not (view.handlers or view.middleware):
+                continue
+            try:
+                await view.handle(update, api, self.state_manager)
+            except BaseException as e:
+                await self.error_handler.handle(e)
+
+        for view in self.unindexed:
             try:
                 if not await view.filter(update):
                     continue
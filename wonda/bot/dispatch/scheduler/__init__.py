@@ -0,0 +1,5 @@
+from .abc import ABCScheduler
+from .default import DefaultScheduler
+from .keyed import KeyedScheduler
+from .sharded import ShardedScheduler
+from .utils import get_update_key, get_user_key
@@ -0,0 +1,43 @@
+from abc import ABC, abstractmethod
+from asyncio import Future
+from typing import TYPE_CHECKING, Any, Callable, Coroutine
+
+if TYPE_CHECKING:
+    from wonda.types.objects import Update
+
+Handler = Callable[["Update"], Coroutine[Any, Any, Any]]
+
+
+class ABCScheduler(ABC):
+    """
+    An interface for running handling of updates concurrently while keeping
+    the amount of work in progress under control.
+    """
+
+    @abstractmethod
+    async def schedule(self, update: "Update", handler: Handler) -> "Future[Any]":
+        """
+        Schedules an update to be passed to the handler. Waits for a free slot
+        when the scheduler is saturated, which pauses the update source.
+        Returns a future that resolves once the update is handled.
+        """
+
+    @abstractmethod
+    async def join(self) -> None:
+        """
+        Waits until all scheduled updates are handled.
+        """
+
+    @property
+    @abstractmethod
+    def in_flight(self) -> int:
+        """
+        Number of updates being handled at the moment.
+        """
+
+    @property
+    @abstractmethod
+    def queued(self) -> int:
+        """
+        Number of updates waiting for a free slot.
+        """
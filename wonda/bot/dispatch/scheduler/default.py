@@ -0,0 +1,68 @@
+from asyncio import Future, Semaphore, Task, create_task, gather
+from typing import TYPE_CHECKING, Any, Coroutine
+
+from wonda.bot.dispatch.scheduler.abc import ABCScheduler, Handler
+
+if TYPE_CHECKING:
+    from wonda.types.objects import Update
+
+
+class DefaultScheduler(ABCScheduler):
+    """
+    Handles every update in a separate task, allowing no more than
+    `max_in_flight` of them to run at the same time.
+    """
+
+    def __init__(self, max_in_flight: int = 1024) -> None:
+        assert max_in_flight > 0, "Scheduler should allow at least one update"
+
+        self.max_in_flight = max_in_flight
+        self.semaphore = Semaphore(max_in_flight)
+        self.tasks: set[Task] = set()
+        self.waiting, self.active = 0, 0
+
+    async def schedule(self, update: "Update", handler: Handler) -> "Future[Any]":
+        await self.acquire()
+
+        task = self.spawn(handler(update))
+        task.add_done_callback(self.release)
+
+        return task
+
+    async def join(self) -> None:
+        while self.tasks:
+            await gather(*self.tasks, return_exceptions=True)
+
+    async def acquire(self) -> None:
+        self.waiting += 1
+
+        try:
+            await self.semaphore.acquire()
+        finally:
+            self.waiting -= 1
+
+        self.active += 1
+
+    def release(self, *_) -> None:
+        self.active -= 1
+        self.semaphore.release()
+
+    def spawn(self, coro: Coroutine[Any, Any, Any]) -> Task:
+        task = create_task(coro)
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+        return task
+
+    @property
+    def in_flight(self) -> int:
+        return self.active
+
+    @property
+    def queued(self) -> int:
+        return self.waiting
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(in_flight={self.in_flight}, "
+            f"queued={self.queued}, max_in_flight={self.max_in_flight})"
+        )
@@ -0,0 +1,102 @@
+from asyncio import Future, get_running_loop, shield
+from collections import deque
+from typing import TYPE_CHECKING, Any, Callable, Hashable
+
+from wonda.bot.dispatch.scheduler.abc import Handler
+from wonda.bot.dispatch.scheduler.default import DefaultScheduler
+from wonda.bot.dispatch.scheduler.utils import get_update_key
+
+if TYPE_CHECKING:
+    from wonda.types.objects import Update
+
+KeyFunc = Callable[["Update"], Hashable | None]
+Item = tuple["Update", Handler, "Future[Any]"]
+
+
+class KeyedScheduler(DefaultScheduler):
+    """
+    Handles updates sharing a key one after another, while updates with
+    different keys are handled in parallel. By default, updates are keyed
+    by the chat they come from. Each key being handled takes one of
+    `max_in_flight` slots, however many updates wait in its queue, and
+    a key with `max_queued` updates waiting holds back new ones.
+    Queues of idle keys are dropped.
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int = 1024,
+        key: KeyFunc | None = None,
+        max_queued: int = 64,
+    ) -> None:
+        super().__init__(max_in_flight)
+
+        self.key = key or get_update_key
+        self.max_queued = max_queued
+        self.queues: dict[Hashable, deque[Item]] = {}
+
+        # Futures resolved once queues of their keys have space again
+        self.space: dict[Hashable, Future[None]] = {}
+
+    async def schedule(self, update: "Update", handler: Handler) -> "Future[Any]":
+        key = self.key(update)
+
+        if key is None:
+            return await super().schedule(update, handler)
+
+        # Only the chat flooding the bot is held back, not the others
+        while (queue := self.queues.get(key)) is not None and (
+            len(queue) >= self.max_queued
+        ):
+            if key not in self.space:
+                self.space[key] = get_running_loop().create_future()
+            await shield(self.space[key])
+
+        future = get_running_loop().create_future()
+
+        if queue is not None:
+            queue.append((update, handler, future))
+            return future
+
+        # A key takes a slot only once, so updates waiting in its queue
+        # don't keep updates from other keys from being handled
+        queue = self.queues[key] = deque([(update, handler, future)])
+
+        try:
+            await self.acquire()
+        except BaseException:
+            del self.queues[key]
+            raise
+
+        self.spawn(self.work(key, queue))
+        return future
+
+    async def work(self, key: Hashable, queue: deque[Item]) -> None:
+        try:
+            while queue:
+                update, handler, future = queue.popleft()
+
+                if (space := self.space.pop(key, None)) is not None:
+                    space.set_result(None)
+
+                try:
+                    future.set_result(await handler(update))
+                except Exception as e:
+                    future.set_exception(e)
+        finally:
+            # Updates left after the worker was cancelled won't be handled
+            for *_, future in queue:
+                future.cancel()
+
+            del self.queues[key]
+            self.release()
+
+            if (space := self.space.pop(key, None)) is not None:
+                space.set_result(None)
+
+    @property
+    def keys(self) -> int:
+        """
+        Number of keys with updates being handled or waiting in their queues.
+        """
+        return len(self.queues)
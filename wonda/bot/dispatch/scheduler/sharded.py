@@ -0,0 +1,230 @@
+import os
+import socket
+from asyncio import (
+    Future,
+    StreamReader,
+    StreamWriter,
+    Task,
+    create_task,
+    get_running_loop,
+    open_unix_connection,
+    run,
+    to_thread,
+)
+from struct import Struct
+from typing import Any, Callable
+
+from msgspec import msgpack
+
+from wonda.bot.dispatch.scheduler.abc import ABCScheduler, Handler
+from wonda.bot.dispatch.scheduler.keyed import KeyedScheduler, KeyFunc
+from wonda.bot.dispatch.scheduler.utils import get_user_key
+from wonda.bot.updates import TypedUpdate
+from wonda.errors import ABCErrorHandler
+from wonda.modules import logger
+from wonda.types.objects import Update
+
+# Every update is sent to a worker prefixed with its length
+header = Struct("!I")
+
+
+class Worker:
+    def __init__(self, pid: int, sock: socket.socket) -> None:
+        self.pid, self.sock = pid, sock
+        self.writer: StreamWriter | None = None
+        self.reader_task: Task | None = None
+        self.sent, self.handled = 0, 0
+        self.idle: Future | None = None
+        self.alive = True
+
+
+class ShardedScheduler(ABCScheduler):
+    """
+    Hands updates over to several worker processes, so handlers can use
+    all cores of the machine. Updates sharing a key always go to the same
+    worker, which handles them with its own scheduler, so updates from
+    the same chat are still handled in order. Workers are forked from
+    the current process, so they share the handlers set up before.
+
+    By default, updates are keyed by the user who caused them, since that's
+    what their state is keyed by, so state kept in the memory of a worker
+    stays in one place. Updates from a group are then only ordered for each
+    user. Keying by chat with `get_update_key` orders them for the whole
+    group, but needs a storage shared between workers, like Redis.
+
+    When a worker dies, its updates go to the other workers.
+    """
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        key: KeyFunc | None = None,
+        scheduler: Callable[[], ABCScheduler] = KeyedScheduler,
+    ) -> None:
+        self.workers_count = workers or os.cpu_count() or 1
+        self.key = key or get_user_key
+        self.scheduler = scheduler
+        self.error_handler: ABCErrorHandler | None = None
+
+        self.workers: list[Worker] = []
+        self.encoder = msgpack.Encoder()
+
+    def fork(
+        self, handler: Handler, error_handler: ABCErrorHandler | None = None
+    ) -> None:
+        """
+        Starts worker processes which pass updates to the handler. Should be
+        called before the event loop runs and before any connections are made.
+        Workers which die are reported to the error handler.
+        """
+        self.error_handler = error_handler
+
+        for _ in range(self.workers_count):
+            parent_sock, child_sock = socket.socketpair()
+
+            if (pid := os.fork()) == 0:
+                parent_sock.close()
+                for worker in self.workers:
+                    worker.sock.close()
+
+                try:
+                    run(self.work(child_sock, handler))
+                finally:
+                    os._exit(0)
+
+            child_sock.close()
+            self.workers.append(Worker(pid, parent_sock))
+
+    async def work(self, sock: socket.socket, handler: Handler) -> None:
+        scheduler = self.scheduler()
+        decoder = msgpack.Decoder(TypedUpdate)
+        reader, writer = await open_unix_connection(sock=sock)
+
+        await logger.ainfo("Worker started", pid=os.getpid())
+
+        # Each handled update is acknowledged with a single byte,
+        # so the main process knows how much work is in progress
+        def acknowledge(*_) -> None:
+            if not writer.is_closing():
+                writer.write(b"\x00")
+
+        while data := await self.read(reader):
+            future = await scheduler.schedule(decoder.decode(data), handler)
+            future.add_done_callback(acknowledge)
+
+        await scheduler.join()
+        writer.close()
+
+    @staticmethod
+    async def read(reader: StreamReader) -> bytes | None:
+        try:
+            (size,) = header.unpack(await reader.readexactly(header.size))
+            return await reader.readexactly(size)
+        except (ConnectionError, EOFError):
+            return None
+
+    async def connect(self, worker: Worker) -> StreamWriter:
+        reader, worker.writer = await open_unix_connection(sock=worker.sock)
+        worker.reader_task = create_task(self.count_handled(worker, reader))
+        return worker.writer
+
+    async def count_handled(self, worker: Worker, reader: StreamReader) -> None:
+        while data := await reader.read(2**16):
+            worker.handled += len(data)
+
+            if worker.idle and worker.handled >= worker.sent:
+                worker.idle.set_result(None)
+                worker.idle = None
+
+        # The worker is gone, so updates it didn't handle are lost
+        # and nothing is going to be handled anymore
+        worker.alive = False
+        worker.handled = worker.sent
+
+        if worker.idle:
+            worker.idle.set_result(None)
+            worker.idle = None
+
+    def get_worker(self, update: Update) -> Worker:
+        key = self.key(update)
+        shard = hash(key) if key is not None else update.update_id
+
+        if (worker := self.workers[shard % len(self.workers)]).alive:
+            return worker
+
+        # Shards of dead workers are spread over the others,
+        # while shards of live workers stay where they are
+        if not (alive := [w for w in self.workers if w.alive]):
+            raise RuntimeError("All workers are gone")
+        return alive[shard % len(alive)]
+
+    async def schedule(self, update: Update, handler: Handler) -> "Future[Any]":
+        assert self.workers, "Workers should be forked before scheduling updates"
+
+        worker = self.get_worker(update)
+        data = self.encoder.encode(update)
+
+        try:
+            writer = worker.writer or await self.connect(worker)
+            writer.write(header.pack(len(data)) + data)
+
+            # Waits while the worker is too busy to read updates,
+            # which holds back the update source
+            await writer.drain()
+            worker.sent += 1
+        except (ConnectionError, OSError) as e:
+            worker.alive = False
+            await logger.aerror("Worker is gone", pid=worker.pid)
+
+            if self.error_handler is not None:
+                await self.error_handler.handle(e)
+
+            return await self.schedule(update, handler)
+
+        # The update is handled in another process,
+        # so there's no result to wait for here
+        future = get_running_loop().create_future()
+        future.set_result(None)
+        return future
+
+    async def join(self) -> None:
+        for worker in self.workers:
+            # Dead workers won't acknowledge anything, so they aren't waited for
+            if worker.alive and worker.handled < worker.sent:
+                worker.idle = get_running_loop().create_future()
+                await worker.idle
+
+    async def close(self) -> None:
+        """
+        Lets the workers handle updates they received and stops them.
+        """
+        await self.join()
+
+        for worker in self.workers:
+            if worker.writer is not None:
+                worker.writer.close()
+            else:
+                worker.sock.close()
+
+        for worker in self.workers:
+            if worker.reader_task is not None:
+                await worker.reader_task
+            await to_thread(os.waitpid, worker.pid, 0)
+
+    @property
+    def in_flight(self) -> int:
+        return sum(
+            max(worker.sent - worker.handled, 0)
+            for worker in self.workers
+            if worker.alive
+        )
+
+    @property
+    def queued(self) -> int:
+        return 0
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(workers={len(self.workers)}, "
+            f"in_flight={self.in_flight})"
+        )
@@ -0,0 +1,41 @@
+from typing import TYPE_CHECKING
+
+from wonda.bot.dispatch.view.utils import get_update_type
+
+if TYPE_CHECKING:
+    from wonda.types.objects import Update
+
+
+def get_update_key(update: "Update") -> int | None:
+    """
+    Picks a key to order updates by. Updates coming from the same chat share
+    the key. Updates without a chat are keyed by the user who caused them.
+    """
+    event = getattr(update, get_update_type(update), None)
+    message = getattr(event, "message", None)
+
+    if chat := getattr(event, "chat", None) or getattr(message, "chat", None):
+        return chat.id
+
+    if user := getattr(event, "from_", None) or getattr(event, "user", None):
+        return user.id
+
+    return None
+
+
+def get_user_key(update: "Update") -> int | None:
+    """
+    Picks a key to shard updates by. Updates caused by the same user share
+    the key, as their state does. Updates without a user are keyed by chat.
+    """
+    event = getattr(update, get_update_type(update), None)
+
+    if user := getattr(event, "from_", None) or getattr(event, "user", None):
+        return user.id
+
+    message = getattr(event, "message", None)
+
+    if chat := getattr(event, "chat", None) or getattr(message, "chat", None):
+        return chat.id
+
+    return None
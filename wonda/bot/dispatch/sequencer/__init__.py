@@ -0,0 +1,3 @@
+from .abc import ABCSequencer
+from .default import DefaultSequencer
+from .utils import UpdateWindow
@@ -0,0 +1,20 @@
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from wonda.types.objects import Update
+
+
+class ABCSequencer(ABC):
+    """
+    An interface for filtering out updates which were delivered
+    more than once and putting the rest back in order before routing.
+    """
+
+    @abstractmethod
+    async def admit(self, update: "Update", wait: bool = True) -> bool:
+        """
+        Decides whether an update should be handled. Returns `False` for
+        updates which were already seen. Unless `wait` is `False`, may wait
+        for a while to let updates with lower identifiers through first.
+        """
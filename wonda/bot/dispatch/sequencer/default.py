@@ -0,0 +1,78 @@
+from asyncio import Condition, TimeoutError, wait_for
+from typing import TYPE_CHECKING
+
+from wonda.bot.dispatch.sequencer.abc import ABCSequencer
+from wonda.bot.dispatch.sequencer.utils import UpdateWindow
+from wonda.modules import logger
+from wonda.tools.storage import ABCExpiringStorage
+
+if TYPE_CHECKING:
+    from wonda.types.objects import Update
+
+
+class DefaultSequencer(ABCSequencer):
+    """
+    Drops updates whose identifiers were seen among the last `window` ones.
+    If `delay` is set, an update which is ahead of the next expected one
+    waits for up to `delay` seconds for the missing updates to arrive,
+    unless updates are admitted one by one, as they are when polling.
+    A shared `storage` lets several instances of the bot drop updates
+    already taken by one of them.
+    """
+
+    def __init__(
+        self,
+        window: int = 4096,
+        delay: float = 0.0,
+        storage: ABCExpiringStorage[str, bool] | None = None,
+        ex: float = 86400.0,
+    ) -> None:
+        self.seen = UpdateWindow(window)
+        self.delay = delay
+        self.storage, self.ex = storage, ex
+
+        self.last: int | None = None
+        self.condition = Condition()
+        self.duplicates = 0
+
+    async def admit(self, update: "Update", wait: bool = True) -> bool:
+        update_id = update.update_id
+
+        if not self.seen.add(update_id) or not await self.claim(update_id):
+            self.duplicates += 1
+            await logger.adebug("Dropping duplicate", update_id=update_id)
+            return False
+
+        if self.delay and wait:
+            await self.wait_turn(update_id)
+        return True
+
+    async def claim(self, update_id: int) -> bool:
+        if self.storage is None:
+            return True
+
+        # Only one of the instances sharing the storage adds the key
+        return await self.storage.add(f"update:{update_id}", True, ex=self.ex)
+
+    async def wait_turn(self, update_id: int) -> None:
+        async with self.condition:
+            # Identifiers start over after the bot has been idle for long,
+            # so the last one seen before that is of no use anymore
+            if self.last is not None and update_id < self.last - self.seen.size:
+                self.last = None
+
+            if self.last is not None and update_id > self.last + 1:
+                try:
+                    await wait_for(
+                        self.condition.wait_for(
+                            lambda: update_id <= self.last + 1  # type: ignore
+                        ),
+                        self.delay,
+                    )
+                except TimeoutError:
+                    await logger.adebug(
+                        "Skipping missing updates", since=self.last, until=update_id
+                    )
+
+            self.last = max(update_id, self.last or update_id)
+            self.condition.notify_all()
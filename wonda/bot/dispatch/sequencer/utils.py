@@ -0,0 +1,43 @@
+class UpdateWindow:
+    """
+    Remembers which of the latest `size` update identifiers were seen,
+    using a single bit for each. Identifiers just below the window are
+    considered seen, since they're too old to be handled anyway. Ones far
+    below it start the window over, since Telegram starts identifiers
+    over after the bot has been idle for long.
+    """
+
+    def __init__(self, size: int = 4096) -> None:
+        assert size > 0, "Window should fit at least one update"
+
+        self.size = size
+        self.base, self.bits = 0, 0
+
+    def add(self, update_id: int) -> bool:
+        """
+        Marks an identifier as seen. Returns `False` if it already was.
+        """
+        if update_id < self.base - self.size:
+            self.base, self.bits = max(0, update_id - self.size + 1), 0
+        elif update_id < self.base:
+            return False
+
+        # Slide the window forward, forgetting the oldest identifiers
+        if (shift := update_id - self.size + 1 - self.base) > 0:
+            self.bits >>= shift
+            self.base += shift
+
+        bit = 1 << (update_id - self.base)
+
+        if self.bits & bit:
+            return False
+
+        self.bits |= bit
+        return True
+
+    def __contains__(self, update_id: int) -> bool:
+        if update_id < self.base - self.size:
+            return False
+        if update_id < self.base:
+            return True
+        return bool(self.bits >> (update_id - self.base) & 1)
@@ -32,6 +32,10 @@ class ABCView(ABC, Generic[T]):
     middleware: list["ABCMiddleware[T]"]
     auto_rules: list["ABCRule[T]"]
 
+    # Update types handled by the view. Routers give views which set it
+    # only updates of these types, without calling their filter first
+    matches: list[str] | None = None
+
     def __init__(self) -> None:
         self.handlers, self.middleware, self.auto_rules = [], [], []
 
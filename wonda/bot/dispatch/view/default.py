@@ -1,9 +1,16 @@
 from typing_extensions import TYPE_CHECKING, Any, TypeVar
 
-from wonda.bot.dispatch.handler import ABCHandler
+from wonda.bot.dispatch.handler import ABCHandler, FuncHandler
 from wonda.bot.dispatch.middleware.abc import ABCMiddleware
 from wonda.bot.dispatch.view.abc import ABCView
-from wonda.bot.dispatch.view.utils import get_update_model, get_update_type
+from wonda.bot.dispatch.view.utils import (
+    build_command_index,
+    get_text_rules,
+    get_update_model,
+)
+from wonda.bot.rules.abc import ABCRule, ABCTextRule
+from wonda.bot.rules.compiler import TextIndex, compile_rules, rule_results
+from wonda.bot.rules.message import get_command
 from wonda.bot.updates.base import BaseUpdate
 from wonda.modules import logger
 
@@ -18,30 +25,92 @@ T = TypeVar("T", bound="BaseUpdate")
 
 
 class DefaultView(ABCView[T]):
+    matches: list[str]
+
     def __init__(self, model: type[T], matches: str | list[str]):
         matches = [matches] if isinstance(matches, str) else matches
         self.model, self.matches = model, matches
+        self.compiled = False
+        self.command_index: dict[tuple[str, str], list[ABCHandler[T]]] = {}
+        self.fallback: list[ABCHandler[T]] = []
+        self.text_index: TextIndex | None = None
+        self.text_rules: dict[ABCHandler[T], frozenset[ABCTextRule[T]]] = {}
         super().__init__()
 
     def register_handler(self, handler: "ABCHandler[T]") -> None:
-        assert isinstance(
-            handler, ABCHandler
-        ), "Handler should be an instance of ABCHandler"
+        assert isinstance(handler, ABCHandler), (
+            "Handler should be an instance of ABCHandler"
+        )
         self.handlers.append(handler)
+        self.compiled = False
 
     def register_middleware(self, middleware: "ABCMiddleware[T]") -> None:
-        assert isinstance(
-            middleware, ABCMiddleware
-        ), "Middleware should be an instance of ABCMiddleware"
+        assert isinstance(middleware, ABCMiddleware), (
+            "Middleware should be an instance of ABCMiddleware"
+        )
         self.middleware.append(middleware)
 
     def load(self, view: "ABCView[T]") -> None:
         self.middleware.extend(view.middleware)
         self.auto_rules.extend(view.auto_rules)
         self.handlers.extend(view.handlers)
+        self.compiled = False
+
+    def compile(self) -> None:
+        """
+        Compiles rules of all handlers together, so rules they have
+        in common are checked once per update, and indexes handlers
+        by commands and texts, so only handlers which can match are checked.
+        """
+        func_handlers = [h for h in self.handlers if isinstance(h, FuncHandler)]
+        compiled: list[list[ABCRule[T]]] = compile_rules(
+            [h.rules for h in func_handlers]
+        )
+
+        for func_handler, rules in zip(func_handlers, compiled):
+            func_handler.rules = rules
+
+        self.command_index, self.fallback = build_command_index(self.handlers)
+        self.text_index, self.text_rules = None, {}
+
+        for handler in self.handlers:
+            if indexed := get_text_rules(handler):
+                self.text_index = indexed[0].index
+                self.text_rules[handler] = frozenset(r.rule for r in indexed)
+        self.compiled = True
+
+    def get_handlers(self, upd: T) -> list["ABCHandler[T]"]:
+        handlers = self.handlers
+
+        if self.command_index:
+            if (command := get_command(upd)) is None:  # type: ignore
+                handlers = self.fallback
+            else:
+                prefix, alias, *_ = command
+                handlers = self.command_index.get((prefix, alias), self.fallback)
+
+        if self.text_index is None:
+            return handlers
+
+        # Text rules of all handlers are checked at once,
+        # so handlers with unmatched texts are skipped
+        found = self.text_index.find(upd).keys()
+        return [
+            handler
+            for handler in handlers
+            if (rules := self.text_rules.get(handler)) is None or rules <= found
+        ]
+
+    def get_update_type(self, update: "Update") -> str | None:
+        # Only a few fields have to be checked, since the type
+        # of the update must be one of those the view matches
+        for update_type in self.matches:
+            if getattr(update, update_type, None) is not None:
+                return update_type
+        return None
 
     async def filter(self, update: "Update") -> bool:
-        return get_update_type(update) in self.matches
+        return self.get_update_type(update) is not None
 
     async def handle(
         self, update: "Update", ctx_api: "ABCAPI", state_manager: "ABCBaseStateManager"
@@ -49,31 +118,41 @@ class DefaultView(ABCView[T]):
         ctx: dict[str, _] = {}
         responses: list[_] = []
 
-        upd = get_update_model(update, self.model)
-        upd.untyped_ctx_api, upd.state_repr = ctx_api, await state_manager.get(
-            upd.get_state_key()
+        upd = get_update_model(update, self.model, self.get_update_type(update))
+        upd.untyped_ctx_api, upd.state_repr = (
+            ctx_api,
+            await state_manager.get(upd.get_state_key()),
         )
 
-        for middleware in self.middleware:
-            result = await middleware.pre(upd, ctx)
+        if not self.compiled:
+            self.compile()
 
-            if result is False:
-                return
+        # Rules shared between handlers are checked once for the update
+        token = rule_results.set({})
 
-        for handler in self.handlers:
-            result = await handler.filter(upd, ctx)
+        try:
+            for middleware in self.middleware:
+                result = await middleware.pre(upd, ctx)
+
+                if result is False:
+                    return
+
+            for handler in self.get_handlers(upd):
+                result = await handler.filter(upd, ctx)
 
-            if result is False:
-                continue
+                if result is False:
+                    continue
 
-            response = await handler.handle(upd, ctx)
-            responses.append(response)
+                response = await handler.handle(upd, ctx)
+                responses.append(response)
 
-            if handler.blocking:
-                break
+                if handler.blocking:
+                    break
 
-        for middleware in self.middleware:
-            await middleware.post(upd, ctx, responses)
+            for middleware in self.middleware:
+                await middleware.post(upd, ctx, responses)
+        finally:
+            rule_results.reset(token)
 
         await logger.ainfo("Handled", update_id=update.update_id, view=self)
 
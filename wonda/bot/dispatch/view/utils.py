@@ -1,5 +1,7 @@
-from typing import TypeVar
+from typing import Iterable, Iterator, TypeVar
 
+from wonda.bot.dispatch.handler import ABCHandler, FuncHandler
+from wonda.bot.rules import ABCRule, AndRule, Command, IndexedRule, SharedRule
 from wonda.bot.updates.base import BaseUpdate
 from wonda.types.objects import Update
 
@@ -15,6 +17,88 @@ def get_update_type(update: "Update") -> str:
     return ""
 
 
-def get_update_model(update: Update, model: type[T]) -> T:
-    specific_update = getattr(update, get_update_type(update))
+def get_update_model(
+    update: Update, model: type[T], update_type: str | None = None
+) -> T:
+    specific_update = getattr(update, update_type or get_update_type(update))
+
+    # Updates decoded as `TypedUpdate` already hold the model
+    if isinstance(specific_update, model):
+        return specific_update
     return model(**specific_update.as_dict())
+
+
+def get_required_rules(rules: Iterable[ABCRule]) -> Iterator[ABCRule]:
+    """
+    Finds rules which have to succeed for the given ones to succeed,
+    looking into shared rules and rules combined with `&`.
+    """
+    for rule in rules:
+        if isinstance(rule, SharedRule):
+            yield from get_required_rules([rule.rule])
+        elif isinstance(rule, AndRule):
+            yield from get_required_rules(rule.rules)
+        else:
+            yield rule
+
+
+def get_command_keys(handler: ABCHandler) -> set[tuple[str, str]] | None:
+    """
+    Finds prefixes and aliases of commands the handler requires, so it can
+    be found by the command of the message. Returns None when the handler
+    doesn't require a particular command.
+    """
+    if not isinstance(handler, FuncHandler):
+        return None
+
+    keys: set[tuple[str, str]] | None = None
+
+    for rule in get_required_rules(handler.rules):
+        if isinstance(rule, Command):
+            # Every command the handler requires has to match,
+            # so only commands satisfying all of them are kept
+            found = {(p, a) for p in rule.prefixes for a in rule.aliases}
+            keys = found if keys is None else keys & found
+
+    return keys
+
+
+def get_text_rules(handler: ABCHandler) -> list[IndexedRule]:
+    """
+    Finds indexed text rules the handler requires, so the handler
+    can be skipped when the text of the update doesn't match them.
+    """
+    if not isinstance(handler, FuncHandler):
+        return []
+
+    return [
+        rule
+        for rule in get_required_rules(handler.rules)
+        if isinstance(rule, IndexedRule)
+    ]
+
+
+def build_command_index(
+    handlers: list[ABCHandler],
+) -> tuple[dict[tuple[str, str], list[ABCHandler]], list[ABCHandler]]:
+    """
+    Groups handlers by commands they require. Handlers which don't require
+    a command are included in each group, keeping the order they were
+    registered in, and are also returned separately for other messages.
+    """
+    index: dict[tuple[str, str], list[ABCHandler]] = {}
+    fallback: list[ABCHandler] = []
+
+    for handler in handlers:
+        if (keys := get_command_keys(handler)) is None:
+            fallback.append(handler)
+            for group in index.values():
+                group.append(handler)
+            continue
+
+        for key in keys:
+            if key not in index:
+                index[key] = fallback.copy()
+            index[key].append(handler)
+
+    return index, fallback
@@ -3,3 +3,4 @@ from wonda.contrib.rules import *
 from .abc import *
 from .generic import *
 from .message import *
+from .compiler import *
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar
+from typing import Generic, Hashable, TypeVar
 
 T = TypeVar("T")
 
@@ -9,6 +9,16 @@ class ABCRule(ABC, Generic[T]):
     async def check(self, upd: T, ctx: dict) -> bool:
         pass
 
+    @property
+    def key(self) -> Hashable | None:
+        """
+        Identifies the check the rule makes. Rules with equal keys must give
+        the same result for the same update without reading the context,
+        so their result can be shared between handlers. Rules without
+        a key are checked every time.
+        """
+        return None
+
     def __and__(self, other: "ABCRule[T]") -> "AndRule[T]":
         return AndRule(self, other)
 
@@ -22,10 +32,68 @@ class ABCRule(ABC, Generic[T]):
         return self.__class__.__name__
 
 
+class ABCTextRule(ABCRule[T]):
+    """
+    Base for rules which check the text of the update. Text rules
+    of a view are checked together for all handlers using a text index.
+    """
+
+    sources = (
+        "text",
+        "caption",
+        "data",
+        "query",
+        "question",
+        "invoice_payload",
+        "paid_media_payload",
+    )
+
+    @property
+    def prefixes(self) -> tuple[str, ...]:
+        """
+        Literal prefixes texts matched by the rule start with.
+        An empty prefix means the rule can match any text.
+        """
+        return ("",)
+
+    @abstractmethod
+    def search(self, text: str) -> dict | None:
+        """
+        Checks the text and returns the context it produced
+        when it's matched, or None otherwise.
+        """
+        pass
+
+    async def check(self, upd: T, ctx: dict) -> bool:
+        if not (text := self.get_text(upd)):
+            return False
+
+        if (delta := self.search(text)) is None:
+            return False
+
+        ctx |= delta
+        return True
+
+    @classmethod
+    def get_text(cls, upd: T) -> str | None:
+        for src in cls.sources:
+            if text := getattr(upd, src, None):
+                return text
+        return None
+
+
 class ABCCompositeRule(ABCRule[T]):
     def __init__(self, *rules: ABCRule[T]) -> None:
         self.rules = rules
 
+    @property
+    def key(self) -> Hashable | None:
+        keys = tuple(rule.key for rule in self.rules)
+
+        if None in keys:
+            return None
+        return self.__class__, keys
+
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}({', '.join(repr(i) for i in self.rules)})"
 
@@ -38,6 +106,12 @@ class NotRule(ABCRule[T]):
     def __init__(self, rule: ABCRule[T]) -> None:
         self.rule = rule
 
+    @property
+    def key(self) -> Hashable | None:
+        if (key := self.rule.key) is None:
+            return None
+        return self.__class__, key
+
     async def check(self, upd: T, ctx: dict) -> bool:
         ctx_copy = ctx.copy()
         return not await self.rule.check(upd, ctx_copy)
@@ -78,4 +152,4 @@ class OrRule(ABCCompositeRule[T]):
         return False
 
 
-__all__ = ("ABCRule", "AndRule", "NotRule", "OrRule")
+__all__ = ("ABCRule", "ABCTextRule", "AndRule", "NotRule", "OrRule")
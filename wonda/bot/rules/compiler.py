@@ -0,0 +1,293 @@
+from collections import Counter
+from contextvars import ContextVar
+from typing import Any, Callable, Hashable, Iterator, TypeVar
+
+from wonda.bot.rules.abc import ABCRule, ABCTextRule, AndRule, NotRule, OrRule
+from wonda.bot.rules.generic import Regex, Text
+from wonda.contrib.rules import Match
+
+T = TypeVar("T")
+Results = dict[Hashable, Any]
+
+# Results of shared rules checked while the current update is handled
+rule_results: ContextVar[Results | None] = ContextVar("rule_results", default=None)
+
+
+class SharedRule(ABCRule[T]):
+    """
+    Wraps a rule to check it once per update. Its result and the context
+    it produced are reused by every handler which has an equal rule.
+    """
+
+    def __init__(self, rule: ABCRule[T]) -> None:
+        self.rule = rule
+        self.cache_key = rule.key
+
+    @property
+    def key(self) -> Hashable | None:
+        return self.cache_key
+
+    async def check(self, upd: T, ctx: dict) -> Any:
+        results = rule_results.get()
+
+        if results is None:
+            return await self.rule.check(upd, ctx)
+
+        if (cached := results.get(self.cache_key)) is None:
+            delta: dict = {}
+            cached = results[self.cache_key] = await self.rule.check(upd, delta), delta
+
+        result, delta = cached
+
+        if result:
+            ctx |= delta
+        return result
+
+    def __repr__(self) -> str:
+        return repr(self.rule)
+
+
+class TrieNode:
+    def __init__(self) -> None:
+        self.children: dict[str, TrieNode] = {}
+        self.rules: list[ABCTextRule] = []
+
+    def insert(self, prefix: str, rule: ABCTextRule) -> None:
+        node = self
+
+        for char in prefix:
+            node = node.children.setdefault(char, TrieNode())
+
+        node.rules.append(rule)
+
+    def find(self, text: str) -> Iterator[ABCTextRule]:
+        node: TrieNode | None = self
+
+        for char in text:
+            yield from node.rules  # type: ignore
+
+            if (node := node.children.get(char)) is None:  # type: ignore
+                return
+
+        yield from node.rules  # type: ignore
+
+
+class TextIndex:
+    """
+    Finds text rules of all handlers the text of an update matches in one
+    pass. Texts are looked up in hash tables, and patterns are only checked
+    when the text starts with their literal prefix, which is found in a trie.
+    """
+
+    def __init__(self) -> None:
+        self.texts: dict[str, list[ABCTextRule]] = {}
+        self.lowered_texts: dict[str, list[ABCTextRule]] = {}
+        self.trie = TrieNode()
+        self.rules: set[ABCTextRule] = set()
+        self.get_text: Callable[[Any], str | None] = ABCTextRule.get_text
+
+    def add(self, rule: ABCTextRule) -> None:
+        # Only rules which read the text the same way are indexed together
+        self.rules.add(rule)
+        self.get_text = rule.get_text
+
+        if isinstance(rule, Text):
+            table = self.lowered_texts if rule.ignore_case else self.texts
+
+            for text in rule.texts:
+                table.setdefault(text, []).append(rule)
+        else:
+            for prefix in set(rule.prefixes):
+                self.trie.insert(prefix, rule)
+
+    def find(self, upd: Any) -> dict[ABCTextRule, dict]:
+        """
+        Finds text rules the update matches, once per update.
+        """
+        results = rule_results.get()
+
+        if results is None:
+            return self.search(upd)
+
+        if (found := results.get(self)) is None:
+            found = results[self] = self.search(upd)
+        return found
+
+    def search(self, upd: Any) -> dict[ABCTextRule, dict]:
+        if not (text := self.get_text(upd)):
+            return {}
+
+        found: dict[ABCTextRule, dict] = {}
+
+        for rule in self.texts.get(text, ()):
+            found[rule] = {}
+
+        for rule in self.lowered_texts.get(text.lower(), ()):
+            found[rule] = {}
+
+        checked: set[ABCTextRule] = set()
+
+        for rule in self.trie.find(text):
+            if rule in checked:
+                continue
+
+            checked.add(rule)
+
+            if (delta := rule.search(text)) is not None:
+                found[rule] = delta
+
+        return found
+
+
+class IndexedRule(ABCRule[T]):
+    """
+    Wraps a text rule to take its result from the text index,
+    which checks all text rules of the view at once.
+    """
+
+    def __init__(self, rule: ABCTextRule[T], index: TextIndex) -> None:
+        self.rule, self.index = rule, index
+
+    @property
+    def key(self) -> Hashable | None:
+        return self.rule.key
+
+    async def check(self, upd: T, ctx: dict) -> bool:
+        if (delta := self.index.find(upd).get(self.rule)) is None:
+            return False
+
+        ctx |= delta
+        return True
+
+    def __repr__(self) -> str:
+        return repr(self.rule)
+
+
+def compile_rules(groups: list[list[ABCRule[T]]]) -> list[list[ABCRule[T]]]:
+    """
+    Flattens nested composite rules of each group and makes rules which
+    appear more than once share a single instance, so they're checked
+    once per update. Rules which appear once are left as they are,
+    since sharing them would only add overhead.
+    """
+    groups = [[flatten_rule(rule) for rule in rules] for rules in groups]
+    counter: Counter[Hashable] = Counter()
+
+    for rules in groups:
+        for rule in rules:
+            count_rule_keys(rule, counter)
+
+    shared: dict[Hashable, SharedRule[T]] = {}
+    groups = [[share_rule(rule, counter, shared) for rule in rules] for rules in groups]
+
+    # Text rules are indexed when there are several of them,
+    # otherwise they're checked faster on their own
+    text_rules = {
+        id(r): r
+        for rules in groups
+        for rule in rules
+        for r in find_text_rules(rule)
+        if is_indexable(r)
+    }
+
+    if len(text_rules) < 2:
+        return groups
+
+    index = TextIndex()
+
+    for rule in text_rules.values():
+        index.add(rule)
+
+    return [[index_rule(rule, index) for rule in rules] for rules in groups]
+
+
+def flatten_rule(rule: ABCRule[T]) -> ABCRule[T]:
+    if isinstance(rule, (SharedRule, IndexedRule)):
+        return flatten_rule(rule.rule)
+
+    if isinstance(rule, NotRule):
+        return NotRule(flatten_rule(rule.rule))
+
+    if isinstance(rule, (AndRule, OrRule)):
+        rules: list[ABCRule[T]] = []
+
+        for r in map(flatten_rule, rule.rules):
+            # Rules nested in the rule of the same kind are checked
+            # the same way when they're lifted into the outer one
+            if type(r) is type(rule):
+                rules.extend(r.rules)  # type: ignore
+            else:
+                rules.append(r)
+
+        return rule.__class__(*rules)
+
+    return rule
+
+
+def count_rule_keys(rule: ABCRule[T], counter: Counter[Hashable]) -> None:
+    if (key := rule.key) is not None:
+        counter[key] += 1
+
+    if isinstance(rule, NotRule):
+        count_rule_keys(rule.rule, counter)
+    elif isinstance(rule, (AndRule, OrRule)):
+        for r in rule.rules:
+            count_rule_keys(r, counter)
+
+
+def share_rule(
+    rule: ABCRule[T], counter: Counter[Hashable], shared: dict[Hashable, SharedRule[T]]
+) -> ABCRule[T]:
+    key = rule.key
+
+    if key is not None and key in shared:
+        return shared[key]
+
+    if isinstance(rule, NotRule):
+        rule = NotRule(share_rule(rule.rule, counter, shared))
+    elif isinstance(rule, (AndRule, OrRule)):
+        rule = rule.__class__(*(share_rule(r, counter, shared) for r in rule.rules))
+
+    if key is None or counter[key] < 2:
+        return rule
+
+    shared[key] = SharedRule(rule)
+    return shared[key]
+
+
+def find_text_rules(rule: ABCRule[T]) -> Iterator[ABCTextRule[T]]:
+    if isinstance(rule, ABCTextRule):
+        yield rule
+    elif isinstance(rule, (SharedRule, NotRule)):
+        yield from find_text_rules(rule.rule)
+    elif isinstance(rule, (AndRule, OrRule)):
+        for r in rule.rules:
+            yield from find_text_rules(r)
+
+
+def is_indexable(rule: ABCTextRule[T]) -> bool:
+    # The index compares texts itself, so subclasses of the built-in rules,
+    # which may check them differently, are always checked on their own
+    return type(rule) in (Text, Regex, Match) and rule.sources == ABCTextRule.sources
+
+
+def index_rule(rule: ABCRule[T], index: TextIndex) -> ABCRule[T]:
+    if isinstance(rule, ABCTextRule) and rule in index.rules:
+        return IndexedRule(rule, index)
+
+    if isinstance(rule, SharedRule):
+        # Shared rules may appear several times, but only need wrapping once
+        if not isinstance(rule.rule, IndexedRule):
+            rule.rule = index_rule(rule.rule, index)
+        return rule
+
+    if isinstance(rule, NotRule):
+        return NotRule(index_rule(rule.rule, index))
+
+    if isinstance(rule, (AndRule, OrRule)):
+        return rule.__class__(*(index_rule(r, index) for r in rule.rules))
+
+    return rule
+
+
+__all__ = ("IndexedRule", "SharedRule", "TextIndex", "compile_rules")
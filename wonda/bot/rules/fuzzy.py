@@ -0,0 +1,113 @@
+from collections import Counter
+from typing import Iterable
+
+# Length of n-grams phrases are indexed by
+N = 3
+
+
+def get_ngrams(text: str) -> Counter[str]:
+    # Text is padded, so short texts still have n-grams
+    # and their first and last characters count as much
+    padded = "\x00" * (N - 1) + text + "\x00" * (N - 1)
+    return Counter(padded[i : i + N] for i in range(len(padded) - N + 1))
+
+
+def get_distance(a: str, b: str, limit: int) -> int | None:
+    """
+    Counts the edits needed to turn one text into another. Stops as soon as
+    the count is known to exceed the limit, in which case returns None.
+    """
+    if len(a) > len(b):
+        a, b = b, a
+
+    if len(b) - len(a) > limit:
+        return None
+
+    over = limit + 1
+    previous = list(range(len(a) + 1))
+
+    for i, char in enumerate(b, 1):
+        # Cells further than the limit from the diagonal can't lead
+        # to a distance within the limit, so they aren't computed
+        start, end = max(1, i - limit), min(len(a), i + limit)
+        current = [over] * (len(a) + 1)
+        current[0] = i if i <= limit else over
+
+        for j in range(start, end + 1):
+            current[j] = min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (a[j - 1] != char),
+            )
+
+        if min(current) > limit:
+            return None
+
+        previous = current
+
+    return previous[-1] if previous[-1] <= limit else None
+
+
+def get_ratio(a: str, b: str) -> float:
+    longest = max(len(a), len(b))
+
+    if not longest:
+        return 1.0
+    return 1 - get_distance(a, b, longest) / longest  # type: ignore
+
+
+class FuzzyIndex:
+    """
+    Finds the phrase closest to the text. Phrases are indexed by their
+    n-grams, so only those sharing enough of them with the text are
+    compared, and comparisons stop once they can't beat the best match.
+    """
+
+    def __init__(self, phrases: Iterable[str]) -> None:
+        self.phrases = list(dict.fromkeys(phrases))
+        self.exact = frozenset(self.phrases)
+        self.ngrams: dict[str, list[tuple[int, int]]] = {}
+
+        for i, phrase in enumerate(self.phrases):
+            for ngram, count in get_ngrams(phrase).items():
+                self.ngrams.setdefault(ngram, []).append((i, count))
+
+    def search(self, text: str, min_ratio: float) -> tuple[str, float] | None:
+        """
+        Returns the phrase closest to the text and their similarity ratio,
+        if it's at least the given one.
+        """
+        if text in self.exact:
+            return text, 1.0
+
+        common: Counter[int] = Counter()
+
+        for ngram, count in get_ngrams(text).items():
+            for i, phrase_count in self.ngrams.get(ngram, ()):
+                common[i] += min(count, phrase_count)
+
+        # A single edit changes at most N n-grams, so phrases sharing none
+        # of them with the text can only match when the ratio is low enough
+        candidates = common.most_common()
+        if min_ratio < (N - 1) / N:
+            candidates += [(i, 0) for i in range(len(self.phrases)) if i not in common]
+
+        best: tuple[str, float] | None = None
+
+        for i, shared in candidates:
+            phrase = self.phrases[i]
+            longest = max(len(text), len(phrase))
+            limit = int((1 - min_ratio) * longest + 1e-9)
+
+            if shared < longest + N - 1 - limit * N:
+                continue
+
+            if (distance := get_distance(text, phrase, limit)) is None:
+                continue
+
+            ratio = 1 - distance / longest
+
+            if best is None or ratio > best[1]:
+                best, min_ratio = (phrase, ratio), ratio
+
+        return best
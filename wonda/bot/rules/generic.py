@@ -1,9 +1,9 @@
 from asyncio import iscoroutinefunction
 from functools import reduce
-from re import Pattern, compile, match
-from typing import Any, Callable, TypeVar
+from re import IGNORECASE, VERBOSE, Pattern, compile
+from typing import Any, Callable, Hashable, TypeVar
 
-from wonda.bot.rules.abc import ABCRule
+from wonda.bot.rules.abc import ABCRule, ABCTextRule
 from wonda.bot.states.types import BaseStateGroup, get_state_repr
 from wonda.bot.updates import BaseUpdate
 
@@ -34,6 +34,10 @@ class Has(ABCRule[T]):
     def __init__(self, *attr_names: str) -> None:
         self.attr_names = attr_names
 
+    @property
+    def key(self) -> Hashable:
+        return self.__class__, self.attr_names
+
     async def check(self, upd: T, _) -> bool:
         try:
             return all(
@@ -43,7 +47,7 @@ class Has(ABCRule[T]):
             return False
 
 
-class Regex(ABCRule[T]):
+class Regex(ABCTextRule[T]):
     """
     Validates text of the update against regex patterns.
     """
@@ -51,35 +55,29 @@ class Regex(ABCRule[T]):
     def __init__(self, *expr: Pattern | str) -> None:
         self.expr = tuple(compile(e) if isinstance(e, str) else e for e in expr)
 
-    async def check(self, upd: T, ctx: dict) -> bool:
-        if not any(
-            text := getattr(upd, src, "")
-            for src in (
-                "text",
-                "caption",
-                "data",
-                "query",
-                "question",
-                "invoice_payload",
-                "paid_media_payload",
-            )
-        ):
-            return False
+    @property
+    def key(self) -> Hashable:
+        return self.__class__, self.expr
 
-        for e in self.expr:
-            response = match(e, text)
+    @property
+    def prefixes(self) -> tuple[str, ...]:
+        return tuple(
+            get_literal_prefix(e.pattern, e.flags) if isinstance(e.pattern, str) else ""
+            for e in self.expr
+        )
 
-            if response is None:
-                return False
+    def search(self, text: str) -> dict | None:
+        for e in self.expr:
+            if (response := e.match(text)) is None:
+                continue
 
             if matches := response.groupdict():
-                ctx |= matches
+                return matches
             elif matches := response.group() or response.groups():
-                ctx |= {"matches": tuple(matches)}
-
-            return True
+                return {"matches": tuple(matches)}
+            return {}
 
-        return False
+        return None
 
 
 class State(ABCRule[T]):
@@ -90,6 +88,10 @@ class State(ABCRule[T]):
     def __init__(self, *states: BaseStateGroup) -> None:
         self.states = tuple(get_state_repr(s) for s in states)
 
+    @property
+    def key(self) -> Hashable:
+        return self.__class__, self.states
+
     async def check(self, upd: T, _) -> bool:
         if upd.state_repr is None:
             return not bool(self.states)
@@ -106,6 +108,10 @@ class StateGroup(ABCRule[T]):
     def __init__(self, *groups: type[BaseStateGroup]) -> None:
         self.groups = tuple(g.__name__ for g in groups)
 
+    @property
+    def key(self) -> Hashable:
+        return self.__class__, self.groups
+
     async def check(self, upd: T, _) -> bool:
         if upd.state_repr is None:
             return not self.groups
@@ -114,7 +120,7 @@ class StateGroup(ABCRule[T]):
         return group in self.groups
 
 
-class Text(ABCRule[T]):
+class Text(ABCTextRule[T]):
     """
     Checks if the text of the update matches one of the of the given texts.
     """
@@ -123,22 +129,36 @@ class Text(ABCRule[T]):
         self.ignore_case = ignore_case
         self.texts = texts if not ignore_case else tuple(map(str.lower, texts))
 
-    async def check(self, upd: T, _) -> bool:
-        if not any(
-            text := getattr(upd, src, "")
-            for src in (
-                "text",
-                "caption",
-                "data",
-                "query",
-                "question",
-                "invoice_payload",
-                "paid_media_payload",
-            )
-        ):
-            return False
+    @property
+    def key(self) -> Hashable:
+        return self.__class__, self.texts, self.ignore_case
+
+    def search(self, text: str) -> dict | None:
+        if (text if not self.ignore_case else text.lower()) in self.texts:
+            return {}
+        return None
+
+
+def get_literal_prefix(source: str, flags: int = 0, stop: str = "") -> str:
+    """
+    Finds the literal text every string matched by the pattern starts with.
+    The prefix may be shorter than it could be, but never too long.
+    """
+    if flags & (IGNORECASE | VERBOSE) or "|" in source:
+        return ""
+
+    prefix = ""
+
+    for char in source.removeprefix("^"):
+        if char in ".^$*+?{}[]()\\" + stop:
+            # A quantifier can make the last character optional
+            if char in "*?{":
+                prefix = prefix[:-1]
+            break
+
+        prefix += char
 
-        return (text if not self.ignore_case else text.lower()) in self.texts
+    return prefix
 
 
 __all__ = ("Function", "Has", "Regex", "State", "StateGroup", "Text")
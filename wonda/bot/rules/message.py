@@ -1,36 +1,78 @@
-from difflib import SequenceMatcher
-from typing import Iterable
+from typing import ClassVar, Hashable, Iterable
 
 from wonda.bot.rules.abc import ABCRule
+from wonda.bot.rules.compiler import rule_results
+from wonda.bot.rules.fuzzy import FuzzyIndex, get_ratio
 from wonda.bot.updates import MessageUpdate
 from wonda.types.enums import ChatType
 
+Parsed = tuple[str, str, str, list[str]]
+
+
+def get_command(m: MessageUpdate) -> Parsed | None:
+    """
+    Parses the command the message starts with into its prefix, name,
+    the username of the bot it's addressed to and arguments. The result
+    is shared by all rules checked while the update is handled.
+    """
+    results = rule_results.get()
+
+    if results is not None and get_command in results:
+        return results[get_command]
+
+    text = m.text or m.caption
+    command = Command.parse_cmd(text) if text and not text.isspace() else None
+
+    if results is not None:
+        results[get_command] = command
+    return command
+
 
 class Command(ABCRule[MessageUpdate]):
     """
     Checks if the message contains a command. When the command is found,
-    its arguments get stored in the `args` context field.
+    its arguments get stored in the `args` context field. Commands which
+    are addressed to other bots with `@username` are ignored.
     """
 
+    # Usernames of bots by their tokens, requested
+    # once a command with a username is received
+    usernames: ClassVar[dict[str, str]] = {}
+
     def __init__(self, *aliases: str, prefixes: Iterable[str] = ("/",)) -> None:
         self.aliases, self.prefixes = aliases, prefixes
 
-    async def check(self, m: MessageUpdate, ctx: dict) -> bool:
-        alias = m.text or m.caption
+    @property
+    def key(self) -> Hashable:
+        return self.__class__, self.aliases, tuple(self.prefixes)
 
-        if not alias:
+    async def check(self, m: MessageUpdate, ctx: dict) -> bool:
+        if (command := get_command(m)) is None:
             return False
 
-        prefix, text, _, args = self.parse_cmd(alias)
+        prefix, text, tag, args = command
 
         if prefix not in self.prefixes or text not in self.aliases:
             return False
 
+        if tag and tag.lower() != (await self.get_username(m)).lower():
+            return False
+
         ctx["args"] = args
         return True
 
+    @classmethod
+    async def get_username(cls, m: MessageUpdate) -> str:
+        token = m.ctx_api.token
+
+        if token not in cls.usernames:
+            me = await m.ctx_api.get_me()
+            cls.usernames[token] = me.username or ""
+
+        return cls.usernames[token]
+
     @staticmethod
-    def parse_cmd(text: str) -> tuple[str, str, str, list[str]]:
+    def parse_cmd(text: str) -> Parsed:
         head, *tail = text.split()
         pfx, (cmd, _, tag) = head[0], head[1:].partition("@")
         return pfx, cmd, tag, tail
@@ -45,6 +87,10 @@ class From(ABCRule[MessageUpdate]):
     def __init__(self, *chats: int | str) -> None:
         self.chats = set(chats)
 
+    @property
+    def key(self) -> Hashable:
+        return self.__class__, frozenset(self.chats)
+
     async def check(self, m: MessageUpdate, _) -> bool:
         return m.chat.id in self.chats or m.chat.username in self.chats
 
@@ -54,6 +100,10 @@ class FromChannel(ABCRule[MessageUpdate]):
     Checks if the message was sent in a channel.
     """
 
+    @property
+    def key(self) -> Hashable:
+        return self.__class__
+
     async def check(self, m: MessageUpdate, _) -> bool:
         return m.chat.type == ChatType.CHANNEL
 
@@ -63,6 +113,10 @@ class FromGroup(ABCRule[MessageUpdate]):
     Checks if the message was sent in a group.
     """
 
+    @property
+    def key(self) -> Hashable:
+        return self.__class__
+
     async def check(self, m: MessageUpdate, _) -> bool:
         return m.chat.type in (ChatType.GROUP, ChatType.SUPERGROUP)
 
@@ -72,6 +126,10 @@ class FromTopic(ABCRule[MessageUpdate]):
     Checks if the message was sent in a forum topic.
     """
 
+    @property
+    def key(self) -> Hashable:
+        return self.__class__
+
     async def check(self, m: MessageUpdate, _) -> bool:
         return bool(m.message_thread_id)
 
@@ -79,25 +137,34 @@ class FromTopic(ABCRule[MessageUpdate]):
 class Fuzzy(ABCRule[MessageUpdate]):
     """
     Checks if the message text compares closely with one of the given strings.
+    The closest string and its similarity ratio get stored in the `closest`
+    and `ratio` context fields.
     """
 
     def __init__(self, *texts: str, min_ratio: float = 0.7) -> None:
         self.texts = texts
         self.min_ratio = min_ratio
+        self.index = FuzzyIndex(texts)
 
-    async def check(self, m: MessageUpdate, _) -> bool:
+    @property
+    def key(self) -> Hashable:
+        return self.__class__, self.texts, self.min_ratio
+
+    async def check(self, m: MessageUpdate, ctx: dict) -> bool:
         text = m.text or m.caption
 
         if not text:
             return False
 
-        closest = max(self.get_string_similarity_ratio(t, text) for t in self.texts)
-        return closest >= self.min_ratio
+        if (closest := self.index.search(text, self.min_ratio)) is None:
+            return False
+
+        ctx["closest"], ctx["ratio"] = closest
+        return True
 
     @staticmethod
     def get_string_similarity_ratio(a: str, b: str) -> float:
-        sequence_matcher = SequenceMatcher(isjunk=None, a=a, b=b)
-        return sequence_matcher.ratio()
+        return get_ratio(a, b)
 
 
 class HasMediaSpoiler(ABCRule[MessageUpdate]):
@@ -105,6 +172,10 @@ class HasMediaSpoiler(ABCRule[MessageUpdate]):
     Checks if the message has media that was marked with a spoiler.
     """
 
+    @property
+    def key(self) -> Hashable:
+        return self.__class__
+
     async def check(self, m: MessageUpdate, _) -> bool:
         return bool(m.has_media_spoiler)
 
@@ -114,6 +185,10 @@ class HasProtectedContent(ABCRule[MessageUpdate]):
     Checks if the message has protected content and can't be forwarded.
     """
 
+    @property
+    def key(self) -> Hashable:
+        return self.__class__
+
     async def check(self, m: MessageUpdate, _) -> bool:
         return bool(m.has_protected_content)
 
@@ -124,6 +199,10 @@ class IsAutomaticForward(ABCRule[MessageUpdate]):
     the connected discussion group.
     """
 
+    @property
+    def key(self) -> Hashable:
+        return self.__class__
+
     async def check(self, m: MessageUpdate, _) -> bool:
         return bool(m.is_automatic_forward)
 
@@ -133,6 +212,10 @@ class IsForward(ABCRule[MessageUpdate]):
     Checks if the message was forwarded.
     """
 
+    @property
+    def key(self) -> Hashable:
+        return self.__class__
+
     async def check(self, m: MessageUpdate, _) -> bool:
         return bool(m.forward_origin)
 
@@ -142,6 +225,10 @@ class IsReply(ABCRule[MessageUpdate]):
     Checks if the message is a reply.
     """
 
+    @property
+    def key(self) -> Hashable:
+        return self.__class__
+
     async def check(self, m: MessageUpdate, _) -> bool:
         return bool(m.reply_to_message)
 
@@ -151,6 +238,10 @@ class IsPrivate(ABCRule[MessageUpdate]):
     Checks if the message is private.
     """
 
+    @property
+    def key(self) -> Hashable:
+        return self.__class__
+
     async def check(self, m: MessageUpdate, _) -> bool:
         return m.chat.type == ChatType.PRIVATE
 
@@ -160,6 +251,10 @@ class IsSuccessfulPayment(ABCRule[MessageUpdate]):
     Checks if the message is a service message about a successful payment.
     """
 
+    @property
+    def key(self) -> Hashable:
+        return self.__class__
+
     async def check(self, m: MessageUpdate, _) -> bool:
         return m.successful_payment is not None
 
@@ -169,12 +264,17 @@ class WasEdited(ABCRule[MessageUpdate]):
     Checks if the message was edited.
     """
 
+    @property
+    def key(self) -> Hashable:
+        return self.__class__
+
     async def check(self, m: MessageUpdate, _) -> bool:
         return m.edit_date is not None
 
 
 __all__ = (
     "Command",
+    "get_command",
     "From",
     "FromChannel",
     "FromGroup",
@@ -17,6 +17,7 @@ from .types import (
     PurchasedPaidMediaUpdate,
     RemovedChatBoostUpdate,
     ShippingQueryUpdate,
+    TypedUpdate,
 )
 
 Message = MessageUpdate
@@ -32,6 +32,7 @@ from wonda.types.objects import (
     ReplyParameters,
     ShippingOption,
     ShippingQuery,
+    Update,
 )
 
 
@@ -350,6 +351,37 @@ class PollUpdate(BaseUpdate, Poll): ...
 class PurchasedPaidMediaUpdate(BaseUpdate, PaidMediaPurchased): ...
 
 
+class TypedUpdate(Update):
+    """
+    An update whose fields are decoded straight into the models
+    handlers receive, so they don't have to be copied when routing.
+    """
+
+    message: MessageUpdate | None = None
+    edited_message: MessageUpdate | None = None
+    channel_post: MessageUpdate | None = None
+    edited_channel_post: MessageUpdate | None = None
+    business_connection: BusinessConnectionUpdate | None = None
+    business_message: MessageUpdate | None = None
+    edited_business_message: MessageUpdate | None = None
+    deleted_business_messages: DeletedBusinessMessagesUpdate | None = None
+    message_reaction: MessageReactionUpdate | None = None
+    message_reaction_count: MessageReactionCountUpdate | None = None
+    inline_query: InlineQueryUpdate | None = None
+    chosen_inline_result: ChosenInlineResultUpdate | None = None
+    callback_query: CallbackQueryUpdate | None = None
+    shipping_query: ShippingQueryUpdate | None = None
+    pre_checkout_query: PreCheckoutQueryUpdate | None = None
+    purchased_paid_media: PurchasedPaidMediaUpdate | None = None
+    poll: PollUpdate | None = None
+    poll_answer: PollAnswerUpdate | None = None
+    my_chat_member: ChatMemberUpdate | None = None
+    chat_member: ChatMemberUpdate | None = None
+    chat_join_request: ChatJoinRequestUpdate | None = None
+    chat_boost: ChatBoostUpdate | None = None
+    removed_chat_boost: RemovedChatBoostUpdate | None = None
+
+
 __all__ = (
     "BaseUpdate",
     "BotUpdateType",
@@ -370,4 +402,5 @@ __all__ = (
     "RemovedChatBoostUpdate",
     "PollUpdate",
     "PurchasedPaidMediaUpdate",
+    "TypedUpdate",
 )
@@ -2,7 +2,8 @@ import importlib.util
 from re import RegexFlag
 from typing import Generic, TypeVar
 
-from wonda.bot.rules.abc import ABCRule
+from wonda.bot.rules.abc import ABCTextRule
+from wonda.bot.rules.generic import get_literal_prefix
 from wonda.bot.updates.types import BaseUpdate
 
 T = TypeVar("T", bound=BaseUpdate)
@@ -18,7 +19,7 @@ if vbml is None:
 else:
     from vbml import Patcher, Pattern
 
-    class Match(ABCRule[T], Generic[T]):
+    class Match(ABCTextRule[T], Generic[T]):
         """
         Checks if the text of the update matches with any given pattern.
         If a match is found, parses its arguments to the handler context.
@@ -36,26 +37,24 @@ else:
             ]
             self.flags = flags or RegexFlag(0)
 
-        async def check(self, upd: T, ctx: dict) -> bool:
-            if not any(
-                text := getattr(upd, src, None)
-                for src in (
-                    "text",
-                    "caption",
-                    "data",
-                    "query",
-                    "question",
-                    "invoice_payload",
-                    "paid_media_payload",
-                )
-            ):
-                return False
+            # Texts before the first argument of patterns given as strings,
+            # so the text index only checks patterns the text can match
+            self.literal_prefixes = tuple(
+                get_literal_prefix(p, self.flags, stop="<")
+                if isinstance(p, str)
+                else ""
+                for p in patterns
+            )
 
+        @property
+        def prefixes(self) -> tuple[str, ...]:
+            return self.literal_prefixes
+
+        def search(self, text: str) -> dict | None:
             for pattern in self.patterns:
                 match = self.patcher.check(pattern, text)
 
                 if match is not None and match is not False:
-                    ctx |= match
-                    return True
+                    return match
 
-            return False
+            return None
@@ -1,7 +1,9 @@
 import importlib.util
+from math import ceil, isinf
+from typing import Iterable
 
-from wonda.net.utils import json
 from wonda.tools.storage.abc import ABCExpiringStorage
+from wonda.tools.storage.codecs import ABCCodec, JSONCodec
 from wonda.tools.storage.types import Ex, K, V
 
 redis = importlib.util.find_spec("redis")
@@ -13,9 +15,18 @@ if redis is None:
             raise ImportError("Get `redis` package before using Redis storage")
 
 else:
-    from redis.asyncio import Redis
+    from redis.asyncio import BlockingConnectionPool, ConnectionPool, Redis
+    from redis.asyncio.connection import Connection, SSLConnection
 
     class RedisExpiringStorage(ABCExpiringStorage[K, V]):
+        """
+        Keeps values in Redis, so they're shared between instances of the bot
+        and outlive them. Every operation takes a single round-trip, and
+        `get_many` and `set_many` handle several keys in one round-trip.
+        When `max_connections` is given, requests wait for a free connection
+        instead of opening new ones.
+        """
+
         def __init__(
             self,
             host: str | None = None,
@@ -23,27 +34,78 @@ else:
             db: int | None = None,
             password: str | None = None,
             ssl: bool | None = None,
+            max_connections: int | None = None,
+            codec: ABCCodec[V] | None = None,
+            client: "Redis | None" = None,
         ) -> None:
-            self.client = Redis(
+            self.codec = codec or JSONCodec()
+
+            if client is not None:
+                self.client = client
+                return
+
+            connection_kwargs = dict(
                 host=host or "localhost",
                 port=port or 6379,
                 db=db or 0,
-                ssl=ssl or False,
                 password=password,
+                connection_class=SSLConnection if ssl else Connection,
+            )
+            pool = (
+                BlockingConnectionPool(
+                    max_connections=max_connections, **connection_kwargs
+                )
+                if max_connections is not None
+                else ConnectionPool(**connection_kwargs)
             )
+            self.client = Redis(connection_pool=pool)
 
         async def get(self, key: K, default: V | None = None) -> V | None:
-            if await self.contains(key):
-                v = await self.client.get(key)
-                return json.loads(v)
+            if (data := await self.client.get(key)) is not None:
+                return self.codec.decode(data)
 
             if default is None:
                 raise KeyError("There is no such key")
 
             return default
 
+        async def get_many(self, keys: Iterable[K]) -> list[V | None]:
+            """
+            Gets values of several keys, with None for keys which are missing.
+            """
+            if not (keys := list(keys)):
+                return []
+
+            return [
+                self.codec.decode(data) if data is not None else None
+                for data in await self.client.mget(keys)
+            ]
+
         async def set(self, key: K, value: V, ex: Ex = Ex("inf")) -> None:
-            await self.client.set(key, ex=ex, value=json.dumps(value))
+            await self.client.set(key, self.codec.encode(value), px=self.get_px(ex))
+            return None
+
+        async def add(self, key: K, value: V, ex: Ex = Ex("inf")) -> bool:
+            result = await self.client.set(
+                key, self.codec.encode(value), px=self.get_px(ex), nx=True
+            )
+            return bool(result)
+
+        async def set_many(self, items: dict[K, V], ex: Ex = Ex("inf")) -> None:
+            """
+            Sets values of several keys at once.
+            """
+            if not items:
+                return None
+
+            px = self.get_px(ex)
+
+            async with self.client.pipeline(transaction=False) as pipeline:
+                for key, value in items.items():
+                    pipeline.set(key, self.codec.encode(value), px=px)
+
+                await pipeline.execute()
+
             return None
 
         async def contains(self, key: K) -> bool:
@@ -51,8 +113,13 @@ else:
             return bool(result)
 
         async def delete(self, key: K) -> None:
-            if not await self.contains(key):
+            if not await self.client.delete(key):
                 raise KeyError("Storage does not contain this key")
 
-            await self.client.delete(key)
             return None
+
+        @staticmethod
+        def get_px(ex: Ex) -> int | None:
+            # Redis takes lifetimes in whole milliseconds,
+            # and keys without a lifetime get none at all
+            return None if isinf(ex) else ceil(ex * 1000)
@@ -1,8 +1,26 @@
+from typing import TYPE_CHECKING
+
 from .code import CodeException
 
+if TYPE_CHECKING:
+    from wonda.types.objects import ResponseParameters
+
 
 class APIException(CodeException):
-    def __init__(self, description: str | None, code: int | None) -> None:
+    def __init__(
+        self,
+        description: str | None,
+        code: int | None,
+        parameters: "ResponseParameters | None" = None,
+    ) -> None:
         super().__init__(description)
         self.description = description
         self.code = code
+        self.parameters = parameters
+
+    @property
+    def retry_after(self) -> int | None:
+        """
+        Seconds left to wait before the request can be repeated.
+        """
+        return self.parameters.retry_after if self.parameters else None
@@ -1,2 +1,3 @@
 from .abc import ABCNetworkClient
 from .default import DefaultNetworkClient
+from .options import ConnectionOptions
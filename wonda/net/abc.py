@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 
-from typing_extensions import Any, Self
+from msgspec import json
+from typing_extensions import Any, AsyncIterator, Self
 
 
 class ABCNetworkClient(ABC):
@@ -9,6 +10,14 @@ class ABCNetworkClient(ABC):
     def construct_form(data: dict) -> Any:
         pass
 
+    @staticmethod
+    def construct_json(data: dict) -> Any:
+        """
+        Makes a JSON request body. The API sends it with
+        the `Content-Type: application/json` header.
+        """
+        return json.encode(data)
+
     @abstractmethod
     async def request_text(
         self, url: str, method: str = "get", data: dict | None = None, **kw
@@ -27,6 +36,19 @@ class ABCNetworkClient(ABC):
     ) -> bytes:
         pass
 
+    async def stream_bytes(
+        self, url: str, chunk_size: int = 2**16, offset: int = 0, **kw
+    ) -> AsyncIterator[bytes]:
+        """
+        Downloads content of the given URL in chunks of up to `chunk_size` bytes,
+        skipping the first `offset` of them. Unless it's overridden, the whole
+        content is downloaded at once.
+        """
+        content = await self.request_bytes(url, **kw)
+
+        for i in range(offset, len(content), chunk_size):
+            yield content[i : i + chunk_size]
+
     @abstractmethod
     async def close(self) -> None:
         pass
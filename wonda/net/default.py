@@ -1,35 +1,93 @@
 import ssl
+from asyncio import gather
+from functools import lru_cache
+from typing import AsyncIterator
 
 import certifi
-from aiohttp import ClientSession, ClientTimeout, FormData, TCPConnector
+import msgspec
+from aiohttp import BytesPayload, ClientSession, ClientTimeout, FormData, TCPConnector
 
 from wonda.net.abc import ABCNetworkClient
+from wonda.net.options import ConnectionOptions
 from wonda.net.utils import json
 
 
+@lru_cache(maxsize=1)
+def get_default_ssl_context() -> ssl.SSLContext:
+    """
+    Creates an SSL context which trusts certificates bundled with `certifi`.
+    Loading the bundle is slow, so the context is shared between clients.
+    """
+    return ssl.create_default_context(cafile=certifi.where())
+
+
 class DefaultNetworkClient(ABCNetworkClient):
     def __init__(
-        self, session: ClientSession | None = None, timeout: ClientTimeout | None = None
+        self,
+        session: ClientSession | None = None,
+        timeout: ClientTimeout | None = None,
+        connection_options: ConnectionOptions | None = None,
+        ssl_context: ssl.SSLContext | None = None,
     ) -> None:
         self.timeout = timeout or ClientTimeout(0)
+        self.options = connection_options or ConnectionOptions()
+        self.ssl_context = ssl_context or get_default_ssl_context()
         self.session = session
 
-    async def request_bytes(
-        self, url: str, method: str = "get", data: dict | None = None, **kwargs
-    ) -> bytes:
+    def get_session(self) -> ClientSession:
         if not self.session:
             connector = TCPConnector(
-                ssl=ssl.create_default_context(cafile=certifi.where())
+                ssl=self.ssl_context,
+                limit=self.options.limit,
+                limit_per_host=self.options.limit_per_host,
+                keepalive_timeout=self.options.keepalive_timeout,
+                ttl_dns_cache=self.options.ttl_dns_cache,
             )
             self.session = ClientSession(
                 json_serialize=json.dumps, timeout=self.timeout, connector=connector
             )
 
-        async with self.session.request(
+        return self.session
+
+    async def request_bytes(
+        self, url: str, method: str = "get", data: dict | None = None, **kwargs
+    ) -> bytes:
+        # Plain numbers are treated as a total timeout for this request only,
+        # so long polling requests can outlive the timeout of the session
+        if isinstance(timeout := kwargs.pop("timeout", None), (int, float)):
+            timeout = ClientTimeout(total=timeout)
+        if timeout is not None:
+            kwargs["timeout"] = timeout
+
+        async with self.get_session().request(
             url=url, method=method, data=data, **kwargs
         ) as response:
             return await response.content.read()
 
+    async def stream_bytes(
+        self, url: str, chunk_size: int = 2**16, offset: int = 0, **kwargs
+    ) -> AsyncIterator[bytes]:
+        if offset:
+            kwargs["headers"] = {
+                **kwargs.get("headers", {}),
+                "Range": f"bytes={offset}-",
+            }
+
+        async with self.get_session().get(url, **kwargs) as response:
+            response.raise_for_status()
+
+            # Servers that don't support ranges send the whole content back,
+            # so the part which is already there has to be skipped here
+            if offset and response.status != 206:
+                while offset > 0:
+                    chunk = await response.content.read(min(offset, chunk_size))
+                    if not chunk:
+                        return
+                    offset -= len(chunk)
+
+            async for chunk in response.content.iter_chunked(chunk_size):
+                yield chunk
+
     async def request_json(
         self, url: str, method: str = "get", data: dict | None = None, **kwargs
     ) -> dict:
@@ -42,6 +100,19 @@ class DefaultNetworkClient(ABCNetworkClient):
         response = await self.request_bytes(url, method, data, **kwargs)
         return response.decode()
 
+    async def warm_up(self, url: str, connections: int = 4) -> None:
+        """
+        Opens several connections to the host of the given URL at once, so
+        they are ready in the pool before the first requests are made.
+        """
+        session = self.get_session()
+
+        async def connect() -> None:
+            async with session.head(url, allow_redirects=False) as response:
+                await response.read()
+
+        await gather(*(connect() for _ in range(connections)))
+
     async def close(self) -> None:
         if self.session and not self.session.closed:
             await self.session.close()
@@ -58,6 +129,10 @@ class DefaultNetworkClient(ABCNetworkClient):
             form.add_field(k, v, **params)
         return form
 
+    @staticmethod
+    def construct_json(data: dict) -> BytesPayload:
+        return BytesPayload(msgspec.json.encode(data), content_type="application/json")
+
     def __del__(self):
         if self.session and not self.session.closed:
             if self.session._connector is not None and self.session._connector_owner:
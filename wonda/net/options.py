@@ -0,0 +1,28 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class ConnectionOptions:
+    """
+    Controls the pool of connections kept by the network client.
+    Nagle's algorithm is always disabled on its sockets (`TCP_NODELAY`).
+    """
+
+    limit: int = 100
+    """
+    Total number of simultaneous connections. Set it to 0 to lift the limit.
+    """
+    limit_per_host: int = 0
+    """
+    Number of simultaneous connections to a single host. Zero means
+    that only the total limit applies.
+    """
+    keepalive_timeout: float = 30.0
+    """
+    Seconds an idle connection is kept open in the pool to be reused.
+    """
+    ttl_dns_cache: int | None = 300
+    """
+    Seconds resolved addresses are cached for. Set it to None
+    to cache them for the lifetime of the client.
+    """
@@ -1,8 +1,9 @@
 from .action_sender import ActionSender
 from .delayed_task import DelayedTask
+from .downloader import FileDownloader
 from .keyboard import ABCKeyboardBuilder, InlineKeyboardBuilder, ReplyKeyboardBuilder
 from .localization import ABCLocalizator, DefaultLocalizator
 from .loop_wrapper import LoopWrapper
-from .storage import ABCStorage, MemoryStorage
+from .storage import ABCStorage, BoundedMemoryStorage, MemoryStorage
 from .text import ABCStyle, ParseMode, StyleChain
 from .web_apps import verify_webapp_request, validate_webapp_data
\ No newline at end of file
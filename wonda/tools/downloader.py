@@ -0,0 +1,162 @@
+import asyncio
+import shutil
+from pathlib import Path
+from time import monotonic
+from typing import Any, AsyncIterator, Awaitable, Callable
+
+from aiohttp import ClientResponseError
+
+from wonda.api import ABCAPI
+from wonda.api.retry import ABCRetryPolicy, DefaultRetryPolicy
+from wonda.modules import logger
+from wonda.types.objects import File
+
+Sink = Callable[[bytes], Awaitable[Any]]
+
+
+class FileDownloader:
+    """
+    Downloads files from the file storage of the bot in fixed-size chunks,
+    so even large files are handled in constant memory. Interrupted downloads
+    are resumed from where they stopped using range requests.
+    """
+
+    def __init__(
+        self,
+        api: ABCAPI,
+        max_concurrent: int = 4,
+        chunk_size: int = 2**16,
+        cache_dir: str | Path | None = None,
+        retry_policy: ABCRetryPolicy | None = None,
+    ) -> None:
+        self.api = api
+        self.chunk_size = chunk_size
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.retry_policy = retry_policy or DefaultRetryPolicy(
+            max_attempts=5, deadline=None, idempotent=("downloadFile",)
+        )
+        self.semaphore = asyncio.Semaphore(max_concurrent)
+
+        # Downloads to the cache which are in progress, so a file
+        # requested several times at once is only downloaded once
+        self.pending: dict[str, asyncio.Task] = {}
+
+    async def get_file(self, file: str | File) -> File:
+        if isinstance(file, str):
+            return await self.api.get_file(file_id=file)  # type: ignore
+        if file.file_path is None:
+            return await self.api.get_file(file_id=file.file_id)  # type: ignore
+        return file
+
+    def get_cache_path(self, file: File) -> Path | None:
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / file.file_unique_id
+
+    async def download(self, file: str | File, destination: str | Path | Sink) -> File:
+        """
+        Downloads a file by its identifier or `File` object to a path or
+        an async callable, which is called with every chunk.
+        """
+        file = await self.get_file(file)
+
+        async with self.semaphore:
+            if (cache_path := self.get_cache_path(file)) is not None:
+                if not cache_path.exists():
+                    await self.fill_cache(file, cache_path)
+
+                if callable(destination):
+                    await self.copy_to_sink(cache_path, destination)
+                else:
+                    await asyncio.to_thread(shutil.copyfile, cache_path, destination)
+            elif callable(destination):
+                await self.download_to_sink(file, destination)
+            else:
+                await self.download_to_path(file, Path(destination))
+
+        return file
+
+    async def fill_cache(self, file: File, path: Path) -> None:
+        key = file.file_unique_id
+
+        if (task := self.pending.get(key)) is None:
+            task = asyncio.create_task(self.download_to_path(file, path))
+            task.add_done_callback(lambda _: self.pending.pop(key, None))
+            self.pending[key] = task
+
+        await asyncio.shield(task)
+        await logger.adebug("Cached", file_unique_id=key)
+
+    async def download_to_path(self, file: File, path: Path) -> None:
+        # Content is written to a separate file first, so a failed download
+        # is never mistaken for a complete one and can be resumed later.
+        # It's named after the file, so only a part of the same file is resumed
+        part = path.with_name(f"{path.name}.{file.file_unique_id}.part")
+        part.parent.mkdir(parents=True, exist_ok=True)
+
+        offset = part.stat().st_size if part.exists() else 0
+
+        if file.file_size is not None and offset > file.file_size:
+            part.unlink()
+            offset = 0
+
+        with part.open("ab") as f:
+
+            async def write(chunk: bytes) -> None:
+                await asyncio.to_thread(f.write, chunk)
+
+            await self.download_to_sink(file, write, offset)
+
+        part.replace(path)
+
+    async def download_to_sink(self, file: File, sink: Sink, offset: int = 0) -> None:
+        attempt, started_at = 0, monotonic()
+
+        while file.file_size is None or offset < file.file_size:
+            attempt += 1
+
+            try:
+                async for chunk in self.stream(file, offset):
+                    await sink(chunk)
+                    offset += len(chunk)
+                return
+            except Exception as e:
+                # Requests the server refused won't succeed when made again
+                if (
+                    isinstance(e, ClientResponseError)
+                    and e.status < 500
+                    and e.status != 429
+                ):
+                    raise
+
+                delay = self.retry_policy.get_delay(
+                    "downloadFile", e, attempt, monotonic() - started_at
+                )
+
+                if delay is None:
+                    raise
+
+                await logger.awarning(
+                    "Resuming download",
+                    file_id=file.file_id,
+                    offset=offset,
+                    attempt=attempt,
+                    delay=delay,
+                    error=e,
+                )
+                await asyncio.sleep(delay)
+
+    async def copy_to_sink(self, path: Path, sink: Sink) -> None:
+        with path.open("rb") as f:
+            while chunk := await asyncio.to_thread(f.read, self.chunk_size):
+                await sink(chunk)
+
+    def stream(self, file: File, offset: int = 0) -> AsyncIterator[bytes]:
+        """
+        Streams content of a file starting from the given offset.
+        """
+        return self.api.network_client.stream_bytes(
+            self.api.file_url + file.file_path,  # type: ignore
+            chunk_size=self.chunk_size,
+            offset=offset,
+        )
@@ -1,5 +1,7 @@
 from wonda.contrib.storage import *
 
 from .abc import ABCBaseStorage, ABCExpiringStorage, ABCStorage
-from .memory import MemoryExpiringStorage, MemoryStorage
+from .codecs import ABCCodec, JSONCodec, MsgPackCodec
+from .eviction import ABCEvictionPolicy, LFUPolicy, LRUPolicy, TinyLFUPolicy
+from .memory import BoundedMemoryStorage, MemoryExpiringStorage, MemoryStorage
 from .types import Ex, K, V
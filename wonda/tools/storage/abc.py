@@ -28,3 +28,15 @@ class ABCExpiringStorage(ABCBaseStorage[K, V]):
     @abstractmethod
     async def set(self, key: K, value: V, ex: Ex) -> None:
         pass
+
+    async def add(self, key: K, value: V, ex: Ex) -> bool:
+        """
+        Sets the value only if the key is missing. Returns whether it was set.
+        Unless it's overridden, the key is checked and set in two steps,
+        so processes sharing the storage may both add the same key.
+        """
+        if await self.contains(key):
+            return False
+
+        await self.set(key, value, ex)
+        return True
@@ -0,0 +1,53 @@
+from abc import ABC, abstractmethod
+from typing import Any, Generic
+
+from msgspec import json, msgpack
+
+from wonda.tools.storage.types import V
+
+
+class ABCCodec(ABC, Generic[V]):
+    """
+    Turns values into bytes for storages which keep them outside the process.
+    """
+
+    @abstractmethod
+    def encode(self, value: V) -> bytes:
+        pass
+
+    @abstractmethod
+    def decode(self, data: bytes) -> V:
+        pass
+
+
+class JSONCodec(ABCCodec[V]):
+    """
+    Stores values as JSON. When a type is given, values are decoded
+    straight into it, for example into `StateRepr`.
+    """
+
+    def __init__(self, type: Any = Any) -> None:
+        self.encoder, self.decoder = json.Encoder(), json.Decoder(type)
+
+    def encode(self, value: V) -> bytes:
+        return self.encoder.encode(value)
+
+    def decode(self, data: bytes) -> V:
+        return self.decoder.decode(data)
+
+
+class MsgPackCodec(ABCCodec[V]):
+    """
+    Stores values as MessagePack, which is more compact and faster
+    to handle than JSON. When a type is given, values are decoded
+    straight into it, for example into `StateRepr`.
+    """
+
+    def __init__(self, type: Any = Any) -> None:
+        self.encoder, self.decoder = msgpack.Encoder(), msgpack.Decoder(type)
+
+    def encode(self, value: V) -> bytes:
+        return self.encoder.encode(value)
+
+    def decode(self, data: bytes) -> V:
+        return self.decoder.decode(data)
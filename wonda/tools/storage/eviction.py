@@ -0,0 +1,154 @@
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Generic
+
+from wonda.tools.storage.types import K
+
+
+class ABCEvictionPolicy(ABC, Generic[K]):
+    """
+    Decides which key a bounded storage should evict once it's full.
+    """
+
+    @abstractmethod
+    def add(self, key: K) -> None:
+        pass
+
+    @abstractmethod
+    def touch(self, key: K) -> None:
+        pass
+
+    @abstractmethod
+    def remove(self, key: K) -> None:
+        pass
+
+    @abstractmethod
+    def get_victim(self) -> K:
+        pass
+
+    def record(self, key: K) -> None:
+        """
+        Called on every request for a key, whether it's stored or not.
+        """
+        return None
+
+    def admit(self, key: K, victim: K) -> bool:
+        """
+        Decides if a new key is worth evicting the victim for.
+        """
+        return True
+
+
+class LRUPolicy(ABCEvictionPolicy[K]):
+    """
+    Evicts the key which was used least recently.
+    """
+
+    def __init__(self) -> None:
+        self.keys: OrderedDict[K, None] = OrderedDict()
+
+    def add(self, key: K) -> None:
+        self.keys[key] = None
+
+    def touch(self, key: K) -> None:
+        self.keys.move_to_end(key)
+
+    def remove(self, key: K) -> None:
+        del self.keys[key]
+
+    def get_victim(self) -> K:
+        return next(iter(self.keys))
+
+
+class LFUPolicy(ABCEvictionPolicy[K]):
+    """
+    Evicts the key which was used least often. Of keys used equally often,
+    the one used least recently is evicted.
+    """
+
+    def __init__(self) -> None:
+        self.counts: dict[K, int] = {}
+        self.buckets: dict[int, OrderedDict[K, None]] = {}
+        self.min_count = 0
+
+    def add(self, key: K) -> None:
+        self.counts[key] = self.min_count = 1
+        self.buckets.setdefault(1, OrderedDict())[key] = None
+
+    def touch(self, key: K) -> None:
+        count = self.counts[key]
+        self.unlink(key, count)
+
+        self.counts[key] = count + 1
+        self.buckets.setdefault(count + 1, OrderedDict())[key] = None
+
+        if self.min_count == count and count not in self.buckets:
+            self.min_count = count + 1
+
+    def remove(self, key: K) -> None:
+        self.unlink(key, self.counts.pop(key))
+
+        # The minimum is only looked for when it's needed,
+        # since it's usually reset by the next added key
+        if self.min_count not in self.buckets and self.buckets:
+            self.min_count = min(self.buckets)
+
+    def unlink(self, key: K, count: int) -> None:
+        bucket = self.buckets[count]
+        del bucket[key]
+
+        if not bucket:
+            del self.buckets[count]
+
+    def get_victim(self) -> K:
+        return next(iter(self.buckets[self.min_count]))
+
+
+class FrequencySketch(Generic[K]):
+    """
+    Estimates how often keys were requested recently in fixed memory.
+    Counters are halved periodically, so old popularity fades away.
+    """
+
+    def __init__(self, width: int, depth: int = 4, max_count: int = 15) -> None:
+        self.width, self.depth, self.max_count = width, depth, max_count
+        self.table = [0] * (width * depth)
+        self.additions, self.sample_size = 0, width * 10
+
+    def get_indexes(self, key: K) -> list[int]:
+        return [
+            row * self.width + hash((row, key)) % self.width
+            for row in range(self.depth)
+        ]
+
+    def add(self, key: K) -> None:
+        for i in self.get_indexes(key):
+            if self.table[i] < self.max_count:
+                self.table[i] += 1
+
+        self.additions += 1
+
+        if self.additions >= self.sample_size:
+            self.table = [count // 2 for count in self.table]
+            self.additions //= 2
+
+    def estimate(self, key: K) -> int:
+        return min(self.table[i] for i in self.get_indexes(key))
+
+
+class TinyLFUPolicy(LRUPolicy[K]):
+    """
+    Evicts the least recently used key, but only admits a new key when
+    it's requested more often than the key it would replace, so keys
+    requested once don't push out popular ones.
+    """
+
+    def __init__(self, width: int = 2**12) -> None:
+        super().__init__()
+        self.sketch: FrequencySketch[K] = FrequencySketch(width)
+
+    def record(self, key: K) -> None:
+        self.sketch.add(key)
+
+    def admit(self, key: K, victim: K) -> bool:
+        return self.sketch.estimate(key) > self.sketch.estimate(victim)
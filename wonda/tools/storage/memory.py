@@ -1,8 +1,18 @@
+import sys
+from heapq import heapify, heappop, heappush
+from itertools import count
 from time import time
+from typing import TYPE_CHECKING, Any, Awaitable, Callable
+
+from wonda.tools.delayed_task import DelayedTask
 
 from wonda.tools.storage.abc import ABCExpiringStorage, ABCStorage
+from wonda.tools.storage.eviction import ABCEvictionPolicy, LRUPolicy
 from wonda.tools.storage.types import Ex, K, V
 
+if TYPE_CHECKING:
+    from wonda.tools.loop_wrapper import LoopWrapper
+
 
 class MemoryStorage(ABCStorage[K, V]):
     def __init__(self) -> None:
@@ -29,8 +39,23 @@ class MemoryStorage(ABCStorage[K, V]):
 
 
 class MemoryExpiringStorage(ABCExpiringStorage[K, V]):
-    def __init__(self) -> None:
+    """
+    Memory storage for keys with a limited lifetime. Expired keys are
+    removed when they're accessed, a few at a time on every write and all
+    at once by `expire`, which can be run in the background, so keys
+    which are never accessed again don't stay in memory.
+    """
+
+    def __init__(
+        self, on_expire: Callable[[K, V], Awaitable[Any]] | None = None
+    ) -> None:
         self.data: dict[K, tuple[V, Ex]] = {}
+        self.on_expire = on_expire
+
+        # Keys ordered by their expiry time. Entries of keys which were
+        # deleted or set again are skipped when they come up
+        self.deadlines: list[tuple[Ex, int, K]] = []
+        self.counter = count()
 
     async def get(self, key: K, default: V | None = None) -> V:
         if await self.contains(key):
@@ -42,18 +67,29 @@ class MemoryExpiringStorage(ABCExpiringStorage[K, V]):
         return default
 
     async def set(self, key: K, value: V, ex: Ex = Ex("inf")) -> None:
-        self.data[key] = value, ex + time()
+        expires_at = ex + time()
+        self.data[key] = value, expires_at
+
+        if expires_at != Ex("inf"):
+            heappush(self.deadlines, (expires_at, next(self.counter), key))
+
+        # Cleaning up a little on every write keeps memory
+        # bounded by live keys without blocking for long
+        await self.expire(limit=2)
         return None
 
     async def contains(self, key: K) -> bool:
         if key not in self.data:
             return False
 
-        _, expires_at = self.data[key]
+        value, expires_at = self.data[key]
 
         if expires_at < time():
             del self.data[key]
 
+            if self.on_expire is not None:
+                await self.on_expire(key, value)
+
         return key in self.data
 
     async def delete(self, key: K) -> None:
@@ -62,3 +98,147 @@ class MemoryExpiringStorage(ABCExpiringStorage[K, V]):
 
         del self.data[key]
         return None
+
+    async def expire(self, limit: int | None = None) -> int:
+        """
+        Removes keys which have expired, looking at no more than `limit`
+        of them if it's given. Returns the number of keys removed.
+        """
+        now, checked, removed = time(), 0, 0
+
+        while self.deadlines and self.deadlines[0][0] <= now:
+            if limit is not None and checked >= limit:
+                break
+
+            expires_at, _, key = heappop(self.deadlines)
+            checked += 1
+
+            if (entry := self.data.get(key)) is None or entry[1] != expires_at:
+                continue
+
+            del self.data[key]
+            removed += 1
+
+            if self.on_expire is not None:
+                await self.on_expire(key, entry[0])
+
+        # Keys set again many times leave behind entries which
+        # only come up late, so the heap is rebuilt when they pile up
+        if len(self.deadlines) > 2 * len(self.data) + 64:
+            self.deadlines = [
+                (expires_at, next(self.counter), key)
+                for key, (_, expires_at) in self.data.items()
+                if expires_at != Ex("inf")
+            ]
+            heapify(self.deadlines)
+
+        return removed
+
+    def run_expiry(self, loop_wrapper: "LoopWrapper", interval: float = 1.0) -> None:
+        """
+        Makes the loop wrapper remove expired keys every `interval` seconds.
+        """
+        loop_wrapper.add_task(DelayedTask(self.expire, interval))  # type: ignore
+
+
+class BoundedMemoryStorage(ABCStorage[K, V]):
+    """
+    Memory storage which holds a limited number of entries or a limited
+    total size of values. Once it's full, entries chosen by the eviction
+    policy are removed and passed to `on_evict`, which can move them
+    to a slower storage. Values are sized with `sys.getsizeof` by default,
+    which doesn't count objects they refer to.
+    """
+
+    def __init__(
+        self,
+        max_entries: int | None = None,
+        max_size: int | None = None,
+        policy: ABCEvictionPolicy[K] | None = None,
+        sizeof: Callable[[V], int] = sys.getsizeof,
+        on_evict: Callable[[K, V], Awaitable[Any]] | None = None,
+    ) -> None:
+        assert max_entries or max_size, "Storage should have a limit"
+
+        self.max_entries, self.max_size = max_entries, max_size
+        self.policy = policy or LRUPolicy()
+        self.sizeof, self.on_evict = sizeof, on_evict
+
+        self.data: dict[K, tuple[V, int]] = {}
+        self.size = 0
+        self.hits, self.misses, self.evictions = 0, 0, 0
+
+    async def get(self, key: K, default: V | None = None) -> V | None:
+        self.policy.record(key)
+
+        if key not in self.data:
+            self.misses += 1
+            return default
+
+        self.hits += 1
+        self.policy.touch(key)
+        return self.data[key][0]
+
+    async def set(self, key: K, value: V) -> None:
+        self.policy.record(key)
+        size = self.sizeof(value)
+
+        if key in self.data:
+            self.size -= self.data[key][1]
+            self.policy.touch(key)
+        elif self.is_full(1, size) and self.data:
+            # A new key may not be worth more than the one it would replace,
+            # in which case it's evicted right away
+            if not self.policy.admit(key, self.policy.get_victim()):
+                return await self.evicted(key, value)
+
+        if key not in self.data:
+            self.policy.add(key)
+
+        self.data[key] = value, size
+        self.size += size
+
+        while self.is_full() and self.data:
+            victim = self.policy.get_victim()
+            victim_value, _ = self.pop(victim)
+            await self.evicted(victim, victim_value)
+
+    async def contains(self, key: K) -> bool:
+        return key in self.data
+
+    async def delete(self, key: K) -> None:
+        if not await self.contains(key):
+            raise KeyError("Storage does not contain this key")
+
+        self.pop(key)
+        return None
+
+    def is_full(self, entries: int = 0, size: int = 0) -> bool:
+        if self.max_entries is not None and len(self.data) + entries > self.max_entries:
+            return True
+
+        if self.max_size is not None and self.size + size > self.max_size:
+            return True
+
+        return False
+
+    def pop(self, key: K) -> tuple[V, int]:
+        value, size = self.data.pop(key)
+        self.policy.remove(key)
+        self.size -= size
+        return value, size
+
+    async def evicted(self, key: K, value: V) -> None:
+        self.evictions += 1
+
+        if self.on_evict is not None:
+            await self.on_evict(key, value)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(entries={len(self.data)}, size={self.size}, "
+            f"hits={self.hits}, misses={self.misses}, evictions={self.evictions})"
+        )
@@ -10,7 +10,13 @@ def verify_webapp_request(secret_token: str, request_headers: dict[str, Any]) ->
     Validates that the update is from Telegram.
     """
 
-    return request_headers.get("X-Telegram-Bot-Api-Secret-Token") == secret_token
+    # Text with characters other than ASCII can't be compared as it is
+    return hmac.compare_digest(
+        request_headers.get("X-Telegram-Bot-Api-Secret-Token", "").encode(
+            errors="surrogateescape"
+        ),
+        secret_token.encode(errors="surrogateescape"),
+    )
 
 
 def validate_webapp_data(token: Token, incoming_parameters: dict[str, Any]) -> bool:
@@ -1,4 +1,5 @@
-from typing import TypeVar
+from functools import cache
+from typing import Any, Generic, TypeVar
 
 import msgspec
 from msgspec import Raw, Struct, json
@@ -18,15 +19,35 @@ class Model(Struct, rename=rename, omit_defaults=True):
         return msgspec.structs.asdict(self)
 
 
-class Response(Model):
+class Response(Model, Generic[T]):
     ok: bool
-    result: Raw = Raw()
+    result: T = None  # type: ignore
     error_code: int | None = None
     description: str | None = None
+    parameters: Raw = Raw()
+
+
+@cache
+def get_decoder(type: Any) -> json.Decoder:
+    """
+    Returns a JSON decoder for the type. Decoders are
+    built once and shared between calls.
+    """
+    return json.Decoder(type)
+
+
+@cache
+def get_response_decoder(type: Any) -> "json.Decoder[Response[Any]]":
+    """
+    Returns a decoder which decodes the API response together
+    with its result of the given type in one pass.
+    """
+    return json.Decoder(Response[type])
 
 
 def from_json(v: bytes, *, type: type[T]) -> T:
-    return json.decode(v, type=type)
+    # Types are hashable, which mypy can't tell for type[T]
+    return get_decoder(type).decode(v)  # type: ignore[arg-type]
 
 
 def to_json(v) -> str:
@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING, Literal
 
-from .helper import from_json, get_params
+from .helper import get_params
 from .objects import (
     AcceptedGiftTypes,
     BotCommand,
@@ -87,8 +87,9 @@ class APIMethods:
         Use this method to receive incoming updates using long polling (wiki).
         Returns an Array of Update objects.
         """
-        response = await self.api.request("getUpdates", get_params(locals()))
-        return from_json(response, type=list[Update])
+        return await self.api.request(
+            "getUpdates", get_params(locals()), type=list[Update]
+        )
 
     async def set_webhook(
         self,
@@ -113,8 +114,7 @@ class APIMethods:
         specified, the request will contain a header "X-Telegram-Bot-Api-
         Secret-Token" with the secret token as content.
         """
-        response = await self.api.request("setWebhook", get_params(locals()))
-        return from_json(response, type=bool)
+        return await self.api.request("setWebhook", get_params(locals()), type=bool)
 
     async def delete_webhook(
         self, drop_pending_updates: bool | None = None, **kwargs
@@ -123,8 +123,7 @@ class APIMethods:
         Use this method to remove webhook integration if you decide to switch
         back to getUpdates. Returns True on success.
         """
-        response = await self.api.request("deleteWebhook", get_params(locals()))
-        return from_json(response, type=bool)
+        return await self.api.request("deleteWebhook", get_params(locals()), type=bool)
 
     async def get_webhook_info(self, **kwargs) -> WebhookInfo:
         """
@@ -132,8 +131,9 @@ class APIMethods:
         On success, returns a WebhookInfo object. If the bot is using
         getUpdates, will return an object with the url field empty.
         """
-        response = await self.api.request("getWebhookInfo", get_params(locals()))
-        return from_json(response, type=WebhookInfo)
+        return await self.api.request(
+            "getWebhookInfo", get_params(locals()), type=WebhookInfo
+        )
 
     async def get_me(self, **kwargs) -> User:
         """
@@ -141,8 +141,7 @@ class APIMethods:
         no parameters. Returns basic information about the bot in form of a
         User object.
         """
-        response = await self.api.request("getMe", get_params(locals()))
-        return from_json(response, type=User)
+        return await self.api.request("getMe", get_params(locals()), type=User)
 
     async def log_out(self, **kwargs) -> bool:
         """
@@ -154,8 +153,7 @@ class APIMethods:
         server for 10 minutes. Returns True on success. Requires no
         parameters.
         """
-        response = await self.api.request("logOut", get_params(locals()))
-        return from_json(response, type=bool)
+        return await self.api.request("logOut", get_params(locals()), type=bool)
 
     async def close(self, **kwargs) -> bool:
         """
@@ -166,8 +164,7 @@ class APIMethods:
         after the bot is launched. Returns True on success. Requires no
         parameters.
         """
-        response = await self.api.request("close", get_params(locals()))
-        return from_json(response, type=bool)
+        return await self.api.request("close", get_params(locals()), type=bool)
 
     async def send_message(
         self,
@@ -194,8 +191,7 @@ class APIMethods:
         Use this method to send text messages. On success, the sent Message is
         returned.
         """
-        response = await self.api.request("sendMessage", get_params(locals()))
-        return from_json(response, type=Message)
+        return await self.api.request("sendMessage", get_params(locals()), type=Message)
 
     async def forward_message(
         self,
@@ -213,8 +209,9 @@ class APIMethods:
         messages with protected content can't be forwarded. On success, the
         sent Message is returned.
         """
-        response = await self.api.request("forwardMessage", get_params(locals()))
-        return from_json(response, type=Message)
+        return await self.api.request(
+            "forwardMessage", get_params(locals()), type=Message
+        )
 
     async def forward_messages(
         self,
@@ -233,8 +230,9 @@ class APIMethods:
         forwarded. Album grouping is kept for forwarded messages. On success,
         an array of MessageId of the sent messages is returned.
         """
-        response = await self.api.request("forwardMessages", get_params(locals()))
-        return from_json(response, type=list[MessageId])
+        return await self.api.request(
+            "forwardMessages", get_params(locals()), type=list[MessageId]
+        )
 
     async def copy_message(
         self,
@@ -267,8 +265,9 @@ class APIMethods:
         message doesn't have a link to the original message. Returns the
         MessageId of the sent message on success.
         """
-        response = await self.api.request("copyMessage", get_params(locals()))
-        return from_json(response, type=MessageId)
+        return await self.api.request(
+            "copyMessage", get_params(locals()), type=MessageId
+        )
 
     async def copy_messages(
         self,
@@ -292,8 +291,9 @@ class APIMethods:
         kept for copied messages. On success, an array of MessageId of the
         sent messages is returned.
         """
-        response = await self.api.request("copyMessages", get_params(locals()))
-        return from_json(response, type=list[MessageId])
+        return await self.api.request(
+            "copyMessages", get_params(locals()), type=list[MessageId]
+        )
 
     async def send_photo(
         self,
@@ -322,8 +322,7 @@ class APIMethods:
         Use this method to send photos. On success, the sent Message is
         returned.
         """
-        response = await self.api.request("sendPhoto", get_params(locals()))
-        return from_json(response, type=Message)
+        return await self.api.request("sendPhoto", get_params(locals()), type=Message)
 
     async def send_audio(
         self,
@@ -358,8 +357,7 @@ class APIMethods:
         changed in the future. For sending voice messages, use the sendVoice
         method instead.
         """
-        response = await self.api.request("sendAudio", get_params(locals()))
-        return from_json(response, type=Message)
+        return await self.api.request("sendAudio", get_params(locals()), type=Message)
 
     async def send_document(
         self,
@@ -389,8 +387,9 @@ class APIMethods:
         returned. Bots can currently send files of any type of up to 50 MB in
         size, this limit may be changed in the future.
         """
-        response = await self.api.request("sendDocument", get_params(locals()))
-        return from_json(response, type=Message)
+        return await self.api.request(
+            "sendDocument", get_params(locals()), type=Message
+        )
 
     async def send_video(
         self,
@@ -428,8 +427,7 @@ class APIMethods:
         Message is returned. Bots can currently send video files of up to 50
         MB in size, this limit may be changed in the future.
         """
-        response = await self.api.request("sendVideo", get_params(locals()))
-        return from_json(response, type=Message)
+        return await self.api.request("sendVideo", get_params(locals()), type=Message)
 
     async def send_animation(
         self,
@@ -464,8 +462,9 @@ class APIMethods:
         currently send animation files of up to 50 MB in size, this limit may
         be changed in the future.
         """
-        response = await self.api.request("sendAnimation", get_params(locals()))
-        return from_json(response, type=Message)
+        return await self.api.request(
+            "sendAnimation", get_params(locals()), type=Message
+        )
 
     async def send_voice(
         self,
@@ -498,8 +497,7 @@ class APIMethods:
         messages of up to 50 MB in size, this limit may be changed in the
         future.
         """
-        response = await self.api.request("sendVoice", get_params(locals()))
-        return from_json(response, type=Message)
+        return await self.api.request("sendVoice", get_params(locals()), type=Message)
 
     async def send_video_note(
         self,
@@ -527,8 +525,9 @@ class APIMethods:
         up to 1 minute long. Use this method to send video messages. On
         success, the sent Message is returned.
         """
-        response = await self.api.request("sendVideoNote", get_params(locals()))
-        return from_json(response, type=Message)
+        return await self.api.request(
+            "sendVideoNote", get_params(locals()), type=Message
+        )
 
     async def send_paid_media(
         self,
@@ -556,8 +555,9 @@ class APIMethods:
         Use this method to send paid media. On success, the sent Message is
         returned.
         """
-        response = await self.api.request("sendPaidMedia", get_params(locals()))
-        return from_json(response, type=Message)
+        return await self.api.request(
+            "sendPaidMedia", get_params(locals()), type=Message
+        )
 
     async def send_media_group(
         self,
@@ -580,8 +580,9 @@ class APIMethods:
         with messages of the same type. On success, an array of Messages that
         were sent is returned.
         """
-        response = await self.api.request("sendMediaGroup", get_params(locals()))
-        return from_json(response, type=list[Message])
+        return await self.api.request(
+            "sendMediaGroup", get_params(locals()), type=list[Message]
+        )
 
     async def send_location(
         self,
@@ -610,8 +611,9 @@ class APIMethods:
         Use this method to send point on the map. On success, the sent Message
         is returned.
         """
-        response = await self.api.request("sendLocation", get_params(locals()))
-        return from_json(response, type=Message)
+        return await self.api.request(
+            "sendLocation", get_params(locals()), type=Message
+        )
 
     async def send_venue(
         self,
@@ -642,8 +644,7 @@ class APIMethods:
         Use this method to send information about a venue. On success, the
         sent Message is returned.
         """
-        response = await self.api.request("sendVenue", get_params(locals()))
-        return from_json(response, type=Message)
+        return await self.api.request("sendVenue", get_params(locals()), type=Message)
 
     async def send_contact(
         self,
@@ -670,8 +671,7 @@ class APIMethods:
         Use this method to send phone contacts. On success, the sent Message
         is returned.
         """
-        response = await self.api.request("sendContact", get_params(locals()))
-        return from_json(response, type=Message)
+        return await self.api.request("sendContact", get_params(locals()), type=Message)
 
     async def send_poll(
         self,
@@ -708,8 +708,7 @@ class APIMethods:
         Use this method to send a native poll. On success, the sent Message is
         returned.
         """
-        response = await self.api.request("sendPoll", get_params(locals()))
-        return from_json(response, type=Message)
+        return await self.api.request("sendPoll", get_params(locals()), type=Message)
 
     async def send_dice(
         self,
@@ -733,8 +732,7 @@ class APIMethods:
         Use this method to send an animated emoji that will display a random
         value. On success, the sent Message is returned.
         """
-        response = await self.api.request("sendDice", get_params(locals()))
-        return from_json(response, type=Message)
+        return await self.api.request("sendDice", get_params(locals()), type=Message)
 
     async def send_chat_action(
         self,
@@ -768,8 +766,7 @@ class APIMethods:
         recommend using this method when a response from the bot will take a
         noticeable amount of time to arrive.
         """
-        response = await self.api.request("sendChatAction", get_params(locals()))
-        return from_json(response, type=bool)
+        return await self.api.request("sendChatAction", get_params(locals()), type=bool)
 
     async def set_message_reaction(
         self,
@@ -786,8 +783,9 @@ class APIMethods:
         available reactions as messages in the channel. Bots can't use paid
         reactions. Returns True on success.
         """
-        response = await self.api.request("setMessageReaction", get_params(locals()))
-        return from_json(response, type=bool)
+        return await self.api.request(
+            "setMessageReaction", get_params(locals()), type=bool
+        )
 
     async def get_user_profile_photos(
         self,
@@ -800,8 +798,9 @@ class APIMethods:
         Use this method to get a list of profile pictures for a user. Returns
         a UserProfilePhotos object.
         """
-        response = await self.api.request("getUserProfilePhotos", get_params(locals()))
-        return from_json(response, type=UserProfilePhotos)
+        return await self.api.request(
+            "getUserProfilePhotos", get_params(locals()), type=UserProfilePhotos
+        )
 
     async def set_user_emoji_status(
         self,
@@ -815,8 +814,9 @@ class APIMethods:
         bot to manage their emoji status via the Mini App method
         requestEmojiStatusAccess. Returns True on success.
         """
-        response = await self.api.request("setUserEmojiStatus", get_params(locals()))
-        return from_json(response, type=bool)
+        return await self.api.request(
+            "setUserEmojiStatus", get_params(locals()), type=bool
+        )
 
     async def get_file(self, file_id: str, **kwargs) -> File:
         """
@@ -829,8 +829,7 @@ class APIMethods:
         will be valid for at least 1 hour. When the link expires, a new one
         can be requested by calling getFile again.
         """
-        response = await self.api.request("getFile", get_params(locals()))
-        return from_json(response, type=File)
+        return await self.api.request("getFile", get_params(locals()), type=File)
 
     async def ban_chat_member(
         self,
@@ -848,8 +847,7 @@ class APIMethods:
         to work and must have the appropriate administrator rights. Returns
         True on success.
         """
-        response = await self.api.request("banChatMember", get_params(locals()))
-        return from_json(response, type=bool)
+        return await self.api.request("banChatMember", get_params(locals()), type=bool)
 
     async def unban_chat_member(
         self,
@@ -868,8 +866,9 @@ class APIMethods:
         be removed from the chat. If you don't want this, use the parameter
         only_if_banned. Returns True on success.
         """
-        response = await self.api.request("unbanChatMember", get_params(locals()))
-        return from_json(response, type=bool)
+        return await self.api.request(
+            "unbanChatMember", get_params(locals()), type=bool
+        )
 
     async def restrict_chat_member(
         self,
@@ -886,8 +885,9 @@ class APIMethods:
         appropriate administrator rights. Pass True for all permissions to
         lift restrictions from a user. Returns True on success.
         """
-        response = await self.api.request("restrictChatMember", get_params(locals()))
-        return from_json(response, type=bool)
+        return await self.api.request(
+            "restrictChatMember", get_params(locals()), type=bool
+        )
 
     async def promote_chat_member(
         self,
@@ -916,8 +916,9 @@ class APIMethods:
         and must have the appropriate administrator rights. Pass False for all
         boolean parameters to demote a user. Returns True on success.
         """
-        response = await self.api.request("promoteChatMember", get_params(locals()))
-        return from_json(response, type=bool)
+        return await self.api.request(
+            "promoteChatMember", get_params(locals()), type=bool
+        )
 
     async def set_chat_administrator_custom_title(
         self, user_id: int, custom_title: str, chat_id: int | str, **kwargs
@@ -926,10 +927,9 @@ class APIMethods:
         Use this method to set a custom title for an administrator in a
         supergroup promoted by the bot. Returns True on success.
         """
-        response = await self.api.request(
-            "setChatAdministratorCustomTitle", get_params(locals())
+        return await self.api.request(
+            "setChatAdministratorCustomTitle", get_params(locals()), type=bool
         )
-        return from_json(response, type=bool)
 
     async def ban_chat_sender_chat(
         self, sender_chat_id: int, chat_id: int | str, **kwargs
@@ -942,8 +942,9 @@ class APIMethods:
         must have the appropriate administrator rights. Returns True on
         success.
         """
-        response = await self.api.request("banChatSenderChat", get_params(locals()))
-        return from_json(response, type=bool)
+        return await self.api.request(
+            "banChatSenderChat", get_params(locals()), type=bool
+        )
 
     async def unban_chat_sender_chat(
         self, sender_chat_id: int, chat_id: int | str, **kwargs
@@ -954,8 +955,9 @@ class APIMethods:
         work and must have the appropriate administrator rights. Returns True
         on success.
         """
-        response = await self.api.request("unbanChatSenderChat", get_params(locals()))
-        return from_json(response, type=bool)
+        return await self.api.request(
+            "unbanChatSenderChat", get_params(locals()), type=bool
+        )
 
     async def set_chat_permissions(
         self,
@@ -970,8 +972,9 @@ class APIMethods:
         work and must have the can_restrict_members administrator rights.
         Returns True on success.
         """
-        response = await self.api.request("setChatPermissions", get_params(locals()))
-        return from_json(response, type=bool)
+        return await self.api.request(
+            "setChatPermissions", get_params(locals()), type=bool
+        )
 
     async def export_chat_invite_link(self, chat_id: int | str, **kwargs) -> str:
         """
@@ -981,8 +984,9 @@ class APIMethods:
         appropriate administrator rights. Returns the new invite link as
         String on success.
         """
-        response = await self.api.request("exportChatInviteLink", get_params(locals()))
-        return from_json(response, type=str)
+        return await self.api.request(
+            "exportChatInviteLink", get_params(locals()), type=str
+        )
 
     async def create_chat_invite_link(
         self,
@@ -1000,8 +1004,9 @@ class APIMethods:
         using the method revokeChatInviteLink. Returns the new invite link as
         ChatInviteLink object.
         """
-        response = await self.api.request("createChatInviteLink", get_params(locals()))
-        return from_json(response, type=ChatInviteLink)
+        return await self.api.request(
+            "createChatInviteLink", get_params(locals()), type=ChatInviteLink
+        )
 
     async def edit_chat_invite_link(
         self,
@@ -1019,8 +1024,9 @@ class APIMethods:
         have the appropriate administrator rights. Returns the edited invite
         link as a ChatInviteLink object.
         """
-        response = await self.api.request("editChatInviteLink", get_params(locals()))
-        return from_json(response, type=ChatInviteLink)
+        return await self.api.request(
+            "editChatInviteLink", get_params(locals()), type=ChatInviteLink
+        )
 
     async def create_chat_subscription_invite_link(
         self,
@@ -1037,10 +1043,11 @@ class APIMethods:
         revoked using the method revokeChatInviteLink. Returns the new invite
         link as a ChatInviteLink object.
         """
-        response = await self.api.request(
-            "createChatSubscriptionInviteLink", get_params(locals())
+        return await self.api.request(
+            "createChatSubscriptionInviteLink",
+            get_params(locals()),
+            type=ChatInviteLink,
         )
-        return from_json(response, type=ChatInviteLink)
 
     async def edit_chat_subscription_invite_link(
         self, invite_link: str, chat_id: int | str, name: str | None = None, **kwargs
@@ -1050,10 +1057,9 @@ class APIMethods:
         The bot must have the can_invite_users administrator rights. Returns
         the edited invite link as a ChatInviteLink object.
         """
-        response = await self.api.request(
-            "editChatSubscriptionInviteLink", get_params(locals())
+        return await self.api.request(
+            "editChatSubscriptionInviteLink", get_params(locals()), type=ChatInviteLink
         )
-        return from_json(response, type=ChatInviteLink)
 
     async def revoke_chat_invite_link(
         self, invite_link: str, chat_id: int | str, **kwargs
@@ -1065,8 +1071,9 @@ class APIMethods:
         have the appropriate administrator rights. Returns the revoked invite
         link as ChatInviteLink object.
         """
-        response = await self.api.request("revokeChatInviteLink", get_params(locals()))
-        return from_json(response, type=ChatInviteLink)
+        return await self.api.request(
+            "revokeChatInviteLink", get_params(locals()), type=ChatInviteLink
+        )
 
     async def approve_chat_join_request(
         self, user_id: int, chat_id: int | str, **kwargs
@@ -1076,10 +1083,9 @@ class APIMethods:
         administrator in the chat for this to work and must have the
         can_invite_users administrator right. Returns True on success.
         """
-        response = await self.api.request(
-            "approveChatJoinRequest", get_params(locals())
+        return await self.api.request(
+            "approveChatJoinRequest", get_params(locals()), type=bool
         )
-        return from_json(response, type=bool)
 
     async def decline_chat_join_request(
         self, user_id: int, chat_id: int | str, **kwargs
@@ -1089,10 +1095,9 @@ class APIMethods:
         administrator in the chat for this to work and must have the
         can_invite_users administrator right. Returns True on success.
         """
-        response = await self.api.request(
-            "declineChatJoinRequest", get_params(locals())
+        return await self.api.request(
+            "declineChatJoinRequest", get_params(locals()), type=bool
         )
-        return from_json(response, type=bool)
 
     async def set_chat_photo(
         self, photo: InputFile, chat_id: int | str, **kwargs
@@ -1103,8 +1108,7 @@ class APIMethods:
         chat for this to work and must have the appropriate administrator
         rights. Returns True on success.
         """
-        response = await self.api.request("setChatPhoto", get_params(locals()))
-        return from_json(response, type=bool)
+        return await self.api.request("setChatPhoto", get_params(locals()), type=bool)
 
     async def delete_chat_photo(self, chat_id: int | str, **kwargs) -> bool:
         """
@@ -1113,8 +1117,9 @@ class APIMethods:
         to work and must have the appropriate administrator rights. Returns
         True on success.
         """
-        response = await self.api.request("deleteChatPhoto", get_params(locals()))
-        return from_json(response, type=bool)
+        return await self.api.request(
+            "deleteChatPhoto", get_params(locals()), type=bool
+        )
 
     async def set_chat_title(self, title: str, chat_id: int | str, **kwargs) -> bool:
         """
@@ -1123,8 +1128,7 @@ class APIMethods:
         this to work and must have the appropriate administrator rights.
         Returns True on success.
         """
-        response = await self.api.request("setChatTitle", get_params(locals()))
-        return from_json(response, type=bool)
+        return await self.api.request("setChatTitle", get_params(locals()), type=bool)
 
     async def set_chat_description(
         self, chat_id: int | str, description: str | None = None, **kwargs
@@ -1135,8 +1139,9 @@ class APIMethods:
         work and must have the appropriate administrator rights. Returns True
         on success.
         """
-        response = await self.api.request("setChatDescription", get_params(locals()))
-        return from_json(response, type=bool)
+        return await self.api.request(
+            "setChatDescription", get_params(locals()), type=bool
+        )
 
     async def pin_chat_message(
         self,
@@ -1154,8 +1159,7 @@ class APIMethods:
         'can_edit_messages' administrator right in a channel. Returns True on
         success.
         """
-        response = await self.api.request("pinChatMessage", get_params(locals()))
-        return from_json(response, type=bool)
+        return await self.api.request("pinChatMessage", get_params(locals()), type=bool)
 
     async def unpin_chat_message(
         self,
@@ -1172,8 +1176,9 @@ class APIMethods:
         'can_edit_messages' administrator right in a channel. Returns True on
         success.
         """
-        response = await self.api.request("unpinChatMessage", get_params(locals()))
-        return from_json(response, type=bool)
+        return await self.api.request(
+            "unpinChatMessage", get_params(locals()), type=bool
+        )
 
     async def unpin_all_chat_messages(self, chat_id: int | str, **kwargs) -> bool:
         """
@@ -1183,24 +1188,25 @@ class APIMethods:
         administrator right in a supergroup or 'can_edit_messages'
         administrator right in a channel. Returns True on success.
         """
-        response = await self.api.request("unpinAllChatMessages", get_params(locals()))
-        return from_json(response, type=bool)
+        return await self.api.request(
+            "unpinAllChatMessages", get_params(locals()), type=bool
+        )
 
     async def leave_chat(self, chat_id: int | str, **kwargs) -> bool:
         """
         Use this method for your bot to leave a group, supergroup or channel.
         Returns True on success.
         """
-        response = await self.api.request("leaveChat", get_params(locals()))
-        return from_json(response, type=bool)
+        return await self.api.request("leaveChat", get_params(locals()), type=bool)
 
     async def get_chat(self, chat_id: int | str, **kwargs) -> ChatFullInfo:
         """
         Use this method to get up-to-date information about the chat. Returns
         a ChatFullInfo object on success.
         """
-        response = await self.api.request("getChat", get_params(locals()))
-        return from_json(response, type=ChatFullInfo)
+        return await self.api.request(
+            "getChat", get_params(locals()), type=ChatFullInfo
+        )
 
     async def get_chat_administrators(
         self, chat_id: int | str, **kwargs
@@ -1209,16 +1215,18 @@ class APIMethods:
         Use this method to get a list of administrators in a chat, which
         aren't bots. Returns an Array of ChatMember objects.
         """
-        response = await self.api.request("getChatAdministrators", get_params(locals()))
-        return from_json(response, type=list[ChatMember])
+        return await self.api.request(
+            "getChatAdministrators", get_params(locals()), type=list[ChatMember]
+        )
 
     async def get_chat_member_count(self, chat_id: int | str, **kwargs) -> int:
         """
         Use this method to get the number of members in a chat. Returns Int on
         success.
         """
-        response = await self.api.request("getChatMemberCount", get_params(locals()))
-        return from_json(response, type=int)
+        return await self.api.request(
+            "getChatMemberCount", get_params(locals()), type=int
+        )
 
     async def get_chat_member(
         self, user_id: int, chat_id: int | str, **kwargs
@@ -1228,8 +1236,11 @@ class APIMethods:
         method is only guaranteed to work for other users if the bot is an
         administrator in the chat. Returns a ChatMember object on success.
         """
-        response = await self.api.request("getChatMember", get_params(locals()))
-        return from_json(response, type=ChatMember)  # type: ignore
+        return await self.api.request(
+            "getChatMember",
+            get_params(locals()),
+            type=ChatMember,  # type: ignore
+        )
 
     async def set_chat_sticker_set(
         self, sticker_set_name: str, chat_id: int | str, **kwargs
@@ -1241,8 +1252,9 @@ class APIMethods:
         can_set_sticker_set optionally returned in getChat requests to check
         if the bot can use this method. Returns True on success.
         """
-        response = await self.api.request("setChatStickerSet", get_params(locals()))
-        return from_json(response, type=bool)
+        return await self.api.request(
+            "setChatStickerSet", get_params(locals()), type=bool
+        )
 
     async def delete_chat_sticker_set(self, chat_id: int | str, **kwargs) -> bool:
         """
@@ -1252,8 +1264,9 @@ class APIMethods:
         can_set_sticker_set optionally returned in getChat requests to check
         if the bot can use this method. Returns True on success.
         """
-        response = await self.api.request("deleteChatStickerSet", get_params(locals()))
-        return from_json(response, type=bool)
+        return await self.api.request(
+            "deleteChatStickerSet", get_params(locals()), type=bool
+        )
 
     async def get_forum_topic_icon_stickers(self, **kwargs) -> list[Sticker]:
         """
@@ -1261,10 +1274,9 @@ class APIMethods:
         forum topic icon by any user. Requires no parameters. Returns an Array
         of Sticker objects.
         """
-        response = await self.api.request(
-            "getForumTopicIconStickers", get_params(locals())
+        return await self.api.request(
+            "getForumTopicIconStickers", get_params(locals()), type=list[Sticker]
         )
-        return from_json(response, type=list[Sticker])
 
     async def create_forum_topic(
         self,
@@ -1281,8 +1293,9 @@ class APIMethods:
         the can_manage_topics administrator rights. Returns information about
         the created topic as a ForumTopic object.
         """
-        response = await self.api.request("createForumTopic", get_params(locals()))
-        return from_json(response, type=ForumTopic)
+        return await self.api.request(
+            "createForumTopic", get_params(locals()), type=ForumTopic
+        )
 
     async def edit_forum_topic(
         self,
@@ -1298,8 +1311,7 @@ class APIMethods:
         and must have the can_manage_topics administrator rights, unless it is
         the creator of the topic. Returns True on success.
         """
-        response = await self.api.request("editForumTopic", get_params(locals()))
-        return from_json(response, type=bool)
+        return await self.api.request("editForumTopic", get_params(locals()), type=bool)
 
     async def close_forum_topic(
         self, message_thread_id: int, chat_id: int | str, **kwargs
@@ -1310,8 +1322,9 @@ class APIMethods:
         have the can_manage_topics administrator rights, unless it is the
         creator of the topic. Returns True on success.
         """
-        response = await self.api.request("closeForumTopic", get_params(locals()))
-        return from_json(response, type=bool)
+        return await self.api.request(
+            "closeForumTopic", get_params(locals()), type=bool
+        )
 
     async def reopen_forum_topic(
         self, message_thread_id: int, chat_id: int | str, **kwargs
@@ -1322,8 +1335,9 @@ class APIMethods:
         have the can_manage_topics administrator rights, unless it is the
         creator of the topic. Returns True on success.
         """
-        response = await self.api.request("reopenForumTopic", get_params(locals()))
-        return from_json(response, type=bool)
+        return await self.api.request(
+            "reopenForumTopic", get_params(locals()), type=bool
+        )
 
     async def delete_forum_topic(
         self, message_thread_id: int, chat_id: int | str, **kwargs
@@ -1334,8 +1348,9 @@ class APIMethods:
         for this to work and must have the can_delete_messages administrator
         rights. Returns True on success.
         """
-        response = await self.api.request("deleteForumTopic", get_params(locals()))
-        return from_json(response, type=bool)
+        return await self.api.request(
+            "deleteForumTopic", get_params(locals()), type=bool
+        )
 
     async def unpin_all_forum_topic_messages(
         self, message_thread_id: int, chat_id: int | str, **kwargs
@@ -1346,10 +1361,9 @@ class APIMethods:
         have the can_pin_messages administrator right in the supergroup.
         Returns True on success.
         """
-        response = await self.api.request(
-            "unpinAllForumTopicMessages", get_params(locals())
+        return await self.api.request(
+            "unpinAllForumTopicMessages", get_params(locals()), type=bool
         )
-        return from_json(response, type=bool)
 
     async def edit_general_forum_topic(
         self, name: str, chat_id: int | str, **kwargs
@@ -1360,8 +1374,9 @@ class APIMethods:
         to work and must have the can_manage_topics administrator rights.
         Returns True on success.
         """
-        response = await self.api.request("editGeneralForumTopic", get_params(locals()))
-        return from_json(response, type=bool)
+        return await self.api.request(
+            "editGeneralForumTopic", get_params(locals()), type=bool
+        )
 
     async def close_general_forum_topic(self, chat_id: int | str, **kwargs) -> bool:
         """
@@ -1370,10 +1385,9 @@ class APIMethods:
         and must have the can_manage_topics administrator rights. Returns True
         on success.
         """
-        response = await self.api.request(
-            "closeGeneralForumTopic", get_params(locals())
+        return await self.api.request(
+            "closeGeneralForumTopic", get_params(locals()), type=bool
         )
-        return from_json(response, type=bool)
 
     async def reopen_general_forum_topic(self, chat_id: int | str, **kwargs) -> bool:
         """
@@ -1383,10 +1397,9 @@ class APIMethods:
         topic will be automatically unhidden if it was hidden. Returns True on
         success.
         """
-        response = await self.api.request(
-            "reopenGeneralForumTopic", get_params(locals())
+        return await self.api.request(
+            "reopenGeneralForumTopic", get_params(locals()), type=bool
         )
-        return from_json(response, type=bool)
 
     async def hide_general_forum_topic(self, chat_id: int | str, **kwargs) -> bool:
         """
@@ -1395,8 +1408,9 @@ class APIMethods:
         and must have the can_manage_topics administrator rights. The topic
         will be automatically closed if it was open. Returns True on success.
         """
-        response = await self.api.request("hideGeneralForumTopic", get_params(locals()))
-        return from_json(response, type=bool)
+        return await self.api.request(
+            "hideGeneralForumTopic", get_params(locals()), type=bool
+        )
 
     async def unhide_general_forum_topic(self, chat_id: int | str, **kwargs) -> bool:
         """
@@ -1405,10 +1419,9 @@ class APIMethods:
         and must have the can_manage_topics administrator rights. Returns True
         on success.
         """
-        response = await self.api.request(
-            "unhideGeneralForumTopic", get_params(locals())
+        return await self.api.request(
+            "unhideGeneralForumTopic", get_params(locals()), type=bool
         )
-        return from_json(response, type=bool)
 
     async def unpin_all_general_forum_topic_messages(
         self, chat_id: int | str, **kwargs
@@ -1419,10 +1432,9 @@ class APIMethods:
         work and must have the can_pin_messages administrator right in the
         supergroup. Returns True on success.
         """
-        response = await self.api.request(
-            "unpinAllGeneralForumTopicMessages", get_params(locals())
+        return await self.api.request(
+            "unpinAllGeneralForumTopicMessages", get_params(locals()), type=bool
         )
-        return from_json(response, type=bool)
 
     async def answer_callback_query(
         self,
@@ -1443,8 +1455,9 @@ class APIMethods:
         links like t.me/your_bot?start=XXXX that open your bot with a
         parameter.
         """
-        response = await self.api.request("answerCallbackQuery", get_params(locals()))
-        return from_json(response, type=bool)
+        return await self.api.request(
+            "answerCallbackQuery", get_params(locals()), type=bool
+        )
 
     async def get_user_chat_boosts(
         self, user_id: int, chat_id: int | str, **kwargs
@@ -1454,8 +1467,9 @@ class APIMethods:
         Requires administrator rights in the chat. Returns a UserChatBoosts
         object.
         """
-        response = await self.api.request("getUserChatBoosts", get_params(locals()))
-        return from_json(response, type=UserChatBoosts)
+        return await self.api.request(
+            "getUserChatBoosts", get_params(locals()), type=UserChatBoosts
+        )
 
     async def get_business_connection(
         self, business_connection_id: str, **kwargs
@@ -1465,8 +1479,9 @@ class APIMethods:
         with a business account. Returns a BusinessConnection object on
         success.
         """
-        response = await self.api.request("getBusinessConnection", get_params(locals()))
-        return from_json(response, type=BusinessConnection)
+        return await self.api.request(
+            "getBusinessConnection", get_params(locals()), type=BusinessConnection
+        )
 
     async def set_my_commands(
         self,
@@ -1479,8 +1494,7 @@ class APIMethods:
         Use this method to change the list of the bot's commands. See this
         manual for more details about bot commands. Returns True on success.
         """
-        response = await self.api.request("setMyCommands", get_params(locals()))
-        return from_json(response, type=bool)
+        return await self.api.request("setMyCommands", get_params(locals()), type=bool)
 
     async def delete_my_commands(
         self,
@@ -1493,8 +1507,9 @@ class APIMethods:
         scope and user language. After deletion, higher level commands will be
         shown to affected users. Returns True on success.
         """
-        response = await self.api.request("deleteMyCommands", get_params(locals()))
-        return from_json(response, type=bool)
+        return await self.api.request(
+            "deleteMyCommands", get_params(locals()), type=bool
+        )
 
     async def get_my_commands(
         self,
@@ -1507,8 +1522,9 @@ class APIMethods:
         given scope and user language. Returns an Array of BotCommand objects.
         If commands aren't set, an empty list is returned.
         """
-        response = await self.api.request("getMyCommands", get_params(locals()))
-        return from_json(response, type=list[BotCommand])
+        return await self.api.request(
+            "getMyCommands", get_params(locals()), type=list[BotCommand]
+        )
 
     async def set_my_name(
         self, name: str | None = None, language_code: str | None = None, **kwargs
@@ -1516,16 +1532,14 @@ class APIMethods:
         """
         Use this method to change the bot's name. Returns True on success.
         """
-        response = await self.api.request("setMyName", get_params(locals()))
-        return from_json(response, type=bool)
+        return await self.api.request("setMyName", get_params(locals()), type=bool)
 
     async def get_my_name(self, language_code: str | None = None, **kwargs) -> BotName:
         """
         Use this method to get the current bot name for the given user
         language. Returns BotName on success.
         """
-        response = await self.api.request("getMyName", get_params(locals()))
-        return from_json(response, type=BotName)
+        return await self.api.request("getMyName", get_params(locals()), type=BotName)
 
     async def set_my_description(
         self, language_code: str | None = None, description: str | None = None, **kwargs
@@ -1534,8 +1548,9 @@ class APIMethods:
         Use this method to change the bot's description, which is shown in the
         chat with the bot if the chat is empty. Returns True on success.
         """
-        response = await self.api.request("setMyDescription", get_params(locals()))
-        return from_json(response, type=bool)
+        return await self.api.request(
+            "setMyDescription", get_params(locals()), type=bool
+        )
 
     async def get_my_description(
         self, language_code: str | None = None, **kwargs
@@ -1544,8 +1559,9 @@ class APIMethods:
         Use this method to get the current bot description for the given user
         language. Returns BotDescription on success.
         """
-        response = await self.api.request("getMyDescription", get_params(locals()))
-        return from_json(response, type=BotDescription)
+        return await self.api.request(
+            "getMyDescription", get_params(locals()), type=BotDescription
+        )
 
     async def set_my_short_description(
         self,
@@ -1558,8 +1574,9 @@ class APIMethods:
         on the bot's profile page and is sent together with the link when
         users share the bot. Returns True on success.
         """
-        response = await self.api.request("setMyShortDescription", get_params(locals()))
-        return from_json(response, type=bool)
+        return await self.api.request(
+            "setMyShortDescription", get_params(locals()), type=bool
+        )
 
     async def get_my_short_description(
         self, language_code: str | None = None, **kwargs
@@ -1568,8 +1585,9 @@ class APIMethods:
         Use this method to get the current bot short description for the given
         user language. Returns BotShortDescription on success.
         """
-        response = await self.api.request("getMyShortDescription", get_params(locals()))
-        return from_json(response, type=BotShortDescription)
+        return await self.api.request(
+            "getMyShortDescription", get_params(locals()), type=BotShortDescription
+        )
 
     async def set_chat_menu_button(
         self,
@@ -1581,8 +1599,9 @@ class APIMethods:
         Use this method to change the bot's menu button in a private chat, or
         the default menu button. Returns True on success.
         """
-        response = await self.api.request("setChatMenuButton", get_params(locals()))
-        return from_json(response, type=bool)
+        return await self.api.request(
+            "setChatMenuButton", get_params(locals()), type=bool
+        )
 
     async def get_chat_menu_button(
         self, chat_id: int | None = None, **kwargs
@@ -1592,8 +1611,11 @@ class APIMethods:
         private chat, or the default menu button. Returns MenuButton on
         success.
         """
-        response = await self.api.request("getChatMenuButton", get_params(locals()))
-        return from_json(response, type=MenuButton)  # type: ignore
+        return await self.api.request(
+            "getChatMenuButton",
+            get_params(locals()),
+            type=MenuButton,  # type: ignore
+        )
 
     async def set_my_default_administrator_rights(
         self,
@@ -1607,10 +1629,9 @@ class APIMethods:
         These rights will be suggested to users, but they are free to modify
         the list before adding the bot. Returns True on success.
         """
-        response = await self.api.request(
-            "setMyDefaultAdministratorRights", get_params(locals())
+        return await self.api.request(
+            "setMyDefaultAdministratorRights", get_params(locals()), type=bool
         )
-        return from_json(response, type=bool)
 
     async def get_my_default_administrator_rights(
         self, for_channels: bool | None = None, **kwargs
@@ -1619,10 +1640,11 @@ class APIMethods:
         Use this method to get the current default administrator rights of the
         bot. Returns ChatAdministratorRights on success.
         """
-        response = await self.api.request(
-            "getMyDefaultAdministratorRights", get_params(locals())
+        return await self.api.request(
+            "getMyDefaultAdministratorRights",
+            get_params(locals()),
+            type=ChatAdministratorRights,
         )
-        return from_json(response, type=ChatAdministratorRights)
 
     async def edit_message_text(
         self,
@@ -1644,8 +1666,11 @@ class APIMethods:
         were not sent by the bot and do not contain an inline keyboard can
         only be edited within 48 hours from the time they were sent.
         """
-        response = await self.api.request("editMessageText", get_params(locals()))
-        return from_json(response, type=Message | bool)  # type: ignore
+        return await self.api.request(
+            "editMessageText",
+            get_params(locals()),
+            type=Message | bool,  # type: ignore
+        )
 
     async def edit_message_caption(
         self,
@@ -1667,8 +1692,11 @@ class APIMethods:
         were not sent by the bot and do not contain an inline keyboard can
         only be edited within 48 hours from the time they were sent.
         """
-        response = await self.api.request("editMessageCaption", get_params(locals()))
-        return from_json(response, type=Message | bool)  # type: ignore
+        return await self.api.request(
+            "editMessageCaption",
+            get_params(locals()),
+            type=Message | bool,  # type: ignore
+        )
 
     async def edit_message_media(
         self,
@@ -1693,8 +1721,11 @@ class APIMethods:
         inline keyboard can only be edited within 48 hours from the time they
         were sent.
         """
-        response = await self.api.request("editMessageMedia", get_params(locals()))
-        return from_json(response, type=Message | bool)  # type: ignore
+        return await self.api.request(
+            "editMessageMedia",
+            get_params(locals()),
+            type=Message | bool,  # type: ignore
+        )
 
     async def edit_message_live_location(
         self,
@@ -1718,10 +1749,11 @@ class APIMethods:
         message is not an inline message, the edited Message is returned,
         otherwise True is returned.
         """
-        response = await self.api.request(
-            "editMessageLiveLocation", get_params(locals())
+        return await self.api.request(
+            "editMessageLiveLocation",
+            get_params(locals()),
+            type=Message | bool,  # type: ignore
         )
-        return from_json(response, type=Message | bool)  # type: ignore
 
     async def stop_message_live_location(
         self,
@@ -1737,10 +1769,11 @@ class APIMethods:
         live_period expires. On success, if the message is not an inline
         message, the edited Message is returned, otherwise True is returned.
         """
-        response = await self.api.request(
-            "stopMessageLiveLocation", get_params(locals())
+        return await self.api.request(
+            "stopMessageLiveLocation",
+            get_params(locals()),
+            type=Message | bool,  # type: ignore
         )
-        return from_json(response, type=Message | bool)  # type: ignore
 
     async def edit_message_reply_markup(
         self,
@@ -1758,10 +1791,11 @@ class APIMethods:
         were not sent by the bot and do not contain an inline keyboard can
         only be edited within 48 hours from the time they were sent.
         """
-        response = await self.api.request(
-            "editMessageReplyMarkup", get_params(locals())
+        return await self.api.request(
+            "editMessageReplyMarkup",
+            get_params(locals()),
+            type=Message | bool,  # type: ignore
         )
-        return from_json(response, type=Message | bool)  # type: ignore
 
     async def stop_poll(
         self,
@@ -1775,8 +1809,7 @@ class APIMethods:
         Use this method to stop a poll which was sent by the bot. On success,
         the stopped Poll is returned.
         """
-        response = await self.api.request("stopPoll", get_params(locals()))
-        return from_json(response, type=Poll)
+        return await self.api.request("stopPoll", get_params(locals()), type=Poll)
 
     async def delete_message(
         self, message_id: int, chat_id: int | str, **kwargs
@@ -1795,8 +1828,7 @@ class APIMethods:
         permission in a supergroup or a channel, it can delete any message
         there. Returns True on success.
         """
-        response = await self.api.request("deleteMessage", get_params(locals()))
-        return from_json(response, type=bool)
+        return await self.api.request("deleteMessage", get_params(locals()), type=bool)
 
     async def delete_messages(
         self, message_ids: list[int], chat_id: int | str, **kwargs
@@ -1806,16 +1838,16 @@ class APIMethods:
         the specified messages can't be found, they are skipped. Returns True
         on success.
         """
-        response = await self.api.request("deleteMessages", get_params(locals()))
-        return from_json(response, type=bool)
+        return await self.api.request("deleteMessages", get_params(locals()), type=bool)
 
     async def get_available_gifts(self, **kwargs) -> Gifts:
         """
         Returns the list of gifts that can be sent by the bot to users and
         channel chats. Requires no parameters. Returns a Gifts object.
         """
-        response = await self.api.request("getAvailableGifts", get_params(locals()))
-        return from_json(response, type=Gifts)
+        return await self.api.request(
+            "getAvailableGifts", get_params(locals()), type=Gifts
+        )
 
     async def send_gift(
         self,
@@ -1832,8 +1864,7 @@ class APIMethods:
         Sends a gift to the given user or channel chat. The gift can't be
         converted to Telegram Stars by the receiver. Returns True on success.
         """
-        response = await self.api.request("sendGift", get_params(locals()))
-        return from_json(response, type=bool)
+        return await self.api.request("sendGift", get_params(locals()), type=bool)
 
     async def gift_premium_subscription(
         self,
@@ -1849,10 +1880,9 @@ class APIMethods:
         Gifts a Telegram Premium subscription to the given user. Returns True
         on success.
         """
-        response = await self.api.request(
-            "giftPremiumSubscription", get_params(locals())
+        return await self.api.request(
+            "giftPremiumSubscription", get_params(locals()), type=bool
         )
-        return from_json(response, type=bool)
 
     async def verify_user(
         self, user_id: int, custom_description: str | None = None, **kwargs
@@ -1861,8 +1891,7 @@ class APIMethods:
         Verifies a user on behalf of the organization which is represented by
         the bot. Returns True on success.
         """
-        response = await self.api.request("verifyUser", get_params(locals()))
-        return from_json(response, type=bool)
+        return await self.api.request("verifyUser", get_params(locals()), type=bool)
 
     async def verify_chat(
         self, chat_id: int | str, custom_description: str | None = None, **kwargs
@@ -1871,28 +1900,25 @@ class APIMethods:
         Verifies a chat on behalf of the organization which is represented by
         the bot. Returns True on success.
         """
-        response = await self.api.request("verifyChat", get_params(locals()))
-        return from_json(response, type=bool)
+        return await self.api.request("verifyChat", get_params(locals()), type=bool)
 
     async def remove_user_verification(self, user_id: int, **kwargs) -> bool:
         """
         Removes verification from a user who is currently verified on behalf
         of the organization represented by the bot. Returns True on success.
         """
-        response = await self.api.request(
-            "removeUserVerification", get_params(locals())
+        return await self.api.request(
+            "removeUserVerification", get_params(locals()), type=bool
         )
-        return from_json(response, type=bool)
 
     async def remove_chat_verification(self, chat_id: int | str, **kwargs) -> bool:
         """
         Removes verification from a chat that is currently verified on behalf
         of the organization represented by the bot. Returns True on success.
         """
-        response = await self.api.request(
-            "removeChatVerification", get_params(locals())
+        return await self.api.request(
+            "removeChatVerification", get_params(locals()), type=bool
         )
-        return from_json(response, type=bool)
 
     async def read_business_message(
         self, message_id: int, chat_id: int, business_connection_id: str, **kwargs
@@ -1902,8 +1928,9 @@ class APIMethods:
         Requires the can_read_messages business bot right. Returns True on
         success.
         """
-        response = await self.api.request("readBusinessMessage", get_params(locals()))
-        return from_json(response, type=bool)
+        return await self.api.request(
+            "readBusinessMessage", get_params(locals()), type=bool
+        )
 
     async def delete_business_messages(
         self, message_ids: list[int], business_connection_id: str, **kwargs
@@ -1914,10 +1941,9 @@ class APIMethods:
         sent by the bot itself, or the can_delete_all_messages business bot
         right to delete any message. Returns True on success.
         """
-        response = await self.api.request(
-            "deleteBusinessMessages", get_params(locals())
+        return await self.api.request(
+            "deleteBusinessMessages", get_params(locals()), type=bool
         )
-        return from_json(response, type=bool)
 
     async def set_business_account_name(
         self,
@@ -1931,10 +1957,9 @@ class APIMethods:
         Requires the can_change_name business bot right. Returns True on
         success.
         """
-        response = await self.api.request(
-            "setBusinessAccountName", get_params(locals())
+        return await self.api.request(
+            "setBusinessAccountName", get_params(locals()), type=bool
         )
-        return from_json(response, type=bool)
 
     async def set_business_account_username(
         self, business_connection_id: str, username: str | None = None, **kwargs
@@ -1943,10 +1968,9 @@ class APIMethods:
         Changes the username of a managed business account. Requires the
         can_change_username business bot right. Returns True on success.
         """
-        response = await self.api.request(
-            "setBusinessAccountUsername", get_params(locals())
+        return await self.api.request(
+            "setBusinessAccountUsername", get_params(locals()), type=bool
         )
-        return from_json(response, type=bool)
 
     async def set_business_account_bio(
         self, business_connection_id: str, bio: str | None = None, **kwargs
@@ -1955,8 +1979,9 @@ class APIMethods:
         Changes the bio of a managed business account. Requires the
         can_change_bio business bot right. Returns True on success.
         """
-        response = await self.api.request("setBusinessAccountBio", get_params(locals()))
-        return from_json(response, type=bool)
+        return await self.api.request(
+            "setBusinessAccountBio", get_params(locals()), type=bool
+        )
 
     async def set_business_account_profile_photo(
         self,
@@ -1969,10 +1994,9 @@ class APIMethods:
         Changes the profile photo of a managed business account. Requires the
         can_edit_profile_photo business bot right. Returns True on success.
         """
-        response = await self.api.request(
-            "setBusinessAccountProfilePhoto", get_params(locals())
+        return await self.api.request(
+            "setBusinessAccountProfilePhoto", get_params(locals()), type=bool
         )
-        return from_json(response, type=bool)
 
     async def remove_business_account_profile_photo(
         self, business_connection_id: str, is_public: bool | None = None, **kwargs
@@ -1982,10 +2006,9 @@ class APIMethods:
         Requires the can_edit_profile_photo business bot right. Returns True
         on success.
         """
-        response = await self.api.request(
-            "removeBusinessAccountProfilePhoto", get_params(locals())
+        return await self.api.request(
+            "removeBusinessAccountProfilePhoto", get_params(locals()), type=bool
         )
-        return from_json(response, type=bool)
 
     async def set_business_account_gift_settings(
         self,
@@ -1999,10 +2022,9 @@ class APIMethods:
         business account. Requires the can_change_gift_settings business bot
         right. Returns True on success.
         """
-        response = await self.api.request(
-            "setBusinessAccountGiftSettings", get_params(locals())
+        return await self.api.request(
+            "setBusinessAccountGiftSettings", get_params(locals()), type=bool
         )
-        return from_json(response, type=bool)
 
     async def get_business_account_star_balance(
         self, business_connection_id: str, **kwargs
@@ -2012,10 +2034,9 @@ class APIMethods:
         account. Requires the can_view_gifts_and_stars business bot right.
         Returns StarAmount on success.
         """
-        response = await self.api.request(
-            "getBusinessAccountStarBalance", get_params(locals())
+        return await self.api.request(
+            "getBusinessAccountStarBalance", get_params(locals()), type=StarAmount
         )
-        return from_json(response, type=StarAmount)
 
     async def transfer_business_account_stars(
         self, star_count: int, business_connection_id: str, **kwargs
@@ -2025,10 +2046,9 @@ class APIMethods:
         bot's balance. Requires the can_transfer_stars business bot right.
         Returns True on success.
         """
-        response = await self.api.request(
-            "transferBusinessAccountStars", get_params(locals())
+        return await self.api.request(
+            "transferBusinessAccountStars", get_params(locals()), type=bool
         )
-        return from_json(response, type=bool)
 
     async def get_business_account_gifts(
         self,
@@ -2048,10 +2068,9 @@ class APIMethods:
         Requires the can_view_gifts_and_stars business bot right. Returns
         OwnedGifts on success.
         """
-        response = await self.api.request(
-            "getBusinessAccountGifts", get_params(locals())
+        return await self.api.request(
+            "getBusinessAccountGifts", get_params(locals()), type=OwnedGifts
         )
-        return from_json(response, type=OwnedGifts)
 
     async def convert_gift_to_stars(
         self, owned_gift_id: str, business_connection_id: str, **kwargs
@@ -2061,8 +2080,9 @@ class APIMethods:
         can_convert_gifts_to_stars business bot right. Returns True on
         success.
         """
-        response = await self.api.request("convertGiftToStars", get_params(locals()))
-        return from_json(response, type=bool)
+        return await self.api.request(
+            "convertGiftToStars", get_params(locals()), type=bool
+        )
 
     async def upgrade_gift(
         self,
@@ -2078,8 +2098,7 @@ class APIMethods:
         requires the can_transfer_stars business bot right if the upgrade is
         paid. Returns True on success.
         """
-        response = await self.api.request("upgradeGift", get_params(locals()))
-        return from_json(response, type=bool)
+        return await self.api.request("upgradeGift", get_params(locals()), type=bool)
 
     async def transfer_gift(
         self,
@@ -2095,8 +2114,7 @@ class APIMethods:
         can_transfer_stars business bot right if the transfer is paid. Returns
         True on success.
         """
-        response = await self.api.request("transferGift", get_params(locals()))
-        return from_json(response, type=bool)
+        return await self.api.request("transferGift", get_params(locals()), type=bool)
 
     async def post_story(
         self,
@@ -2115,8 +2133,7 @@ class APIMethods:
         Posts a story on behalf of a managed business account. Requires the
         can_manage_stories business bot right. Returns Story on success.
         """
-        response = await self.api.request("postStory", get_params(locals()))
-        return from_json(response, type=Story)
+        return await self.api.request("postStory", get_params(locals()), type=Story)
 
     async def edit_story(
         self,
@@ -2134,8 +2151,7 @@ class APIMethods:
         business account. Requires the can_manage_stories business bot right.
         Returns Story on success.
         """
-        response = await self.api.request("editStory", get_params(locals()))
-        return from_json(response, type=Story)
+        return await self.api.request("editStory", get_params(locals()), type=Story)
 
     async def delete_story(
         self, story_id: int, business_connection_id: str, **kwargs
@@ -2145,8 +2161,7 @@ class APIMethods:
         business account. Requires the can_manage_stories business bot right.
         Returns True on success.
         """
-        response = await self.api.request("deleteStory", get_params(locals()))
-        return from_json(response, type=bool)
+        return await self.api.request("deleteStory", get_params(locals()), type=bool)
 
     async def send_sticker(
         self,
@@ -2171,16 +2186,16 @@ class APIMethods:
         Use this method to send static .WEBP, animated .TGS, or video .WEBM
         stickers. On success, the sent Message is returned.
         """
-        response = await self.api.request("sendSticker", get_params(locals()))
-        return from_json(response, type=Message)
+        return await self.api.request("sendSticker", get_params(locals()), type=Message)
 
     async def get_sticker_set(self, name: str, **kwargs) -> StickerSet:
         """
         Use this method to get a sticker set. On success, a StickerSet object
         is returned.
         """
-        response = await self.api.request("getStickerSet", get_params(locals()))
-        return from_json(response, type=StickerSet)
+        return await self.api.request(
+            "getStickerSet", get_params(locals()), type=StickerSet
+        )
 
     async def get_custom_emoji_stickers(
         self, custom_emoji_ids: list[str], **kwargs
@@ -2189,10 +2204,9 @@ class APIMethods:
         Use this method to get information about custom emoji stickers by
         their identifiers. Returns an Array of Sticker objects.
         """
-        response = await self.api.request(
-            "getCustomEmojiStickers", get_params(locals())
+        return await self.api.request(
+            "getCustomEmojiStickers", get_params(locals()), type=list[Sticker]
         )
-        return from_json(response, type=list[Sticker])
 
     async def upload_sticker_file(
         self,
@@ -2207,8 +2221,9 @@ class APIMethods:
         (the file can be used multiple times). Returns the uploaded File on
         success.
         """
-        response = await self.api.request("uploadStickerFile", get_params(locals()))
-        return from_json(response, type=File)
+        return await self.api.request(
+            "uploadStickerFile", get_params(locals()), type=File
+        )
 
     async def create_new_sticker_set(
         self,
@@ -2225,8 +2240,9 @@ class APIMethods:
         will be able to edit the sticker set thus created. Returns True on
         success.
         """
-        response = await self.api.request("createNewStickerSet", get_params(locals()))
-        return from_json(response, type=bool)
+        return await self.api.request(
+            "createNewStickerSet", get_params(locals()), type=bool
+        )
 
     async def add_sticker_to_set(
         self, user_id: int, sticker: InputSticker, name: str, **kwargs
@@ -2236,8 +2252,9 @@ class APIMethods:
         Emoji sticker sets can have up to 200 stickers. Other sticker sets can
         have up to 120 stickers. Returns True on success.
         """
-        response = await self.api.request("addStickerToSet", get_params(locals()))
-        return from_json(response, type=bool)
+        return await self.api.request(
+            "addStickerToSet", get_params(locals()), type=bool
+        )
 
     async def set_sticker_position_in_set(
         self, sticker: str, position: int, **kwargs
@@ -2246,18 +2263,18 @@ class APIMethods:
         Use this method to move a sticker in a set created by the bot to a
         specific position. Returns True on success.
         """
-        response = await self.api.request(
-            "setStickerPositionInSet", get_params(locals())
+        return await self.api.request(
+            "setStickerPositionInSet", get_params(locals()), type=bool
         )
-        return from_json(response, type=bool)
 
     async def delete_sticker_from_set(self, sticker: str, **kwargs) -> bool:
         """
         Use this method to delete a sticker from a set created by the bot.
         Returns True on success.
         """
-        response = await self.api.request("deleteStickerFromSet", get_params(locals()))
-        return from_json(response, type=bool)
+        return await self.api.request(
+            "deleteStickerFromSet", get_params(locals()), type=bool
+        )
 
     async def replace_sticker_in_set(
         self, user_id: int, sticker: InputSticker, old_sticker: str, name: str, **kwargs
@@ -2268,8 +2285,9 @@ class APIMethods:
         then addStickerToSet, then setStickerPositionInSet. Returns True on
         success.
         """
-        response = await self.api.request("replaceStickerInSet", get_params(locals()))
-        return from_json(response, type=bool)
+        return await self.api.request(
+            "replaceStickerInSet", get_params(locals()), type=bool
+        )
 
     async def set_sticker_emoji_list(
         self, sticker: str, emoji_list: list[str], **kwargs
@@ -2279,8 +2297,9 @@ class APIMethods:
         custom emoji sticker. The sticker must belong to a sticker set created
         by the bot. Returns True on success.
         """
-        response = await self.api.request("setStickerEmojiList", get_params(locals()))
-        return from_json(response, type=bool)
+        return await self.api.request(
+            "setStickerEmojiList", get_params(locals()), type=bool
+        )
 
     async def set_sticker_keywords(
         self, sticker: str, keywords: list[str] | None = None, **kwargs
@@ -2290,8 +2309,9 @@ class APIMethods:
         custom emoji sticker. The sticker must belong to a sticker set created
         by the bot. Returns True on success.
         """
-        response = await self.api.request("setStickerKeywords", get_params(locals()))
-        return from_json(response, type=bool)
+        return await self.api.request(
+            "setStickerKeywords", get_params(locals()), type=bool
+        )
 
     async def set_sticker_mask_position(
         self, sticker: str, mask_position: MaskPosition | None = None, **kwargs
@@ -2301,18 +2321,18 @@ class APIMethods:
         sticker must belong to a sticker set that was created by the bot.
         Returns True on success.
         """
-        response = await self.api.request(
-            "setStickerMaskPosition", get_params(locals())
+        return await self.api.request(
+            "setStickerMaskPosition", get_params(locals()), type=bool
         )
-        return from_json(response, type=bool)
 
     async def set_sticker_set_title(self, title: str, name: str, **kwargs) -> bool:
         """
         Use this method to set the title of a created sticker set. Returns
         True on success.
         """
-        response = await self.api.request("setStickerSetTitle", get_params(locals()))
-        return from_json(response, type=bool)
+        return await self.api.request(
+            "setStickerSetTitle", get_params(locals()), type=bool
+        )
 
     async def set_sticker_set_thumbnail(
         self,
@@ -2327,10 +2347,9 @@ class APIMethods:
         The format of the thumbnail file must match the format of the stickers
         in the set. Returns True on success.
         """
-        response = await self.api.request(
-            "setStickerSetThumbnail", get_params(locals())
+        return await self.api.request(
+            "setStickerSetThumbnail", get_params(locals()), type=bool
         )
-        return from_json(response, type=bool)
 
     async def set_custom_emoji_sticker_set_thumbnail(
         self, name: str, custom_emoji_id: str | None = None, **kwargs
@@ -2339,18 +2358,18 @@ class APIMethods:
         Use this method to set the thumbnail of a custom emoji sticker set.
         Returns True on success.
         """
-        response = await self.api.request(
-            "setCustomEmojiStickerSetThumbnail", get_params(locals())
+        return await self.api.request(
+            "setCustomEmojiStickerSetThumbnail", get_params(locals()), type=bool
         )
-        return from_json(response, type=bool)
 
     async def delete_sticker_set(self, name: str, **kwargs) -> bool:
         """
         Use this method to delete a sticker set that was created by the bot.
         Returns True on success.
         """
-        response = await self.api.request("deleteStickerSet", get_params(locals()))
-        return from_json(response, type=bool)
+        return await self.api.request(
+            "deleteStickerSet", get_params(locals()), type=bool
+        )
 
     async def answer_inline_query(
         self,
@@ -2366,8 +2385,9 @@ class APIMethods:
         Use this method to send answers to an inline query. On success, True
         is returned. No more than 50 results per query are allowed.
         """
-        response = await self.api.request("answerInlineQuery", get_params(locals()))
-        return from_json(response, type=bool)
+        return await self.api.request(
+            "answerInlineQuery", get_params(locals()), type=bool
+        )
 
     async def answer_web_app_query(
         self, web_app_query_id: str, result: InlineQueryResult, **kwargs
@@ -2378,8 +2398,9 @@ class APIMethods:
         which the query originated. On success, a SentWebAppMessage object is
         returned.
         """
-        response = await self.api.request("answerWebAppQuery", get_params(locals()))
-        return from_json(response, type=SentWebAppMessage)
+        return await self.api.request(
+            "answerWebAppQuery", get_params(locals()), type=SentWebAppMessage
+        )
 
     async def save_prepared_inline_message(
         self,
@@ -2395,10 +2416,11 @@ class APIMethods:
         Stores a message that can be sent by a user of a Mini App. Returns a
         PreparedInlineMessage object.
         """
-        response = await self.api.request(
-            "savePreparedInlineMessage", get_params(locals())
+        return await self.api.request(
+            "savePreparedInlineMessage",
+            get_params(locals()),
+            type=PreparedInlineMessage,
         )
-        return from_json(response, type=PreparedInlineMessage)
 
     async def send_invoice(
         self,
@@ -2437,8 +2459,7 @@ class APIMethods:
         Use this method to send invoices. On success, the sent Message is
         returned.
         """
-        response = await self.api.request("sendInvoice", get_params(locals()))
-        return from_json(response, type=Message)
+        return await self.api.request("sendInvoice", get_params(locals()), type=Message)
 
     async def create_invoice_link(
         self,
@@ -2470,8 +2491,9 @@ class APIMethods:
         Use this method to create a link for an invoice. Returns the created
         invoice link as String on success.
         """
-        response = await self.api.request("createInvoiceLink", get_params(locals()))
-        return from_json(response, type=str)
+        return await self.api.request(
+            "createInvoiceLink", get_params(locals()), type=str
+        )
 
     async def answer_shipping_query(
         self,
@@ -2487,8 +2509,9 @@ class APIMethods:
         shipping_query field to the bot. Use this method to reply to shipping
         queries. On success, True is returned.
         """
-        response = await self.api.request("answerShippingQuery", get_params(locals()))
-        return from_json(response, type=bool)
+        return await self.api.request(
+            "answerShippingQuery", get_params(locals()), type=bool
+        )
 
     async def answer_pre_checkout_query(
         self,
@@ -2505,10 +2528,9 @@ class APIMethods:
         receive an answer within 10 seconds after the pre-checkout query was
         sent.
         """
-        response = await self.api.request(
-            "answerPreCheckoutQuery", get_params(locals())
+        return await self.api.request(
+            "answerPreCheckoutQuery", get_params(locals()), type=bool
         )
-        return from_json(response, type=bool)
 
     async def get_star_transactions(
         self, offset: int | None = None, limit: int | None = None, **kwargs
@@ -2517,8 +2539,9 @@ class APIMethods:
         Returns the bot's Telegram Star transactions in chronological order.
         On success, returns a StarTransactions object.
         """
-        response = await self.api.request("getStarTransactions", get_params(locals()))
-        return from_json(response, type=StarTransactions)
+        return await self.api.request(
+            "getStarTransactions", get_params(locals()), type=StarTransactions
+        )
 
     async def refund_star_payment(
         self, user_id: int, telegram_payment_charge_id: str, **kwargs
@@ -2527,8 +2550,9 @@ class APIMethods:
         Refunds a successful payment in Telegram Stars. Returns True on
         success.
         """
-        response = await self.api.request("refundStarPayment", get_params(locals()))
-        return from_json(response, type=bool)
+        return await self.api.request(
+            "refundStarPayment", get_params(locals()), type=bool
+        )
 
     async def edit_user_star_subscription(
         self, user_id: int, telegram_payment_charge_id: str, is_canceled: bool, **kwargs
@@ -2537,10 +2561,9 @@ class APIMethods:
         Allows the bot to cancel or re-enable extension of a subscription paid
         in Telegram Stars. Returns True on success.
         """
-        response = await self.api.request(
-            "editUserStarSubscription", get_params(locals())
+        return await self.api.request(
+            "editUserStarSubscription", get_params(locals()), type=bool
         )
-        return from_json(response, type=bool)
 
     async def set_passport_data_errors(
         self, user_id: int, errors: list[PassportElementError], **kwargs
@@ -2556,8 +2579,9 @@ class APIMethods:
         shows evidence of tampering, etc. Supply some details in the error
         message to make sure the user knows how to correct the issues.
         """
-        response = await self.api.request("setPassportDataErrors", get_params(locals()))
-        return from_json(response, type=bool)
+        return await self.api.request(
+            "setPassportDataErrors", get_params(locals()), type=bool
+        )
 
     async def send_game(
         self,
@@ -2577,8 +2601,7 @@ class APIMethods:
         Use this method to send a game. On success, the sent Message is
         returned.
         """
-        response = await self.api.request("sendGame", get_params(locals()))
-        return from_json(response, type=Message)
+        return await self.api.request("sendGame", get_params(locals()), type=Message)
 
     async def set_game_score(
         self,
@@ -2598,8 +2621,11 @@ class APIMethods:
         the new score is not greater than the user's current score in the chat
         and force is False.
         """
-        response = await self.api.request("setGameScore", get_params(locals()))
-        return from_json(response, type=Message | bool)  # type: ignore
+        return await self.api.request(
+            "setGameScore",
+            get_params(locals()),
+            type=Message | bool,  # type: ignore
+        )
 
     async def get_game_high_scores(
         self,
@@ -2618,5 +2644,6 @@ class APIMethods:
         their neighbors are not among them. Please note that this behavior is
         subject to change.
         """
-        response = await self.api.request("getGameHighScores", get_params(locals()))
-        return from_json(response, type=list[GameHighScore])
+        return await self.api.request(
+            "getGameHighScores", get_params(locals()), type=list[GameHighScore]
+        )